@@ -0,0 +1,19 @@
+# Generated by Django 4.2.17 on 2026-10-18 19:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("age_timelines", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ageevent",
+            index=models.Index(
+                fields=["age_timeline", "start_year", "start_month"],
+                name="age_event_timeline_start_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("age_timelines", "0002_ageevent_age_event_timeline_start_idx"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="ageevent",
+            name="age_event_timeline_start_idx",
+        ),
+        migrations.AddIndex(
+            model_name="ageevent",
+            index=models.Index(
+                fields=[
+                    "age_timeline",
+                    "start_year",
+                    "start_month",
+                    "event_ptr",
+                ],
+                name="age_event_timeline_start_idx",
+            ),
+        ),
+    ]
@@ -44,6 +44,17 @@ class AgeEvent(timelines.Event):
 
     class Meta:
         ordering = ["start_year", "start_month"]
+        indexes = [
+            models.Index(
+                fields=[
+                    "age_timeline",
+                    "start_year",
+                    "start_month",
+                    "event_ptr",
+                ],
+                name="age_event_timeline_start_idx",
+            ),
+        ]
 
     def age_string(self, years, months):
         if months == 0:
@@ -1,4 +1,5 @@
-from age_timelines.models import AgeEvent, AgeTimeline
+from django.db.models import F
+from age_timelines.models import AgeTimeline
 from .age import Age
 from timelines.pdf.round import Round
 from timelines.pdf.scale_description import ScaleDescription, MM_PER_CM
@@ -13,14 +14,20 @@ class AgeTimelineScaleDescription(ScaleDescription):
     def __init__(self, age_timeline: AgeTimeline):
         ScaleDescription.__init__(self, age_timeline)
 
-        if self.timeline.ageevent_set.count() > 0:
-            self.start_age = self.__youngest_age()
+        bounds = self._get_time_bounds(
+            self.timeline.ageevent_set.all(),
+            F("start_year") * MONTHS_PER_YEAR + F("start_month"),
+            F("end_year") * MONTHS_PER_YEAR + F("end_month"),
+        )
+        if bounds is not None:
+            youngest_months, oldest_months = bounds
+            self.start_age = Age(*divmod(youngest_months, MONTHS_PER_YEAR))
             self.start_age.round_months(Round.DOWN)
             self.start_age.round_years(
                 self.timeline.scale_unit, Round.DOWN
             )
 
-            self.end_age = self.__oldest_age()
+            self.end_age = Age(*divmod(oldest_months, MONTHS_PER_YEAR))
             self.end_age.round_months(Round.UP)
             self.end_age.round_years(self.timeline.scale_unit, Round.UP)
         else:
@@ -30,24 +37,6 @@ class AgeTimelineScaleDescription(ScaleDescription):
         self.scale_units: int = self.__scale_units()
         self.scale_length: int = self.__scale_length()
 
-    def __youngest_age(self) -> Age:
-        """Finds the youngest age in age_timeline."""
-        first_age_event = self.timeline.ageevent_set.first()
-        return Age(first_age_event.start_year, first_age_event.start_month)
-
-    def __oldest_age(self) -> Age:
-        """Finds the oldest age in age_timeline."""
-        last_age_event: AgeEvent = self.timeline.ageevent_set.last()
-        oldest_age = Age(last_age_event.start_year, last_age_event.start_month)
-
-        for age_event in self.timeline.ageevent_set.all():
-            if age_event.has_end:
-                age = Age(age_event.end_year, age_event.end_month)
-                if age > oldest_age:
-                    oldest_age = age
-
-        return oldest_age
-
     def __scale_units(self) -> int:
         """Calculate number of scales units needed in timeline scale."""
         years: int = self.end_age.years - self.start_age.years
@@ -4,7 +4,9 @@ Classes:
     PDFAgeTimeline
 """
 
-from typing import List
+from typing import BinaryIO, Optional
+
+from django.db.models import QuerySet
 
 from reportlab.lib.units import mm
 
@@ -23,22 +25,41 @@ class PDFAgeTimeline(PDFTimeline):
         PDFTimeline
     """
 
-    def __init__(self, age_timeline: AgeTimeline):
+    def __init__(
+        self,
+        age_timeline: AgeTimeline,
+        parallel_layout: bool = False,
+        buffer: Optional[BinaryIO] = None,
+        incremental_layout: bool = False,
+    ):
         """Initializes instance.
 
         Args:
             age_timeline: An AgeTimeline to create the PDF of.
+            parallel_layout: A bool stating if the timeline's events should
+            be sized and positioned in a pool of worker processes.
+            buffer: A binary file to write the PDF to, or None to write it
+            to a new BytesIO.
+            incremental_layout: A bool stating if the timeline's events
+            should be positioned reusing where they were positioned the last
+            time it was drawn.
         """
-        PDFTimeline.__init__(self, age_timeline)
+        PDFTimeline.__init__(
+            self,
+            age_timeline,
+            parallel_layout,
+            buffer,
+            incremental_layout,
+        )
 
     def _create_scale_description(
         self, timeline: AgeTimeline
     ) -> AgeTimelineScaleDescription:
         return AgeTimelineScaleDescription(timeline)
 
-    def _get_events(self, event_area_id: int) -> List[AgeEvent]:
-        """Get AgeEvents linked to given EventArea in AgeTimeline."""
-        return AgeEvent.objects.filter(event_area=event_area_id)
+    def _get_timeline_events(self) -> QuerySet:
+        """Get all AgeEvents in AgeTimeline."""
+        return AgeEvent.objects.filter(age_timeline=self.timeline)
 
     def _get_event_start_time(self, event: AgeEvent) -> str:
         """Get string describing the time that an AgeEvent with start time
@@ -44,6 +44,7 @@ class AgeTimelineScaleDescriptionTest(TestCase):
             end_month=0,
         )
         self.scale_description = AgeTimelineScaleDescription(age_timeline)
+        self.age_timeline = age_timeline
 
         age_timeline_no_events = AgeTimeline.objects.create(
             user=user,
@@ -67,6 +68,22 @@ class AgeTimelineScaleDescriptionTest(TestCase):
         years = self.scale_description.end_age.years
         self.assertEqual(years, 25)
 
+    def test_one_query(self):
+        with self.assertNumQueries(1):
+            AgeTimelineScaleDescription(self.age_timeline)
+
+    def test_end_age_before_last_start(self):
+        AgeEvent.objects.create(
+            age_timeline=self.age_timeline,
+            timeline_id=self.age_timeline.timeline_ptr.pk,
+            title="Title",
+            start_year=26,
+            start_month=1,
+            has_end=False,
+        )
+        end_age = AgeTimelineScaleDescription(self.age_timeline).end_age
+        self.assertEqual(end_age.years, 30)
+
     def test_get_scale_units(self):
         scale_units = self.scale_description.get_scale_units()
         self.assertEqual(scale_units, 4)
@@ -25,6 +25,8 @@ class AgeTimelineUpdateViewTest(TestCase):
             "page_size": "4",
             "page_orientation": "L",
             "page_scale_position": 0,
+            "event_placement": "N",
+            "page_tiling": "S",
         }
 
     def test_view_url_exists_at_desired_location(self):
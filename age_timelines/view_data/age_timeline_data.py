@@ -15,8 +15,8 @@ class AgeTimelineData(TimelineData):
     ) -> AgeTimelineScaleDescription:
         return AgeTimelineScaleDescription(timeline)
 
-    def _get_events(self, event_area):
-        return AgeEvent.objects.filter(event_area=event_area.id)
+    def _get_timeline_events(self, timeline):
+        return AgeEvent.objects.filter(age_timeline=timeline)
 
     def _get_start_time_unit(self, event):
         return Age(event.start_year, event.start_month)
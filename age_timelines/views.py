@@ -3,7 +3,7 @@ import re
 
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import User
-from django.http import FileResponse, HttpResponseForbidden
+from django.http import HttpResponseForbidden
 from django.shortcuts import render
 from django.urls import reverse_lazy
 from django.utils import timezone
@@ -18,7 +18,9 @@ from timelines.ai_assist.event_choice import get_event_choices
 from timelines.forms import (
     AIRequestForm, AIResultsForm, NEW_CHOICE, NewCollaboratorForm
 )
-from timelines.mixins import RolePermissionMixin, RoleContextMixin
+from timelines.mixins import (
+    RolePermissionMixin, RoleContextMixin, UserRoleMixin,
+)
 from timelines.models import (
     Tag,
     EventArea,
@@ -28,8 +30,8 @@ from timelines.models import (
     ROLE_TIMELINE_EDITOR,
     ROLE_OWNER
 )
-from timelines.pdf.get_filename import get_filename
 from timelines.view_errors import event_area_position_error
+from timelines.views import timeline_pdf_response
 
 from .ai_assist.request_text import age_request_text
 from .models import AgeEvent, AgeTimeline
@@ -44,7 +46,9 @@ AGE_TIMELINE_FIELD_ORDER = [
     "scale_length",
     "page_orientation",
     "page_scale_position",
+    "event_placement",
     "page_size",
+    "page_tiling",
 ]
 
 
@@ -59,8 +63,7 @@ class AgeTimelineDetailView(
         context = super().get_context_data(**kwargs)
         context["now"] = timezone.now()
         timeline = self.get_object().get_timeline()
-        user_role = timeline.get_role(self.request.user)
-        context["user_role"] = user_role
+        context["user_role"] = self.get_user_role(timeline)
         return context
 
 
@@ -92,14 +95,12 @@ class AgeTimelineDeleteView(
     required_role = ROLE_OWNER
 
 
-class AgeTimelineRoleMixin(object):
+class AgeTimelineRoleMixin(UserRoleMixin):
     def dispatch(self, request, *args, **kwargs):
         age_timeline = AgeTimeline.objects.get(
             pk=self.kwargs["age_timeline_id"]
         )
-        user_role = (
-            age_timeline.get_role(self.request.user)
-        )
+        user_role = self.get_user_role(age_timeline)
         if user_role < self.required_role:
             return HttpResponseForbidden()
         return super(AgeTimelineRoleMixin, self).dispatch(
@@ -470,8 +471,7 @@ class LandscapeTimelineView(
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         timeline = self.get_object().get_timeline()
-        user_role = timeline.get_role(self.request.user)
-        context["user_role"] = user_role
+        context["user_role"] = self.get_user_role(timeline)
         context["timeline"] = AgeTimelineData(self.get_object())
 
         return context
@@ -487,8 +487,7 @@ class PortraitTimelineView(
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         timeline = self.get_object().get_timeline()
-        user_role = timeline.get_role(self.request.user)
-        context["user_role"] = user_role
+        context["user_role"] = self.get_user_role(timeline)
         context["timeline"] = AgeTimelineData(self.get_object())
 
         return context
@@ -501,12 +500,11 @@ def pdf_view(request, age_timeline_id):
     if user_role < ROLE_VIEWER:
         return HttpResponseForbidden()
 
-    timeline_pdf = PDFAgeTimeline(age_timeline)
-
-    return FileResponse(
-        timeline_pdf.buffer,
-        as_attachment=True,
-        filename=get_filename(age_timeline.title),
+    return timeline_pdf_response(
+        request,
+        age_timeline,
+        PDFAgeTimeline,
+        AgeEvent.objects.filter(age_timeline=age_timeline),
     )
 
 
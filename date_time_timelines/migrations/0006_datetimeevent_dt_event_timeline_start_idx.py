@@ -0,0 +1,22 @@
+# Generated by Django 4.2.17 on 2026-10-18 19:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "date_time_timelines",
+            "0005_alter_datetimeevent_end_date_time_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="datetimeevent",
+            index=models.Index(
+                fields=["date_time_timeline", "start_date_time"],
+                name="dt_event_timeline_start_idx",
+            ),
+        ),
+    ]
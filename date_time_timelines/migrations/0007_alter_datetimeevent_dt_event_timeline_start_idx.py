@@ -0,0 +1,30 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "date_time_timelines",
+            "0006_datetimeevent_dt_event_timeline_start_idx",
+        ),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="datetimeevent",
+            name="dt_event_timeline_start_idx",
+        ),
+        migrations.AddIndex(
+            model_name="datetimeevent",
+            index=models.Index(
+                fields=[
+                    "date_time_timeline",
+                    "start_date_time",
+                    "event_ptr",
+                ],
+                name="dt_event_timeline_start_idx",
+            ),
+        ),
+    ]
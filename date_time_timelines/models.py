@@ -183,6 +183,16 @@ class DateTimeEvent(timelines.Event):
 
     class Meta:
         ordering = ["start_date_time"]
+        indexes = [
+            models.Index(
+                fields=[
+                    "date_time_timeline",
+                    "start_date_time",
+                    "event_ptr",
+                ],
+                name="dt_event_timeline_start_idx",
+            ),
+        ]
 
     def start_description(self):
         return self.start_date_time.strftime(
@@ -1,4 +1,6 @@
-from typing import List
+from typing import BinaryIO, Optional
+
+from django.db.models import QuerySet
 
 from reportlab.lib.units import mm
 
@@ -31,13 +33,32 @@ class PDFDateTimeTimeline(PDFTimeline):
         PDFTimeline
     """
 
-    def __init__(self, date_time_timeline: DateTimeTimeline):
+    def __init__(
+        self,
+        date_time_timeline: DateTimeTimeline,
+        parallel_layout: bool = False,
+        buffer: Optional[BinaryIO] = None,
+        incremental_layout: bool = False,
+    ):
         """Initializes instance.
 
         Args:
             date_time_timeline: An DateTimeTimeline to create the PDF of.
+            parallel_layout: A bool stating if the timeline's events should
+            be sized and positioned in a pool of worker processes.
+            buffer: A binary file to write the PDF to, or None to write it
+            to a new BytesIO.
+            incremental_layout: A bool stating if the timeline's events
+            should be positioned reusing where they were positioned the last
+            time it was drawn.
         """
-        PDFTimeline.__init__(self, date_time_timeline)
+        PDFTimeline.__init__(
+            self,
+            date_time_timeline,
+            parallel_layout,
+            buffer,
+            incremental_layout,
+        )
 
     def _create_scale_description(
         self, timeline: DateTimeTimeline
@@ -51,9 +72,9 @@ class PDFDateTimeTimeline(PDFTimeline):
         else:
             return SecondsScaleDescription(timeline)
 
-    def _get_events(self, event_area_id: int) -> List[DateTimeEvent]:
-        """Get DateTimeEvents linked to given EventArea in DateTimeTimeline."""
-        return DateTimeEvent.objects.filter(event_area=event_area_id)
+    def _get_timeline_events(self) -> QuerySet:
+        """Get all DateTimeEvents in DateTimeTimeline."""
+        return DateTimeEvent.objects.filter(date_time_timeline=self.timeline)
 
     def _get_event_start_time(self, event: DateTimeEvent) -> str:
         """Get string describing the time that an AgeEvent with start time
@@ -1,5 +1,6 @@
 from datetime import datetime
-from date_time_timelines.models import DateTimeEvent, DateTimeTimeline
+from django.db.models import F
+from date_time_timelines.models import DateTimeTimeline
 from .date_time import DateTime
 from .datetime_utls import (
     get_month_completion,
@@ -32,14 +33,20 @@ class DateTimeScaleDescription(ScaleDescription):
         """
         ScaleDescription.__init__(self, date_time_timeline)
 
-        if self.timeline.datetimeevent_set.count() > 0:
-            self.start_date_time: DateTime = self.__first_date_time()
+        bounds = self._get_time_bounds(
+            self.timeline.datetimeevent_set.all(),
+            F("start_date_time"),
+            F("end_date_time"),
+        )
+        if bounds is not None:
+            first_date_time, last_date_time = bounds
+            self.start_date_time: DateTime = DateTime(first_date_time)
             self.start_date_time.date_time = self.round_datetime(
                 self.start_date_time.date_time,
                 self.timeline.scale_unit,
                 Round.DOWN
             )
-            self.end_date_time: DateTime = self.__last_date_time()
+            self.end_date_time: DateTime = DateTime(last_date_time)
             self.end_date_time.date_time = self.round_datetime(
                 self.end_date_time.date_time,
                 self.timeline.scale_unit,
@@ -52,24 +59,6 @@ class DateTimeScaleDescription(ScaleDescription):
         self.scale_units: int = self._scale_units()
         self.scale_length: int = self.__scale_length()
 
-    def __first_date_time(self) -> DateTime:
-        """Finds the first datetime linked to an event in timeline."""
-        first_event = self.timeline.datetimeevent_set.first()
-        return DateTime(first_event.start_date_time)
-
-    def __last_date_time(self) -> DateTime:
-        """Finds the last datetime linked to an event in timeline."""
-        last_event: DateTimeEvent = self.timeline.datetimeevent_set.last()
-        largest_date_time = DateTime(last_event.start_date_time)
-
-        for date_time_event in self.timeline.datetimeevent_set.all():
-            if date_time_event.has_end:
-                date_time = DateTime(date_time_event.end_date_time)
-                if date_time > largest_date_time:
-                    largest_date_time = date_time
-
-        return largest_date_time
-
     def __scale_length(self) -> int:
         """Calculate length of timeline scale in mm."""
         return self.scale_units * self.timeline.scale_length * MM_PER_CM
@@ -34,8 +34,10 @@ class DateTimeTimelineData(TimelineData):
         else:
             return SecondsScaleDescription(timeline)
 
-    def _get_events(self, event_area):
-        return DateTimeEvent.objects.filter(event_area=event_area.id)
+    def _get_timeline_events(self, timeline):
+        return DateTimeEvent.objects.filter(
+            date_time_timeline=timeline
+        ).select_related("date_time_timeline")
 
     def _get_start_time_unit(self, event):
         return DateTime(event.start_date_time)
@@ -3,7 +3,7 @@ import json
 
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import User
-from django.http import FileResponse, HttpResponseForbidden
+from django.http import HttpResponseForbidden
 from django.shortcuts import render
 from django.urls import reverse_lazy
 from django.utils import timezone
@@ -18,7 +18,9 @@ from timelines.ai_assist.request_text import role_text
 from timelines.forms import (
     NewCollaboratorForm, AIRequestForm, AIResultsForm, NEW_CHOICE
 )
-from timelines.mixins import RolePermissionMixin, RoleContextMixin
+from timelines.mixins import (
+    RolePermissionMixin, RoleContextMixin, UserRoleMixin,
+)
 from timelines.models import (
     Tag,
     EventArea,
@@ -28,8 +30,8 @@ from timelines.models import (
     ROLE_TIMELINE_EDITOR,
     ROLE_OWNER
 )
-from timelines.pdf.get_filename import get_filename
 from timelines.view_errors import event_area_position_error
+from timelines.views import timeline_pdf_response
 
 from .ai_assist.request_text import date_time_request_text
 from .models import DateTimeEvent, DateTimeTimeline
@@ -45,8 +47,10 @@ DATE_TIME_TIMELINE_FIELD_ORDER = [
     "scale_display_format",
     "page_orientation",
     "page_scale_position",
+    "event_placement",
     "event_display_format",
     "page_size",
+    "page_tiling",
 ]
 
 
@@ -61,8 +65,7 @@ class DateTimeTimelineDetailView(
         context = super().get_context_data(**kwargs)
         context["now"] = timezone.now()
         timeline = self.get_object().get_timeline()
-        user_role = timeline.get_role(self.request.user)
-        context["user_role"] = user_role
+        context["user_role"] = self.get_user_role(timeline)
         return context
 
 
@@ -94,14 +97,12 @@ class DateTimeTimelineDeleteView(
     required_role = ROLE_OWNER
 
 
-class DateTimeTimelineRoleMixin(object):
+class DateTimeTimelineRoleMixin(UserRoleMixin):
     def dispatch(self, request, *args, **kwargs):
         timeline = DateTimeTimeline.objects.get(
             pk=self.kwargs["date_time_timeline_id"]
         )
-        user_role = (
-            timeline.get_role(self.request.user)
-        )
+        user_role = self.get_user_role(timeline)
         if user_role < self.required_role:
             return HttpResponseForbidden()
         return super(DateTimeTimelineRoleMixin, self).dispatch(
@@ -459,8 +460,7 @@ class LandscapeTimelineView(
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         timeline = self.get_object().get_timeline()
-        user_role = timeline.get_role(self.request.user)
-        context["user_role"] = user_role
+        context["user_role"] = self.get_user_role(timeline)
         context["timeline"] = DateTimeTimelineData(self.get_object())
 
         return context
@@ -476,8 +476,7 @@ class PortraitTimelineView(
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         timeline = self.get_object().get_timeline()
-        user_role = timeline.get_role(self.request.user)
-        context["user_role"] = user_role
+        context["user_role"] = self.get_user_role(timeline)
         context["timeline"] = DateTimeTimelineData(self.get_object())
 
         return context
@@ -500,12 +499,11 @@ def pdf_view(request, date_time_timeline_id):
     if user_role < ROLE_VIEWER:
         return HttpResponseForbidden()
 
-    timeline_pdf = PDFDateTimeTimeline(timeline)
-
-    return FileResponse(
-        timeline_pdf.buffer,
-        as_attachment=True,
-        filename=get_filename(timeline.title),
+    return timeline_pdf_response(
+        request,
+        timeline,
+        PDFDateTimeTimeline,
+        DateTimeEvent.objects.filter(date_time_timeline=timeline),
     )
 
 
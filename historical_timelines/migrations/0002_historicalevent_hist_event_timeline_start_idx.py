@@ -0,0 +1,23 @@
+# Generated by Django 4.2.17 on 2026-10-18 19:30
+
+from django.db import migrations, models
+import django.db.models.expressions
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("historical_timelines", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="historicalevent",
+            index=models.Index(
+                models.F("historical_timeline"),
+                django.db.models.expressions.CombinedExpression(
+                    models.F("start_bc_ad"), "*", models.F("start_year")
+                ),
+                name="hist_event_timeline_start_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:41
+
+from django.db import migrations, models
+import django.db.models.expressions
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "historical_timelines",
+            "0002_historicalevent_hist_event_timeline_start_idx",
+        ),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="historicalevent",
+            name="hist_event_timeline_start_idx",
+        ),
+        migrations.AddIndex(
+            model_name="historicalevent",
+            index=models.Index(
+                models.F("historical_timeline"),
+                django.db.models.expressions.CombinedExpression(
+                    models.F("start_bc_ad"), "*", models.F("start_year")
+                ),
+                models.F("event_ptr"),
+                name="hist_event_timeline_start_idx",
+            ),
+        ),
+    ]
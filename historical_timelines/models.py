@@ -56,6 +56,14 @@ class HistoricalEvent(timelines.Event):
 
     class Meta:
         ordering = [F("start_bc_ad") * F("start_year")]
+        indexes = [
+            models.Index(
+                "historical_timeline",
+                F("start_bc_ad") * F("start_year"),
+                "event_ptr",
+                name="hist_event_timeline_start_idx",
+            ),
+        ]
 
     def start_description(self):
         return str(HistoricalYear(self.start_bc_ad * self.start_year))
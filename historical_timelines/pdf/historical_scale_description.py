@@ -1,4 +1,5 @@
-from historical_timelines.models import HistoricalEvent, HistoricalTimeline
+from django.db.models import F
+from historical_timelines.models import HistoricalTimeline
 from ..historical_year import HistoricalYear
 from timelines.pdf.round import Round
 from timelines.pdf.scale_description import ScaleDescription, MM_PER_CM
@@ -12,11 +13,17 @@ class HistoricalScaleDescription(ScaleDescription):
 
         self.scale_unit = self.timeline.scale_unit
 
-        if self.timeline.historicalevent_set.count() > 0:
-            self.start = self.__oldest_historical_year()
+        bounds = self._get_time_bounds(
+            self.timeline.historicalevent_set.all(),
+            F("start_bc_ad") * F("start_year"),
+            F("end_bc_ad") * F("end_year"),
+        )
+        if bounds is not None:
+            oldest_year, newest_year = bounds
+            self.start = HistoricalYear(oldest_year)
             self.start.round(self.timeline.scale_unit, Round.DOWN)
 
-            self.end = self.__newest_historical_year()
+            self.end = HistoricalYear(newest_year)
             self.end.round(self.timeline.scale_unit, Round.UP)
         else:
             self.start = HistoricalYear(-10)
@@ -25,24 +32,6 @@ class HistoricalScaleDescription(ScaleDescription):
         self.scale_units: int = self.__scale_units()
         self.scale_length: int = self.__scale_length()
 
-    def __oldest_historical_year(self) -> HistoricalYear:
-        """Finds the oldest historical year in historical_timeline."""
-        first_event = self.timeline.historicalevent_set.first()
-        return HistoricalYear(first_event.get_start())
-
-    def __newest_historical_year(self) -> HistoricalYear:
-        """Finds the latest historical year in historical_timeline."""
-        last_event: HistoricalEvent = self.timeline.historicalevent_set.last()
-        oldest = HistoricalYear(last_event.get_start())
-
-        for event in self.timeline.historicalevent_set.all():
-            if event.has_end:
-                historical_year = HistoricalYear(event.get_end())
-                if historical_year > oldest:
-                    oldest = historical_year
-
-        return oldest
-
     def __scale_units(self) -> int:
         """Calculate number of scales units needed in timeline scale."""
         years: int = self.end.year - self.start.year
@@ -4,7 +4,9 @@ Classes:
     PDFHistoricalTimeline
 """
 
-from typing import List
+from typing import BinaryIO, Optional
+
+from django.db.models import QuerySet
 
 from reportlab.lib.units import mm
 
@@ -23,23 +25,43 @@ class PDFHistoricalTimeline(PDFTimeline):
         PDFTimeline
     """
 
-    def __init__(self, historical_timeline: HistoricalTimeline):
+    def __init__(
+        self,
+        historical_timeline: HistoricalTimeline,
+        parallel_layout: bool = False,
+        buffer: Optional[BinaryIO] = None,
+        incremental_layout: bool = False,
+    ):
         """Initializes instance.
 
         Args:
             historical_timeline: An HistoricalTimeline to create the PDF of.
+            parallel_layout: A bool stating if the timeline's events should
+            be sized and positioned in a pool of worker processes.
+            buffer: A binary file to write the PDF to, or None to write it
+            to a new BytesIO.
+            incremental_layout: A bool stating if the timeline's events
+            should be positioned reusing where they were positioned the last
+            time it was drawn.
         """
-        PDFTimeline.__init__(self, historical_timeline)
+        PDFTimeline.__init__(
+            self,
+            historical_timeline,
+            parallel_layout,
+            buffer,
+            incremental_layout,
+        )
 
     def _create_scale_description(
         self, timeline: HistoricalTimeline
     ) -> HistoricalScaleDescription:
         return HistoricalScaleDescription(timeline)
 
-    def _get_events(self, event_area_id: int) -> List[HistoricalEvent]:
-        """Get HistoricalEvents linked to given EventArea in
-        HistoricalTimeline."""
-        return HistoricalEvent.objects.filter(event_area=event_area_id)
+    def _get_timeline_events(self) -> QuerySet:
+        """Get all HistoricalEvents in HistoricalTimeline."""
+        return HistoricalEvent.objects.filter(
+            historical_timeline=self.timeline
+        )
 
     def _get_event_start_time(self, event: HistoricalEvent) -> str:
         """Get string describing the time that an HistoricalEvent with start
@@ -46,6 +46,7 @@ class HistoricalTimelineScaleDescriptionTest(TestCase):
         self.scale_description = HistoricalScaleDescription(
             historical_timeline
         )
+        self.historical_timeline = historical_timeline
 
         historical_timeline_no_events = HistoricalTimeline.objects.create(
             user=user,
@@ -69,6 +70,27 @@ class HistoricalTimelineScaleDescriptionTest(TestCase):
         years = self.scale_description.end.year
         self.assertEqual(years, 25)
 
+    def test_one_query(self):
+        with self.assertNumQueries(1):
+            HistoricalScaleDescription(self.historical_timeline)
+
+    def test_start_end_bc(self):
+        HistoricalEvent.objects.create(
+            historical_timeline=self.historical_timeline,
+            timeline_id=self.historical_timeline.timeline_ptr.pk,
+            title="Title",
+            start_bc_ad=-1,
+            start_year=12,
+            has_end=True,
+            end_bc_ad=1,
+            end_year=3,
+        )
+        scale_description = HistoricalScaleDescription(
+            self.historical_timeline
+        )
+        self.assertEqual(scale_description.start.year, -15)
+        self.assertEqual(scale_description.end.year, 25)
+
     def test_get_scale_units(self):
         scale_units = self.scale_description.get_scale_units()
         self.assertEqual(scale_units, 4)
@@ -15,8 +15,8 @@ class HistoricalTimelineData(TimelineData):
     ) -> HistoricalScaleDescription:
         return HistoricalScaleDescription(timeline)
 
-    def _get_events(self, event_area):
-        return HistoricalEvent.objects.filter(event_area=event_area.id)
+    def _get_timeline_events(self, timeline):
+        return HistoricalEvent.objects.filter(historical_timeline=timeline)
 
     def _get_start_time_unit(self, event):
         return HistoricalYear(event.start_bc_ad * event.start_year)
@@ -1,6 +1,6 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import User
-from django.http import FileResponse, HttpResponseForbidden
+from django.http import HttpResponseForbidden
 from django.urls import reverse_lazy
 from django.views.generic.detail import DetailView
 from django.views.generic.edit import (
@@ -9,8 +9,10 @@ from django.views.generic.edit import (
 
 from timelines.forms import NewCollaboratorForm
 from timelines.view_errors import event_area_position_error
-from timelines.pdf.get_filename import get_filename
-from timelines.mixins import RolePermissionMixin, RoleContextMixin
+from timelines.views import timeline_pdf_response
+from timelines.mixins import (
+    RolePermissionMixin, RoleContextMixin, UserRoleMixin,
+)
 from timelines.models import (
     Tag,
     EventArea,
@@ -33,7 +35,9 @@ TIMELINE_FIELD_ORDER = [
     "scale_length",
     "page_orientation",
     "page_scale_position",
+    "event_placement",
     "page_size",
+    "page_tiling",
 ]
 
 
@@ -82,12 +86,12 @@ class TimelineDeleteView(
     required_role = ROLE_OWNER
 
 
-class TimelineRoleMixin(object):
+class TimelineRoleMixin(UserRoleMixin):
     def dispatch(self, request, *args, **kwargs):
         timeline = HistoricalTimeline.objects.get(
             pk=self.kwargs["historical_timeline_id"]
         )
-        user_role = timeline.get_role(self.request.user)
+        user_role = self.get_user_role(timeline)
         if user_role < self.required_role:
             return HttpResponseForbidden()
         return super(TimelineRoleMixin, self).dispatch(
@@ -446,8 +450,7 @@ class LandscapeTimelineView(
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         timeline = self.get_object().get_timeline()
-        user_role = timeline.get_role(self.request.user)
-        context["user_role"] = user_role
+        context["user_role"] = self.get_user_role(timeline)
         context["timeline"] = HistoricalTimelineData(self.get_object())
 
         return context
@@ -463,8 +466,7 @@ class PortraitTimelineView(
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         timeline = self.get_object().get_timeline()
-        user_role = timeline.get_role(self.request.user)
-        context["user_role"] = user_role
+        context["user_role"] = self.get_user_role(timeline)
         context["timeline"] = HistoricalTimelineData(self.get_object())
 
         return context
@@ -485,10 +487,11 @@ def pdf_view(request, historical_timeline_id):
     if user_role < ROLE_VIEWER:
         return HttpResponseForbidden()
 
-    timeline_pdf = PDFHistoricalTimeline(historical_timeline)
-
-    return FileResponse(
-        timeline_pdf.buffer,
-        as_attachment=True,
-        filename=get_filename(historical_timeline.title),
+    return timeline_pdf_response(
+        request,
+        historical_timeline,
+        PDFHistoricalTimeline,
+        HistoricalEvent.objects.filter(
+            historical_timeline=historical_timeline
+        ),
     )
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.17 on 2026-10-18 19:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("scientific_timelines", "0003_alter_scientifictimeline_scale_unit"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="scientificevent",
+            index=models.Index(
+                fields=[
+                    "scientific_timeline",
+                    "start_multiplier",
+                    "start_year_fraction",
+                ],
+                name="sci_event_timeline_start_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "scientific_timelines",
+            "0004_scientificevent_sci_event_timeline_start_idx",
+        ),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="scientificevent",
+            name="sci_event_timeline_start_idx",
+        ),
+        migrations.AddIndex(
+            model_name="scientificevent",
+            index=models.Index(
+                fields=[
+                    "scientific_timeline",
+                    "start_multiplier",
+                    "start_year_fraction",
+                    "event_ptr",
+                ],
+                name="sci_event_timeline_start_idx",
+            ),
+        ),
+    ]
@@ -55,6 +55,17 @@ class ScientificEvent(timelines.Event):
 
     class Meta:
         ordering = ["start_multiplier", "start_year_fraction"]
+        indexes = [
+            models.Index(
+                fields=[
+                    "scientific_timeline",
+                    "start_multiplier",
+                    "start_year_fraction",
+                    "event_ptr",
+                ],
+                name="sci_event_timeline_start_idx",
+            ),
+        ]
 
     def start_description(self):
         return str(
@@ -4,7 +4,9 @@ Classes:
     PDFScientificTimeline
 """
 
-from typing import List
+from typing import BinaryIO, Optional
+
+from django.db.models import QuerySet
 
 from reportlab.lib.units import mm
 
@@ -23,23 +25,43 @@ class PDFScientificTimeline(PDFTimeline):
         PDFTimeline
     """
 
-    def __init__(self, scientific_timeline: ScientificTimeline):
+    def __init__(
+        self,
+        scientific_timeline: ScientificTimeline,
+        parallel_layout: bool = False,
+        buffer: Optional[BinaryIO] = None,
+        incremental_layout: bool = False,
+    ):
         """Initializes instance.
 
         Args:
             scientific_timeline: An ScientificTimeline to create the PDF of.
+            parallel_layout: A bool stating if the timeline's events should
+            be sized and positioned in a pool of worker processes.
+            buffer: A binary file to write the PDF to, or None to write it
+            to a new BytesIO.
+            incremental_layout: A bool stating if the timeline's events
+            should be positioned reusing where they were positioned the last
+            time it was drawn.
         """
-        PDFTimeline.__init__(self, scientific_timeline)
+        PDFTimeline.__init__(
+            self,
+            scientific_timeline,
+            parallel_layout,
+            buffer,
+            incremental_layout,
+        )
 
     def _create_scale_description(
         self, timeline: ScientificTimeline
     ) -> ScientificScaleDescription:
         return ScientificScaleDescription(timeline)
 
-    def _get_events(self, event_area_id: int) -> List[ScientificEvent]:
-        """Get ScientificEvents linked to given EventArea in
-        ScientificTimeline."""
-        return ScientificEvent.objects.filter(event_area=event_area_id)
+    def _get_timeline_events(self) -> QuerySet:
+        """Get all ScientificEvents in ScientificTimeline."""
+        return ScientificEvent.objects.filter(
+            scientific_timeline=self.timeline
+        )
 
     def _get_event_start_time(self, event: ScientificEvent) -> str:
         """Get string describing the time that an ScientificEvent with start
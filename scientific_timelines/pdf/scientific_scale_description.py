@@ -1,4 +1,5 @@
-from scientific_timelines.models import ScientificEvent, ScientificTimeline
+from django.db.models import ExpressionWrapper, F, FloatField
+from scientific_timelines.models import ScientificTimeline
 from ..scientific_year import ScientificYear
 from timelines.pdf.round import Round
 from timelines.pdf.scale_description import ScaleDescription, MM_PER_CM
@@ -14,13 +15,24 @@ class ScientificScaleDescription(ScaleDescription):
             self.timeline.scale_unit
         )
 
-        if self.timeline.scientificevent_set.count() > 0:
-            self.start = self.__oldest_scientific_year()
-            self.start.change_multiplier(self.scale_unit.multiplier)
+        bounds = self._get_time_bounds(
+            self.timeline.scientificevent_set.all(),
+            ExpressionWrapper(
+                F("start_year_fraction") * F("start_multiplier"),
+                output_field=FloatField(),
+            ),
+            ExpressionWrapper(
+                F("end_year_fraction") * F("end_multiplier"),
+                output_field=FloatField(),
+            ),
+        )
+        if bounds is not None:
+            oldest_years, newest_years = bounds
+            multiplier = self.scale_unit.multiplier
+            self.start = ScientificYear(oldest_years / multiplier, multiplier)
             self.start.round(self.timeline.scale_unit, Round.DOWN)
 
-            self.end = self.__newest_scientific_year()
-            self.end.change_multiplier(self.scale_unit.multiplier)
+            self.end = ScientificYear(newest_years / multiplier, multiplier)
             self.end.round(self.timeline.scale_unit, Round.UP)
         else:
             self.start = ScientificYear(0, 1000)
@@ -37,30 +49,6 @@ class ScientificScaleDescription(ScaleDescription):
         else:
             return ScientificYear(scale_unit / 1000000000, 1000000000)
 
-    def __oldest_scientific_year(self) -> ScientificYear:
-        """Finds the youngest scientific year in scientific_timeline."""
-        first_event = self.timeline.scientificevent_set.first()
-        return ScientificYear(
-            first_event.start_year_fraction, first_event.start_multiplier
-        )
-
-    def __newest_scientific_year(self) -> ScientificYear:
-        """Finds the oldest scientific year in scientific_timeline."""
-        last_event: ScientificEvent = self.timeline.scientificevent_set.last()
-        oldest = ScientificYear(
-            last_event.start_year_fraction, last_event.start_multiplier
-        )
-
-        for event in self.timeline.scientificevent_set.all():
-            if event.has_end:
-                scientific_year = ScientificYear(
-                    event.end_year_fraction, event.end_multiplier
-                )
-                if scientific_year > oldest:
-                    oldest = scientific_year
-
-        return oldest
-
     def __scale_units(self) -> int:
         """Calculate number of scales units needed in timeline scale."""
         years: int = self.end.years() - self.start.years()
@@ -46,6 +46,7 @@ class ScientificTimelineScaleDescriptionTest(TestCase):
         self.scale_description = ScientificScaleDescription(
             scientific_timeline
         )
+        self.scientific_timeline = scientific_timeline
 
         scientific_timeline_no_events = ScientificTimeline.objects.create(
             user=user,
@@ -71,6 +72,23 @@ class ScientificTimelineScaleDescriptionTest(TestCase):
         self.assertEqual(end.fraction, 5)
         self.assertEqual(end.multiplier, 1000)
 
+    def test_one_query(self):
+        with self.assertNumQueries(1):
+            ScientificScaleDescription(self.scientific_timeline)
+
+    def test_start_different_multiplier(self):
+        ScientificEvent.objects.create(
+            scientific_timeline=self.scientific_timeline,
+            timeline_id=self.scientific_timeline.timeline_ptr.pk,
+            title="Title",
+            start_year_fraction=-0.003,
+            start_multiplier=1000000,
+            has_end=False,
+        )
+        start = ScientificScaleDescription(self.scientific_timeline).start
+        self.assertEqual(start.fraction, -3.0)
+        self.assertEqual(start.multiplier, 1000)
+
     def test_get_scale_units(self):
         scale_units = self.scale_description.get_scale_units()
         self.assertEqual(scale_units, 6)
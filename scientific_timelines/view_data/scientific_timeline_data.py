@@ -15,8 +15,8 @@ class ScientificTimelineData(TimelineData):
     ) -> ScientificScaleDescription:
         return ScientificScaleDescription(timeline)
 
-    def _get_events(self, event_area):
-        return ScientificEvent.objects.filter(event_area=event_area.id)
+    def _get_timeline_events(self, timeline):
+        return ScientificEvent.objects.filter(scientific_timeline=timeline)
 
     def _get_start_time_unit(self, event):
         return ScientificYear(
@@ -1,7 +1,7 @@
 
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.models import User
-from django.http import FileResponse, HttpResponseForbidden
+from django.http import HttpResponseForbidden
 from django.urls import reverse_lazy
 from django.views.generic.detail import DetailView
 from django.views.generic.edit import (
@@ -9,7 +9,9 @@ from django.views.generic.edit import (
 )
 
 from timelines.forms import NewCollaboratorForm
-from timelines.mixins import RolePermissionMixin, RoleContextMixin
+from timelines.mixins import (
+    RolePermissionMixin, RoleContextMixin, UserRoleMixin,
+)
 from timelines.models import (
     Tag,
     EventArea,
@@ -19,8 +21,8 @@ from timelines.models import (
     ROLE_TIMELINE_EDITOR,
     ROLE_OWNER
 )
-from timelines.pdf.get_filename import get_filename
 from timelines.view_errors import event_area_position_error
+from timelines.views import timeline_pdf_response
 
 from .models import ScientificEvent, ScientificTimeline
 from .pdf.pdf_scientific_timeline import PDFScientificTimeline
@@ -35,7 +37,9 @@ TIMELINE_FIELD_ORDER = [
     "page_size",
     "page_orientation",
     "page_scale_position",
+    "event_placement",
     "page_size",
+    "page_tiling",
 ]
 
 
@@ -80,14 +84,12 @@ class TimelineDeleteView(
     required_role = ROLE_OWNER
 
 
-class TimelineRoleMixin(object):
+class TimelineRoleMixin(UserRoleMixin):
     def dispatch(self, request, *args, **kwargs):
         timeline = ScientificTimeline.objects.get(
             pk=self.kwargs["scientific_timeline_id"]
         )
-        user_role = (
-            timeline.get_role(self.request.user)
-        )
+        user_role = self.get_user_role(timeline)
         if user_role < self.required_role:
             return HttpResponseForbidden()
         return super(TimelineRoleMixin, self).dispatch(
@@ -448,8 +450,7 @@ class LandscapeTimelineView(
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         timeline = self.get_object().get_timeline()
-        user_role = timeline.get_role(self.request.user)
-        context["user_role"] = user_role
+        context["user_role"] = self.get_user_role(timeline)
         context["timeline"] = ScientificTimelineData(self.get_object())
 
         return context
@@ -465,8 +466,7 @@ class PortraitTimelineView(
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         timeline = self.get_object().get_timeline()
-        user_role = timeline.get_role(self.request.user)
-        context["user_role"] = user_role
+        context["user_role"] = self.get_user_role(timeline)
         context["timeline"] = ScientificTimelineData(self.get_object())
 
         return context
@@ -481,10 +481,11 @@ def pdf_view(request, scientific_timeline_id):
     if user_role < ROLE_VIEWER:
         return HttpResponseForbidden()
 
-    timeline_pdf = PDFScientificTimeline(scientific_timeline)
-
-    return FileResponse(
-        timeline_pdf.buffer,
-        as_attachment=True,
-        filename=get_filename(scientific_timeline.title),
+    return timeline_pdf_response(
+        request,
+        scientific_timeline,
+        PDFScientificTimeline,
+        ScientificEvent.objects.filter(
+            scientific_timeline=scientific_timeline
+        ),
     )
@@ -0,0 +1,59 @@
+"""Contains function to load all the events of a timeline grouped by the
+event area they are in.
+
+Loading every event of a timeline at once takes the same number of queries
+however many event areas the timeline has, rather than one for each of
+them.
+
+Functions:
+    load_events_by_area
+
+Usage:
+    events_by_area = load_events_by_area(
+        DateTimeEvent.objects.filter(date_time_timeline=timeline)
+    )
+    for event in events_by_area.get(event_area.id, []):
+        print(event.title, Event.join_tag_names(event.display_tags))
+    unplaced_events = events_by_area.get(NO_EVENT_AREA, [])
+"""
+
+from typing import Dict, List, Optional
+
+from django.db.models import Prefetch, QuerySet
+
+from timelines.models import Event, Tag
+
+"""Key of the group of events that are not in an event area."""
+NO_EVENT_AREA = None
+
+
+def load_events_by_area(
+    events: QuerySet,
+) -> Dict[Optional[int], List[Event]]:
+    """Gets events in one ordered query, along with their displayed Tags,
+    in display_tags, and groups them by event area.
+
+    Args:
+        events: A QuerySet of the Event subclass specific to the type of
+        timeline, eg AgeEvents, usually all those of one timeline.
+
+    Returns:
+        A dict of lists of Events keyed on the id of their EventArea, each
+        in the QuerySet's order.  Events that are not in an EventArea are
+        under NO_EVENT_AREA.  EventAreas without Events have no key.
+    """
+    # ordered by the subclass's ordering alone, rather than first by event
+    # area, so the index on its timeline and ordering fields serves the
+    # query, grouping keeps each event area's events in that order
+    ordering = events.query.order_by or events.model._meta.ordering
+    events_by_area: Dict[Optional[int], List[Event]] = {}
+    for event in events.order_by(*ordering, "pk").prefetch_related(
+        Prefetch(
+            "tags",
+            queryset=Tag.objects.filter(display=True),
+            to_attr="display_tags",
+        )
+    ):
+        events_by_area.setdefault(event.event_area_id, []).append(event)
+
+    return events_by_area
@@ -0,0 +1,329 @@
+"""Contains management command to benchmark the queries used to view and draw
+timelines.
+
+Seeds timelines of every type with events, event areas, tags and
+collaborators inside a transaction, reports the EXPLAIN plan and timings of
+each query used to show one of them, then rolls the transaction back so
+the database is left as it was.
+
+Classes:
+    TimelineKind
+    Command
+
+Usage:
+    python manage.py benchmark_queries --timelines 50 --events 200
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from random import Random
+from typing import Callable, Dict, List, NamedTuple, Tuple, Type
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import QuerySet
+
+from age_timelines.models import AgeEvent, AgeTimeline
+from age_timelines.pdf.age_timeline_scale_description import (
+    AgeTimelineScaleDescription,
+)
+from date_time_timelines.models import DateTimeEvent, DateTimeTimeline, YEAR_1
+from date_time_timelines.pdf.years_scale_description import (
+    YearsScaleDescription,
+)
+from historical_timelines.models import HistoricalEvent, HistoricalTimeline
+from historical_timelines.pdf.historical_scale_description import (
+    HistoricalScaleDescription,
+)
+from scientific_timelines.models import ScientificEvent, ScientificTimeline
+from scientific_timelines.pdf.scientific_scale_description import (
+    ScientificScaleDescription,
+)
+from timelines.models import Collaborator, Event, EventArea, Tag, Timeline
+
+"""Seed for the random event times, so every run seeds the same data."""
+RANDOM_SEED = 0
+
+"""Username of the user owning the seeded timelines."""
+BENCHMARK_USERNAME = "benchmark-queries-owner"
+
+
+class TimelineKind(NamedTuple):
+    """A type of timeline to seed and benchmark.
+
+    Attributes:
+        name: A str naming the type of timeline.
+        timeline_model: The subclass of Timeline.
+        event_model: The subclass of Event.
+        timeline_field: A str holding the name of the Event's ForeignKey to
+        its Timeline.
+        get_event_fields: A function returning a dict of the time fields of
+        a new Event.
+        create_scale_description: A function creating a ScaleDescription
+        from the Timeline.
+    """
+
+    name: str
+    timeline_model: Type[Timeline]
+    event_model: Type[Event]
+    timeline_field: str
+    get_event_fields: Callable[[], Dict]
+    create_scale_description: Callable
+
+
+class Command(BaseCommand):
+    help = (
+        "Reports EXPLAIN plans and timings of the queries used to view and "
+        "draw timelines, against a seeded dataset that is rolled back "
+        "afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--timelines",
+            type=int,
+            default=20,
+            help="Number of timelines of each type to seed.",
+        )
+        parser.add_argument(
+            "--events",
+            type=int,
+            default=100,
+            help="Number of events in each timeline.",
+        )
+        parser.add_argument(
+            "--areas",
+            type=int,
+            default=4,
+            help="Number of event areas in each timeline.",
+        )
+        parser.add_argument(
+            "--tags",
+            type=int,
+            default=6,
+            help="Number of tags in each timeline.",
+        )
+        parser.add_argument(
+            "--collaborators",
+            type=int,
+            default=5,
+            help="Number of collaborators on each timeline.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Number of times each query is timed.",
+        )
+
+    def handle(self, *args, **options):
+        self.__repeat = options["repeat"]
+        self.__random = Random(RANDOM_SEED)
+
+        with transaction.atomic():
+            owner = User.objects.create_user(username=BENCHMARK_USERNAME)
+            collaborators = [
+                User.objects.create_user(
+                    username=f"{BENCHMARK_USERNAME}-{index}"
+                )
+                for index in range(options["collaborators"])
+            ]
+
+            for kind in self.__get_timeline_kinds():
+                self.stdout.write(f"Seeding {kind.name} timelines...")
+                timeline = None
+                for _ in range(options["timelines"]):
+                    timeline = self.__seed_timeline(
+                        kind, owner, collaborators, options
+                    )
+
+                # the last timeline seeded is benchmarked, so the indexes
+                # have to pick it out from all the others
+                self.__benchmark_timeline(kind, timeline, collaborators[-1])
+
+            transaction.set_rollback(True)
+
+    def __get_timeline_kinds(self) -> List[TimelineKind]:
+        """Get each type of timeline to seed and benchmark."""
+        return [
+            TimelineKind(
+                "date & time",
+                DateTimeTimeline,
+                DateTimeEvent,
+                "date_time_timeline",
+                self.__get_date_time_fields,
+                YearsScaleDescription,
+            ),
+            TimelineKind(
+                "age",
+                AgeTimeline,
+                AgeEvent,
+                "age_timeline",
+                self.__get_age_fields,
+                AgeTimelineScaleDescription,
+            ),
+            TimelineKind(
+                "historical",
+                HistoricalTimeline,
+                HistoricalEvent,
+                "historical_timeline",
+                self.__get_historical_fields,
+                HistoricalScaleDescription,
+            ),
+            TimelineKind(
+                "scientific",
+                ScientificTimeline,
+                ScientificEvent,
+                "scientific_timeline",
+                self.__get_scientific_fields,
+                ScientificScaleDescription,
+            ),
+        ]
+
+    def __get_date_time_fields(self) -> Dict:
+        start = datetime(2000, 1, 1, tzinfo=timezone.utc) + timedelta(
+            days=self.__random.randrange(3650)
+        )
+        return {
+            "start_date_time": start,
+            "end_date_time": start + timedelta(days=30),
+        }
+
+    def __get_age_fields(self) -> Dict:
+        start_year = self.__random.randrange(80)
+        return {
+            "start_year": start_year,
+            "start_month": self.__random.randrange(12),
+            "end_year": start_year + 2,
+            "end_month": self.__random.randrange(12),
+        }
+
+    def __get_historical_fields(self) -> Dict:
+        start = self.__random.randrange(-500, 1500) or 1
+        end = start + 20 if start + 20 != 0 else 1
+        return {
+            "start_bc_ad": -1 if start < 0 else 1,
+            "start_year": abs(start),
+            "end_bc_ad": -1 if end < 0 else 1,
+            "end_year": abs(end),
+        }
+
+    def __get_scientific_fields(self) -> Dict:
+        multiplier = self.__random.choice([1000, 1000000])
+        start = -self.__random.uniform(1, 500)
+        return {
+            "start_year_fraction": start,
+            "start_multiplier": multiplier,
+            "end_year_fraction": start + 0.5,
+            "end_multiplier": multiplier,
+        }
+
+    def __seed_timeline(
+        self,
+        kind: TimelineKind,
+        owner: User,
+        collaborators: List[User],
+        options: Dict,
+    ) -> Timeline:
+        """Create a timeline of one type along with its event areas, tags,
+        collaborators and events."""
+        timeline_fields = {"user": owner, "title": "Benchmark Timeline"}
+        if kind.timeline_model is DateTimeTimeline:
+            timeline_fields["scale_unit"] = YEAR_1
+        timeline = kind.timeline_model.objects.create(**timeline_fields)
+
+        event_areas = [
+            EventArea.objects.create(
+                timeline=timeline.timeline_ptr,
+                name=f"Area {index}",
+                page_position=index,
+            )
+            for index in range(options["areas"])
+        ]
+        tags = [
+            Tag.objects.create(
+                timeline=timeline.timeline_ptr,
+                name=f"Tag {index}",
+                display=index % 2 == 0,
+            )
+            for index in range(options["tags"])
+        ]
+        Collaborator.objects.bulk_create(
+            Collaborator(timeline=timeline.timeline_ptr, user=user)
+            for user in collaborators
+        )
+
+        for index in range(options["events"]):
+            event = kind.event_model.objects.create(
+                timeline_id=timeline.timeline_ptr.pk,
+                title=f"Event {index}",
+                event_area=event_areas[index % len(event_areas)]
+                if event_areas
+                else None,
+                has_end=index % 3 == 0,
+                **{kind.timeline_field: timeline},
+                **kind.get_event_fields(),
+            )
+            if tags:
+                event.tags.set(tags[:index % (len(tags) + 1)])
+
+        return timeline
+
+    def __benchmark_timeline(
+        self, kind: TimelineKind, timeline: Timeline, collaborator: User
+    ):
+        """Report the plans and timings of the queries used to view and draw
+        a timeline."""
+        events = kind.event_model.objects.filter(
+            **{kind.timeline_field: timeline}
+        )
+        event_area = timeline.eventarea_set.first()
+
+        queries: List[Tuple[str, QuerySet]] = [
+            (
+                f"{kind.name} events grouped by event area",
+                events.order_by(*kind.event_model._meta.ordering, "pk"),
+            ),
+            (
+                f"{kind.name} events in an event area",
+                events.filter(event_area=event_area),
+            ),
+            (
+                "displayed tags",
+                Tag.objects.filter(
+                    timeline=timeline.timeline_ptr, display=True
+                ),
+            ),
+            (
+                "collaborator role",
+                Collaborator.objects.filter(
+                    timeline=timeline.timeline_ptr, user=collaborator
+                ),
+            ),
+        ]
+        for label, query_set in queries:
+            self.__report(
+                label, lambda: list(query_set.all()), query_set.explain()
+            )
+
+        self.__report(
+            f"{kind.name} scale bounds",
+            lambda: kind.create_scale_description(timeline),
+        )
+
+    def __report(self, label: str, run: Callable, plan: str = ""):
+        """Time a query and write its timings and plan."""
+        timings = []
+        for _ in range(self.__repeat):
+            start = time.perf_counter()
+            run()
+            timings.append((time.perf_counter() - start) * 1000)
+
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(f"{label}: ")
+            + f"min {min(timings):.3f} ms, "
+            f"mean {sum(timings) / len(timings):.3f} ms"
+        )
+        for line in plan.splitlines():
+            self.stdout.write(f"    {line}")
@@ -0,0 +1,49 @@
+"""Contains management command to run the PDFJobs drawing timeline PDFs in
+the background.
+
+Polls the database for queued jobs and runs them one at a time, queuing
+again any job whose worker stopped while it was running.  Any number of
+these workers can run, on any server, as each job is only run by the first
+worker to start it.
+
+Classes:
+    Command
+
+Usage:
+    python manage.py run_pdf_jobs
+    python manage.py run_pdf_jobs --once
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from timelines.pdf.pdf_jobs import requeue_lost_pdf_jobs, run_next_pdf_job
+
+"""Seconds to wait before polling again when there are no queued jobs."""
+POLL_INTERVAL = 2
+
+
+class Command(BaseCommand):
+    help = "Runs the queued jobs drawing timeline PDFs in the background."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Stop once there are no queued jobs, rather than polling.",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            requeue_lost_pdf_jobs()
+            if run_next_pdf_job():
+                continue
+
+            if options["once"]:
+                break
+
+            time.sleep(POLL_INTERVAL)
+            # the database may have closed the connection while waiting
+            close_old_connections()
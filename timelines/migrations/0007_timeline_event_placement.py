@@ -0,0 +1,27 @@
+# Generated by Django 4.2.17 on 2026-10-18 18:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "timelines",
+            "0006_event_image_eventarea_display_event_description_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="timeline",
+            name="event_placement",
+            field=models.CharField(
+                choices=[
+                    ("N", "Nearest to scale position"),
+                    ("S", "Stacked in scale order"),
+                ],
+                default="N",
+                max_length=1,
+            ),
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.17 on 2026-10-18 19:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timelines", "0007_timeline_event_placement"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PDFJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("timeline_model", models.CharField(max_length=100)),
+                ("pdf_class", models.CharField(max_length=200)),
+                ("fingerprint", models.CharField(max_length=64)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("Q", "Queued"),
+                            ("R", "Running"),
+                            ("D", "Done"),
+                            ("F", "Failed"),
+                        ],
+                        default="Q",
+                        max_length=1,
+                    ),
+                ),
+                ("pdf_data", models.BinaryField(blank=True, null=True)),
+                ("error", models.CharField(blank=True, max_length=1000)),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("updated", models.DateTimeField(auto_now=True)),
+                (
+                    "timeline",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="timelines.timeline",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("timeline", "fingerprint")},
+            },
+        ),
+    ]
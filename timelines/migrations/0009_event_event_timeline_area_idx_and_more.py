@@ -0,0 +1,26 @@
+# Generated by Django 4.2.17 on 2026-10-18 19:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timelines", "0008_pdfjob"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="event",
+            index=models.Index(
+                fields=["timeline", "event_area"],
+                name="event_timeline_area_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tag",
+            index=models.Index(
+                fields=["timeline", "display", "name"],
+                name="tag_timeline_display_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.17 on 2026-10-18 20:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timelines", "0009_event_event_timeline_area_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="timeline",
+            name="page_tiling",
+            field=models.CharField(
+                choices=[("S", "Single page"), ("T", "Tiled pages")],
+                default="S",
+                max_length=1,
+            ),
+        ),
+    ]
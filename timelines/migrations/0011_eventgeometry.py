@@ -0,0 +1,44 @@
+# Generated by Django 4.2.17 on 2026-10-18 20:25
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timelines", "0010_timeline_page_tiling"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventGeometry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("event_id", models.PositiveBigIntegerField()),
+                ("layout_key", models.CharField(max_length=100)),
+                ("rank", models.PositiveIntegerField()),
+                ("width", models.FloatField()),
+                ("height", models.FloatField()),
+                ("position_on_scale", models.FloatField()),
+                ("x", models.FloatField()),
+                ("y", models.FloatField()),
+                ("span_start", models.FloatField()),
+                ("span_end", models.FloatField()),
+                (
+                    "timeline",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="timelines.timeline",
+                    ),
+                ),
+            ],
+        ),
+    ]
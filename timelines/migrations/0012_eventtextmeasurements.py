@@ -0,0 +1,31 @@
+# Generated by Django 4.2.17 on 2026-10-18 20:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timelines", "0011_eventgeometry"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventTextMeasurements",
+            fields=[
+                (
+                    "event",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="text_measurements",
+                        serialize=False,
+                        to="timelines.event",
+                    ),
+                ),
+                ("text_key", models.CharField(max_length=64)),
+                ("widths", models.JSONField()),
+                ("heights", models.JSONField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.17 on 2026-10-18 20:49
+
+import django.core.files.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timelines", "0012_eventtextmeasurements"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="pdfjob",
+            name="pdf_data",
+        ),
+        migrations.AddField(
+            model_name="pdfjob",
+            name="pdf_file",
+            field=models.FileField(
+                blank=True,
+                storage=django.core.files.storage.FileSystemStorage(),
+                upload_to="pdf_jobs/",
+            ),
+        ),
+    ]
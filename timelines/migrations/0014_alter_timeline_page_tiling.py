@@ -0,0 +1,27 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timelines", "0013_pdfjob_pdf_file"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="timeline",
+            name="page_tiling",
+            field=models.CharField(
+                choices=[("S", "Single page"), ("T", "Tiled pages")],
+                default="S",
+                help_text=(
+                    "Tiled pages split a long scale across pages of the page "
+                    "size. Every page is held in memory until the whole PDF "
+                    "is written, so very long timelines still need memory for "
+                    "all their pages."
+                ),
+                max_length=1,
+            ),
+        ),
+    ]
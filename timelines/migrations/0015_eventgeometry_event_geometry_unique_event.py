@@ -0,0 +1,29 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:03
+
+from django.db import migrations, models
+
+
+def delete_event_geometry(apps, schema_editor):
+    # stored geometry is only reused, so rather than finding any duplicates
+    # it is removed and stored again the next time each timeline is drawn
+    EventGeometry = apps.get_model("timelines", "EventGeometry")
+    EventGeometry.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timelines", "0014_alter_timeline_page_tiling"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            delete_event_geometry, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="eventgeometry",
+            constraint=models.UniqueConstraint(
+                fields=("timeline", "layout_key", "event_id"),
+                name="event_geometry_unique_event",
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timelines", "0015_eventgeometry_event_geometry_unique_event"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="pdfjob",
+            name="pdf_file",
+            field=models.FileField(blank=True, upload_to="pdf_jobs/"),
+        ),
+    ]
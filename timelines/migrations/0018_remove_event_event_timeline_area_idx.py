@@ -0,0 +1,16 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:41
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timelines", "0017_alter_timeline_page_tiling_help"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="event",
+            name="event_timeline_area_idx",
+        ),
+    ]
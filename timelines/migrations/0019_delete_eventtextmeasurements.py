@@ -0,0 +1,15 @@
+# Generated by Django 4.2.17 on 2026-10-18 21:46
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timelines", "0018_remove_event_event_timeline_area_idx"),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name="EventTextMeasurements",
+        ),
+    ]
@@ -1,7 +1,35 @@
 from django.http import HttpResponseForbidden
 
+from .models import Timeline
 
-class OwnerRequiredMixin(object):
+
+class ObjectMemoMixin(object):
+    def get_queryset(self):
+        """Get the view's objects along with the models their permissions
+        are checked against."""
+        queryset = super().get_queryset()
+        model = queryset.model
+        if issubclass(model, Timeline) and model is not Timeline:
+            return queryset.select_related("timeline_ptr", "user")
+        elif any(field.name == "timeline" for field in model._meta.fields):
+            return queryset.select_related("timeline")
+        else:
+            return queryset
+
+    def get_object(self, queryset=None):
+        """Get the view's object, only loading it the first time it is
+        needed by this view, which only handles one request."""
+        if queryset is not None:
+            return super().get_object(queryset)
+
+        try:
+            return self.__object
+        except AttributeError:
+            self.__object = super().get_object()
+            return self.__object
+
+
+class OwnerRequiredMixin(ObjectMemoMixin):
     def dispatch(self, request, *args, **kwargs):
         if self.get_object().get_owner() != self.request.user:
             return HttpResponseForbidden()
@@ -10,11 +38,25 @@ class OwnerRequiredMixin(object):
         )
 
 
-class RolePermissionMixin(object):
+class UserRoleMixin(object):
+    def get_user_role(self, timeline):
+        """Get the requesting user's role on a timeline, only looking it up
+        the first time it is needed by this view, which only handles one
+        request."""
+        try:
+            user_roles = self.__user_roles
+        except AttributeError:
+            user_roles = self.__user_roles = {}
+
+        if timeline.pk not in user_roles:
+            user_roles[timeline.pk] = timeline.get_role(self.request.user)
+
+        return user_roles[timeline.pk]
+
+
+class RolePermissionMixin(ObjectMemoMixin, UserRoleMixin):
     def dispatch(self, request, *args, **kwargs):
-        user_role = (
-            self.get_object().get_timeline().get_role(self.request.user)
-        )
+        user_role = self.get_user_role(self.get_object().get_timeline())
         if user_role < self.required_role:
             return HttpResponseForbidden()
 
@@ -23,10 +65,9 @@ class RolePermissionMixin(object):
         )
 
 
-class RoleContextMixin(object):
+class RoleContextMixin(ObjectMemoMixin, UserRoleMixin):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         timeline = self.get_object().get_timeline()
-        user = self.request.user
-        context["user_role"] = timeline.get_role(user)
+        context["user_role"] = self.get_user_role(timeline)
         return context
@@ -36,6 +36,22 @@ class Timeline(models.Model):
         default="4"
     )
 
+    # whether a long scale is drawn on one page or split across pages of
+    # the page size
+    PAGE_TILINGS = [
+        ("S", "Single page"),
+        ("T", "Tiled pages"),
+    ]
+    page_tiling = models.CharField(
+        max_length=1,
+        choices=PAGE_TILINGS,
+        default="S",
+        help_text=(
+            "Tiled pages split a long scale across pages of the page size, "
+            "marked where each page overlaps the next."
+        ),
+    )
+
     # display layout
     PAGE_ORIENTATIONS = [
         ("L", "Landscape"),
@@ -46,6 +62,15 @@ class Timeline(models.Model):
     )
     page_scale_position = models.PositiveSmallIntegerField(default=0)
 
+    # how events are arranged in their event areas on the pdf
+    EVENT_PLACEMENTS = [
+        ("N", "Nearest to scale position"),
+        ("S", "Stacked in scale order"),
+    ]
+    event_placement = models.CharField(
+        max_length=1, choices=EVENT_PLACEMENTS, default="N"
+    )
+
     def __str__(self):
         return self.title
 
@@ -56,16 +81,20 @@ class Timeline(models.Model):
         return self
 
     def get_role(self, user):
+        # read for every request rather than cached between requests, so a
+        # changed role applies at once in every process, see UserRoleMixin
         if user is None:
             return ROLE_NONE
-        elif user == self.user:
+        elif user.pk == self.user_id:
             return ROLE_OWNER
         else:
-            collaborators = self.collaborator_set.filter(
-                user=user
+            role = (
+                self.collaborator_set.filter(user=user)
+                .values_list("role", flat=True)
+                .first()
             )
-            if len(collaborators) != 0:
-                return collaborators[0].role
+            if role is not None:
+                return role
             else:
                 return ROLE_NONE
 
@@ -107,6 +136,12 @@ class Tag(models.Model):
 
     class Meta:
         ordering = ["name"]
+        indexes = [
+            models.Index(
+                fields=["timeline", "display", "name"],
+                name="tag_timeline_display_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -147,18 +182,49 @@ class Event(models.Model):
         else:
             tags = self.tags.all()
 
-        if tags.count() > 0:
-            tag_string = "("
-            for tag in tags:
-                if tag == tags.last():
-                    tag_string += f"{tag.name})"
-                else:
-                    tag_string += f"{tag.name}, "
-            return tag_string
+        return Event.join_tag_names(tags)
+
+    @staticmethod
+    def join_tag_names(tags):
+        names = [tag.name for tag in tags]
+        if len(names) > 0:
+            return f"({', '.join(names)})"
         else:
             return ""
 
 
+class EventGeometry(models.Model):
+    # where an event was placed on its timeline's PDF by one layout of its
+    # event area, see timelines.pdf.incremental_layout.  event_id is not a
+    # foreign key so that the geometry of deleted events is kept until the
+    # next layout, which then knows the events placed after them may move
+    timeline = models.ForeignKey(Timeline, on_delete=models.CASCADE)
+    event_id = models.PositiveBigIntegerField()
+    layout_key = models.CharField(max_length=100)
+    rank = models.PositiveIntegerField()
+    width = models.FloatField()
+    height = models.FloatField()
+    position_on_scale = models.FloatField()
+    x = models.FloatField()
+    y = models.FloatField()
+    span_start = models.FloatField()
+    span_end = models.FloatField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["timeline", "layout_key", "event_id"],
+                name="event_geometry_unique_event",
+            ),
+        ]
+
+    def get_owner(self):
+        return self.timeline.user
+
+    def get_timeline(self):
+        return self.timeline
+
+
 ROLE_NONE = 0
 ROLE_VIEWER = 1
 ROLE_EVENT_EDITOR = 2
@@ -196,3 +262,44 @@ class Collaborator(models.Model):
 
     def role_string(self):
         return ROLE_DESCRIPTIONS[self.role]
+
+
+class PDFJob(models.Model):
+    timeline = models.ForeignKey(Timeline, on_delete=models.CASCADE)
+    # what to draw, see timelines.pdf.pdf_jobs
+    timeline_model = models.CharField(max_length=100)
+    pdf_class = models.CharField(max_length=200)
+    fingerprint = models.CharField(max_length=64)
+
+    STATUS_QUEUED = "Q"
+    STATUS_RUNNING = "R"
+    STATUS_DONE = "D"
+    STATUS_FAILED = "F"
+    STATUSES = [
+        (STATUS_QUEUED, "Queued"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_DONE, "Done"),
+        (STATUS_FAILED, "Failed"),
+    ]
+    status = models.CharField(
+        max_length=1, choices=STATUSES, default=STATUS_QUEUED
+    )
+
+    # the PDF is kept in a file in the default storage, rather than in the
+    # row, so it can be streamed and is shared by every web server
+    pdf_file = models.FileField(upload_to="pdf_jobs/", blank=True)
+    error = models.CharField(max_length=1000, blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ["timeline", "fingerprint"]
+
+    def get_owner(self):
+        return self.timeline.user
+
+    def get_timeline(self):
+        return self.timeline
+
+    def is_finished(self):
+        return self.status in [self.STATUS_DONE, self.STATUS_FAILED]
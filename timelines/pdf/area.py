@@ -15,6 +15,8 @@ class Area():
         height: A float storing the height of the Area.
     """
 
+    __slots__ = ("x", "y", "width", "height")
+
     def __init__(self, x: float, y: float, width: float, height: float):
         """Initialise Instance.
 
@@ -0,0 +1,238 @@
+"""Contains class to index the Areas already positioned in a PDFEventArea by
+where they are along the timeline's scale.
+
+Classes:
+    EventIndex
+
+Usage:
+    index = EventIndex("x")
+    index.add(Area(0, 0, 20, 10))
+    index.add(Area(40, 0, 20, 10))
+
+    overlapping_area = index.get_overlapping_area(Area(50, 5, 10, 10))
+"""
+
+from array import array
+from math import floor
+from typing import Dict, Iterable, List, Union
+
+from reportlab.lib.units import mm
+
+from .area import Area
+
+"""Default length along the scale of each cell in an EventIndex."""
+DEFAULT_CELL_SIZE = 20 * mm
+
+
+class EventIndex:
+    """Class to find which positioned Areas are near a position along the
+    timeline's scale.
+
+    Splits the scale axis (x for a landscape timeline and y for a portrait
+    one) into cells of equal length and records which Areas cover each cell,
+    so overlap queries only have to test the Areas sharing a cell with the
+    Area being positioned instead of every Area positioned so far.
+
+    Attributes:
+        axis: A str holding the axis the scale runs along, x for landscape
+        and y for portrait.
+        cell_size: A float storing the length of each cell along the axis.
+        areas: A list of the Areas added to this instance in the order they
+        were added.
+        xs: An array of floats storing the x coordinate of each Area in
+        areas, at the same indexes, which overlap queries are tested
+        against rather than calling the methods of each Area.
+        ys: An array of floats storing the y coordinate of each Area.
+        widths: An array of floats storing the width of each Area.
+        heights: An array of floats storing the height of each Area.
+        cells: A dict mapping each cell number to the indexes in areas of the
+        Areas covering that cell.
+    """
+
+    def __init__(self, axis: str, cell_size: float = DEFAULT_CELL_SIZE):
+        """Initialise Instance.
+
+        Args:
+            axis: A str holding the axis to index along, x for landscape
+            timelines or y for portrait timelines.
+            cell_size: A float storing the length of each cell along the
+            axis.
+
+        Raises:
+            ValueError: If axis is not x or y or cell_size is not greater than
+            0.
+        """
+        if (axis != "x") and (axis != "y"):
+            raise ValueError("axis must be x for landscape or y for portrait")
+
+        if cell_size <= 0:
+            raise ValueError("cell_size must be greater than 0")
+
+        self.axis = axis
+        self.cell_size = cell_size
+        self.areas: List[Area] = []
+        self.xs = array("d")
+        self.ys = array("d")
+        self.widths = array("d")
+        self.heights = array("d")
+        self.cells: Dict[int, List[int]] = {}
+
+    def __len__(self) -> int:
+        """Get number of Areas added to this instance."""
+        return len(self.areas)
+
+    def __cell_range(
+        self, x: float, y: float, width: float, height: float
+    ) -> range:
+        """Get the cell numbers covered by an area along the indexed axis.
+
+        Both edges are included so that Areas which only touch, or which have
+        no size along the axis, still share a cell with any Area they can
+        overlap.
+        """
+        if self.axis == "x":
+            start, end = x, x + width
+        else:
+            start, end = y, y + height
+
+        return range(
+            floor(start / self.cell_size), floor(end / self.cell_size) + 1
+        )
+
+    def __get_candidate_indexes(
+        self, x: float, y: float, width: float, height: float
+    ) -> List[int]:
+        """Get the indexes in areas of the Areas sharing a cell with an area,
+        in the order they were added."""
+        area_indexes = set()
+        for cell in self.__cell_range(x, y, width, height):
+            area_indexes.update(self.cells.get(cell, ()))
+
+        return sorted(area_indexes)
+
+    def __get_overlapping_index(
+        self,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        area_indexes: Iterable[int],
+    ) -> Union[int, None]:
+        """Get the 1st of area_indexes whose Area overlaps an area with the
+        given geometry, testing exactly the same as Area.overlaps."""
+        right = x + width
+        top = y + height
+        xs, ys, widths, heights = self.xs, self.ys, self.widths, self.heights
+        for area_index in area_indexes:
+            other_x = xs[area_index]
+            other_right = other_x + widths[area_index]
+            if not (
+                (x >= other_x and right <= other_right)
+                or (x < other_x and right > other_x)
+                or (x < other_right and right > other_right)
+            ):
+                continue
+
+            other_y = ys[area_index]
+            other_top = other_y + heights[area_index]
+            if (
+                (y >= other_y and top <= other_top)
+                or (y < other_y and top > other_y)
+                or (y < other_top and top > other_top)
+            ):
+                return area_index
+
+        return None
+
+    def add(self, area: Area):
+        """Add a positioned Area to this instance.
+
+        Args:
+            area: An Area which will not be moved again.
+        """
+        area_index = len(self.areas)
+        self.areas.append(area)
+        self.xs.append(area.x)
+        self.ys.append(area.y)
+        self.widths.append(area.width)
+        self.heights.append(area.height)
+        for cell in self.__cell_range(area.x, area.y, area.width, area.height):
+            self.cells.setdefault(cell, []).append(area_index)
+
+    def sync(self, areas: List[Area]):
+        """Add any Areas from the end of areas not yet added to this instance.
+
+        Args:
+            areas: A list of positioned Areas which this instance has been
+            built from, with any new Areas appended to the end.
+        """
+        for area in areas[len(self.areas):]:
+            self.add(area)
+
+    def get_candidate_indexes(self, area: Area) -> List[int]:
+        """Get the indexes of the Areas which could overlap area.
+
+        Args:
+            area: An Area to find the nearby Areas of.
+
+        Returns:
+            A list of the indexes in areas of the Areas sharing a cell with
+            area, in the order they were added to this instance.
+        """
+        return self.__get_candidate_indexes(
+            area.x, area.y, area.width, area.height
+        )
+
+    def get_candidates(self, area: Area) -> List[Area]:
+        """Get the Areas which could overlap area.
+
+        Args:
+            area: An Area to find the nearby Areas of.
+
+        Returns:
+            A list of Areas sharing a cell with area in the order they were
+            added to this instance.
+        """
+        return [self.areas[i] for i in self.get_candidate_indexes(area)]
+
+    def get_overlapping_area(self, area: Area) -> Union[Area, None]:
+        """Get 1st Area added to this instance that overlaps area.
+
+        Args:
+            area: An Area to test against the Areas in this instance.
+
+        Returns:
+            The same Area a linear search through the Areas in the order they
+            were added would find, or None if area overlaps none of them.
+        """
+        return self.get_overlapping_area_at(
+            area.x, area.y, area.width, area.height
+        )
+
+    def get_overlapping_area_at(
+        self, x: float, y: float, width: float, height: float
+    ) -> Union[Area, None]:
+        """Get 1st Area added to this instance that overlaps an area with the
+        given geometry, without having to create an Area for it.
+
+        Args:
+            x: A float storing the x coordinate of the area to test.
+            y: A float storing the y coordinate of the area to test.
+            width: A float storing the width of the area to test.
+            height: A float storing the height of the area to test.
+
+        Returns:
+            The same Area as get_overlapping_area, or None if the area
+            overlaps none of them.
+        """
+        area_index = self.__get_overlapping_index(
+            x,
+            y,
+            width,
+            height,
+            self.__get_candidate_indexes(x, y, width, height),
+        )
+        if area_index is None:
+            return None
+
+        return self.areas[area_index]
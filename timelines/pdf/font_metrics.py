@@ -0,0 +1,128 @@
+"""Contains class to measure strings from a table of glyph widths.
+
+Classes:
+    FontMetrics
+
+Functions:
+    get_font_metrics
+    string_width
+
+Usage:
+    width = string_width("text", "Times-Roman", 10)
+"""
+
+from functools import lru_cache
+from typing import Dict, Union
+
+from reportlab.pdfbase.pdfmetrics import Font, getFont, stringWidth
+
+"""Number of strings whose widths string_width remembers."""
+STRING_WIDTH_CACHE_SIZE = 20000
+
+"""Number of characters to measure when a FontMetrics is created, covering
+all the Latin-1 characters."""
+PRECOMPUTED_GLYPH_COUNT = 256
+
+
+class FontMetrics:
+    """Class to measure strings in a Type 1 font by adding up the widths of
+    their glyphs.
+
+    Type 1 fonts store glyph widths as whole numbers of thousandths of the
+    font size and stringWidth adds these up before scaling them, so adding
+    up the same numbers from a table gives exactly the same widths as
+    stringWidth without encoding each string first.
+
+    Attributes:
+        font_name: A str holding the name of the font measured.
+        glyph_widths: A dict mapping each character measured so far to the
+        width of its glyph in thousandths of the font size.
+    """
+
+    def __init__(self, font_name: str):
+        """Initialise Instance.
+
+        Measures the glyphs of all Latin-1 characters, others are measured
+        the first time they are used.
+
+        Args:
+            font_name: A str holding the name of a registered Type 1 font.
+
+        Raises:
+            ValueError: If the font is not a Type 1 font.
+        """
+        if not isinstance(getFont(font_name), Font):
+            raise ValueError("font_name must be the name of a Type 1 font")
+
+        self.font_name = font_name
+        self.glyph_widths: Dict[str, int] = {}
+        for code in range(PRECOMPUTED_GLYPH_COUNT):
+            self.__add_glyph(chr(code))
+
+    def __add_glyph(self, character: str) -> int:
+        """Measure a character's glyph and add it to glyph_widths."""
+        width = round(stringWidth(character, self.font_name, 1000))
+        self.glyph_widths[character] = width
+        return width
+
+    def string_width(self, text: str, font_size: float) -> float:
+        """Get width of a string in points.
+
+        Args:
+            text: A str to measure.
+            font_size: A float storing the size of the font.
+
+        Returns:
+            A float storing the same width as stringWidth.
+        """
+        glyph_widths = self.glyph_widths
+        try:
+            total = sum(map(glyph_widths.__getitem__, text))
+        except KeyError:
+            total = 0
+            for character in text:
+                width = glyph_widths.get(character)
+                if width is None:
+                    width = self.__add_glyph(character)
+                total += width
+
+        return total * 0.001 * font_size
+
+
+@lru_cache(maxsize=None)
+def get_font_metrics(font_name: str) -> Union[FontMetrics, None]:
+    """Get the FontMetrics for a font, creating it the first time it is
+    needed.
+
+    Args:
+        font_name: A str holding the name of a registered font.
+
+    Returns:
+        A FontMetrics instance, or None if the font is not a Type 1 font.
+    """
+    if not isinstance(getFont(font_name), Font):
+        return None
+
+    return FontMetrics(font_name)
+
+
+@lru_cache(maxsize=STRING_WIDTH_CACHE_SIZE)
+def string_width(text: str, font_name: str, font_size: float) -> float:
+    """Get width of a string in points, replacing stringWidth.
+
+    Remembers the widths of the most recently measured strings and measures
+    any others from the font's FontMetrics.
+
+    Args:
+        text: A str to measure.
+        font_name: A str holding the name of a registered font.
+        font_size: A float storing the size of the font.
+
+    Returns:
+        A float storing the same width as stringWidth.
+    """
+    font_metrics = get_font_metrics(font_name)
+    if font_metrics is None:
+        return stringWidth(text, font_name, font_size)
+
+    return font_metrics.string_width(text, font_size)
@@ -0,0 +1,373 @@
+"""Contains class and functions to position the events of a timeline's PDF
+reusing where they were positioned the last time it was drawn.
+
+Where each event is positioned in its PDFEventArea is stored as an
+EventGeometry, along with its size, position_on_scale and the span along
+the scale the candidate positions tested for it covered.  Positioning is
+deterministic and an event's position only depends on its size, its
+position_on_scale and the events positioned before it across that span.
+So when the PDF is drawn again, an event whose size and position_on_scale
+are unchanged, and which has exactly the same events positioned before it
+across its span, in the same order and positions, keeps its stored position
+without being searched for.  Every other event, such as an edited one and
+those near it along the scale whose spans it crosses, is positioned again,
+and the result is the same as positioning every event again.
+
+The events positioned so far, and those stored, are found near each event
+along the scale with an EventIndex of each.
+
+Functions:
+    get_layout_key
+    load_event_geometry
+    place_events_incrementally
+    save_event_geometry
+    check_incremental_layout
+
+Usage:
+    stored = load_event_geometry(timeline)
+    layout_key = get_layout_key(pdf_event_area, "L", False)
+    overlap, geometries, reused = place_events_incrementally(
+        pdf_event_area,
+        event_ids,
+        pdf_events,
+        "L",
+        False,
+        layout_key,
+        stored.get(layout_key, {}),
+    )
+    save_event_geometry(timeline, stored, geometries)
+
+    assert check_incremental_layout(timeline, PDFDateTimeTimeline)
+"""
+
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple, Type
+
+from django.db import transaction
+from reportlab.lib.units import mm
+
+from timelines.models import EventGeometry, Timeline
+
+from .area import Area
+from .event_index import EventIndex
+from .pdf_event_area import PDFEventArea
+
+"""Gap left between events by PDFEventArea's positioning methods."""
+EVENT_GAP = mm
+
+
+def get_layout_key(
+    pdf_event_area: PDFEventArea, orientation: str, stacked: bool
+) -> str:
+    """Get a key identifying everything about a PDFEventArea, other than its
+    events, that where its events are positioned depends on.
+
+    Args:
+        pdf_event_area: A PDFEventArea.
+        orientation: A str holding L for a landscape timeline or P for
+        portrait.
+        stacked: A bool stating if the events are positioned with the
+        skyline methods.
+
+    Returns:
+        A str holding the key.
+    """
+    # only the size of the edge that cannot be expanded limits positions
+    if orientation == "L":
+        size = pdf_event_area.height
+    else:
+        size = pdf_event_area.width
+
+    placement = "S" if stacked else "N"
+    return (
+        f"{pdf_event_area.event_area.id}-{orientation}-{placement}-{size!r}"
+    )
+
+
+def load_event_geometry(
+    timeline: Timeline,
+) -> Dict[str, Dict[int, EventGeometry]]:
+    """Load the EventGeometry stored for the events of a timeline in one
+    query.
+
+    Args:
+        timeline: A Timeline, or subclass of Timeline.
+
+    Returns:
+        A dict keyed on layout key of dicts of EventGeometry keyed on the id
+        of their Event.
+    """
+    stored: Dict[str, Dict[int, EventGeometry]] = {}
+    for geometry in EventGeometry.objects.filter(timeline=timeline):
+        stored.setdefault(geometry.layout_key, {})[
+            geometry.event_id
+        ] = geometry
+
+    return stored
+
+
+def _get_span(
+    x: float, y: float, width: float, height: float, orientation: str
+) -> Tuple[float, float]:
+    """Get the span along the scale an event positioned at x, y can affect
+    other events across, including the gap left after it."""
+    if orientation == "L":
+        return x - EVENT_GAP, x + width + EVENT_GAP
+
+    return y - EVENT_GAP, y + height + EVENT_GAP
+
+
+def _get_entries(
+    event_index: EventIndex,
+    event_ids: List[int],
+    start: float,
+    end: float,
+    orientation: str,
+    count: Optional[int] = None,
+) -> List[Tuple[int, float, float, float, float]]:
+    """Get the id, coordinates and size of the events in an EventIndex,
+    added in the order they were positioned, whose spans cross or touch the
+    span from start to end.  Only the first count events added are got,
+    unless count is None."""
+    # the spans of the events reach EVENT_GAP past their Areas
+    nearby_area = Area(
+        start - EVENT_GAP,
+        start - EVENT_GAP,
+        end - start + 2 * EVENT_GAP,
+        end - start + 2 * EVENT_GAP,
+    )
+    entries = []
+    for area_index in event_index.get_candidate_indexes(nearby_area):
+        if count is not None and area_index >= count:
+            break
+
+        area = event_index.areas[area_index]
+        span_start, span_end = _get_span(
+            area.x, area.y, area.width, area.height, orientation
+        )
+        if span_start <= end and span_end >= start:
+            entries.append(
+                (
+                    event_ids[area_index],
+                    area.x,
+                    area.y,
+                    area.width,
+                    area.height,
+                )
+            )
+
+    return entries
+
+
+def _can_reuse(
+    geometry: EventGeometry,
+    area: Area,
+    orientation: str,
+    stored_index: EventIndex,
+    stored_ids: List[int],
+    stored_ranks: List[int],
+    placed_index: EventIndex,
+    placed_ids: List[int],
+) -> bool:
+    """Test if an Area would be positioned where geometry stores, given
+    the events positioned so far."""
+    if (
+        geometry.width != area.width
+        or geometry.height != area.height
+        or geometry.position_on_scale != area.position_on_scale
+    ):
+        return False
+
+    start = geometry.span_start - EVENT_GAP
+    end = geometry.span_end + EVENT_GAP
+    return _get_entries(
+        stored_index,
+        stored_ids,
+        start,
+        end,
+        orientation,
+        bisect_left(stored_ranks, geometry.rank),
+    ) == _get_entries(placed_index, placed_ids, start, end, orientation)
+
+
+def place_events_incrementally(
+    pdf_event_area: PDFEventArea,
+    event_ids: List[int],
+    areas: List[Area],
+    orientation: str,
+    stacked: bool,
+    layout_key: str,
+    stored: Dict[int, EventGeometry],
+) -> Tuple[float, List[EventGeometry], int]:
+    """Positions Areas in a PDFEventArea in order, the same as
+    PDFEventArea.place_events, reusing stored positions which cannot have
+    changed.
+
+    Args:
+        pdf_event_area: A PDFEventArea to position the Areas in.
+        event_ids: A list of the ids of the Event each Area is for.
+        areas: A list of Area instances, usually PDFEvents, each with its
+        position_on_scale set and its x (landscape) or y (portrait)
+        coordinate set to it.
+        orientation: A str holding L for a landscape timeline or P for
+        portrait.
+        stacked: A bool stating if the Areas are sorted along the scale and
+        should be positioned with the skyline methods.
+        layout_key: A str holding the key of pdf_event_area from
+        get_layout_key.
+        stored: A dict of the EventGeometry stored under layout_key, keyed
+        on the id of their Event.
+
+    Returns:
+        A tuple of the largest amount any of the Areas overlap the
+        expandable side of pdf_event_area, a list of new unsaved
+        EventGeometry for the Areas and the number of Areas whose stored
+        position was reused.
+    """
+    axis = "x" if orientation == "L" else "y"
+    stored_index = EventIndex(axis)
+    stored_ids = []
+    stored_ranks = []
+    for geometry in sorted(stored.values(), key=lambda stored: stored.rank):
+        stored_index.add(
+            Area(geometry.x, geometry.y, geometry.width, geometry.height)
+        )
+        stored_ids.append(geometry.event_id)
+        stored_ranks.append(geometry.rank)
+
+    # the events positioned so far, in order
+    placed_index = EventIndex(axis)
+    placed_ids = []
+    geometries = []
+    reused = 0
+    max_overlap = 0
+    for rank, (event_id, area) in enumerate(zip(event_ids, areas)):
+        geometry = stored.get(event_id)
+        if geometry is not None and _can_reuse(
+            geometry,
+            area,
+            orientation,
+            stored_index,
+            stored_ids,
+            stored_ranks,
+            placed_index,
+            placed_ids,
+        ):
+            overlap = pdf_event_area.add_placed_event(
+                area, geometry.x, geometry.y, orientation, stacked, EVENT_GAP
+            )
+            span_start, span_end = geometry.span_start, geometry.span_end
+            reused += 1
+        else:
+            overlap = pdf_event_area.place_event(area, orientation, stacked)
+            span_start, span_end = pdf_event_area.search_span
+
+        if overlap > max_overlap:
+            max_overlap = overlap
+
+        placed_index.add(Area(area.x, area.y, area.width, area.height))
+        placed_ids.append(event_id)
+        geometries.append(
+            EventGeometry(
+                event_id=event_id,
+                layout_key=layout_key,
+                rank=rank,
+                width=area.width,
+                height=area.height,
+                position_on_scale=area.position_on_scale,
+                x=area.x,
+                y=area.y,
+                span_start=span_start,
+                span_end=span_end,
+            )
+        )
+
+    return max_overlap, geometries, reused
+
+
+def _is_stored(
+    geometry: EventGeometry, stored: Dict[str, Dict[int, EventGeometry]]
+) -> bool:
+    """Test if an EventGeometry is the same as one already stored."""
+    stored_geometry = stored.get(geometry.layout_key, {}).get(
+        geometry.event_id
+    )
+    return stored_geometry is not None and all(
+        getattr(stored_geometry, field) == getattr(geometry, field)
+        for field in (
+            "rank",
+            "width",
+            "height",
+            "position_on_scale",
+            "x",
+            "y",
+            "span_start",
+            "span_end",
+        )
+    )
+
+
+def save_event_geometry(
+    timeline: Timeline,
+    stored: Dict[str, Dict[int, EventGeometry]],
+    geometries: List[EventGeometry],
+):
+    """Replace the EventGeometry stored for the events of a timeline, only
+    if it has changed.
+
+    Only the geometry of the latest layout of each event area is kept.  The
+    timeline's row is locked while the geometry is replaced, so PDFs of the
+    timeline drawn at the same time replace it one after another rather than
+    both adding their geometry.
+
+    Args:
+        timeline: A Timeline, or subclass of Timeline.
+        stored: The EventGeometry stored for the timeline, as returned by
+        load_event_geometry.
+        geometries: A list of the new EventGeometry for every event
+        positioned on the timeline, their timeline is set here.
+    """
+    stored_count = sum(len(area_stored) for area_stored in stored.values())
+    if stored_count == len(geometries) and all(
+        _is_stored(geometry, stored) for geometry in geometries
+    ):
+        return
+
+    for geometry in geometries:
+        geometry.timeline_id = timeline.pk
+
+    with transaction.atomic():
+        locked = Timeline.objects.select_for_update().filter(pk=timeline.pk)
+        if not locked.values_list("pk", flat=True):
+            # the timeline has been deleted since it was drawn
+            return
+
+        EventGeometry.objects.filter(timeline=timeline).delete()
+        EventGeometry.objects.bulk_create(geometries)
+
+
+def _get_positions(pdf_timeline) -> List[List[Tuple[float, float]]]:
+    """Get the coordinates of the PDFEvents in each PDFEventArea of a
+    PDFTimeline."""
+    return [
+        [(pdf_event.x, pdf_event.y) for pdf_event in pdf_event_area.events]
+        for pdf_event_area in pdf_timeline.layout.event_areas
+    ]
+
+
+def check_incremental_layout(timeline: Timeline, pdf_class: Type) -> bool:
+    """Check that positioning the events of a timeline reusing the stored
+    EventGeometry gives the same result as positioning all of them again.
+
+    The EventGeometry stored is updated by the check.
+
+    Args:
+        timeline: A subclass of Timeline.
+        pdf_class: A subclass of PDFTimeline to draw the timeline with.
+
+    Returns:
+        A bool set to True when every event is positioned the same.
+    """
+    incremental = pdf_class(timeline, incremental_layout=True)
+    full = pdf_class(timeline)
+    return _get_positions(incremental) == _get_positions(full)
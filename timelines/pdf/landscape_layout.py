@@ -1,9 +1,13 @@
+import math
+from typing import List
+
 from timelines.models import Timeline
 from .area import Area
 from .layout import (
     Layout,
     A3_LONG, A3_SHORT, A4_LONG, A4_SHORT, A5_LONG, A5_SHORT,
-    DEFAULT_PAGE_BORDER, DEFAULT_COMPONENT_BORDER, DEFAULT_EVENT_BORDER
+    DEFAULT_PAGE_BORDER, DEFAULT_COMPONENT_BORDER, DEFAULT_EVENT_BORDER,
+    DEFAULT_TILE_OVERLAP,
 )
 from .pdf_event_area import PDFEventArea
 
@@ -141,6 +145,17 @@ class LandscapeLayout(Layout):
             event_area,
         )
 
+    def page_tiles(self, overlap=DEFAULT_TILE_OVERLAP) -> List[Area]:
+        """Split the whole PDF into areas the initial page size, from left to
+        right, each sharing overlap with the one to its left."""
+        tile = self._initial_page_area(self.timeline.page_size)
+        step = tile.width - overlap
+        count = max(1, math.ceil((self.page_area.width - overlap) / step))
+        return [
+            Area(index * step, 0, tile.width, tile.height)
+            for index in range(count)
+        ]
+
     def expand_event_overlap(self, max_overlap):
         """Updates areas in layout to take into account extra space required
         for events that overlap the edge of their event areas.
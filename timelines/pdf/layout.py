@@ -16,6 +16,7 @@ A5_SHORT = 148 * mm
 DEFAULT_PAGE_BORDER = 10 * mm
 DEFAULT_COMPONENT_BORDER = 2 * mm
 DEFAULT_EVENT_BORDER = 0.5 * mm
+DEFAULT_TILE_OVERLAP = 10 * mm
 
 
 class Layout(ABC):
@@ -150,6 +151,12 @@ class Layout(ABC):
             area_size - scale_size - (event_area_count * self.component_border)
         ) / total_weight
 
+    @abstractmethod
+    def page_tiles(self, overlap=DEFAULT_TILE_OVERLAP) -> List[Area]:
+        """Split the whole PDF into areas the initial page size, in the order
+        they are printed, each sharing overlap with the one before."""
+        raise NotImplementedError("Subclasses should implement this method")
+
     @abstractmethod
     def expand_event_overlap(self, max_overlap):
         """Updates areas in layout to take into account extra space required
@@ -0,0 +1,184 @@
+"""Contains class to remember how big Paragraphs are when wrapped to a width.
+
+Classes:
+    MeasurementCache
+
+Functions:
+    is_wrapped_to
+    wrap_for_drawing
+
+Usage:
+    paragraph = Paragraph("text", style)
+    width, height = measurement_cache.wrap(paragraph, 50 * mm)
+
+    wrap_for_drawing(paragraph, canvas, width)
+    paragraph.drawOn(canvas, 0, 0)
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Hashable, Optional, Tuple
+from weakref import WeakKeyDictionary
+
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Paragraph
+
+"""Default number of measurements a MeasurementCache keeps."""
+DEFAULT_MAX_SIZE = 10000
+
+
+class MeasurementCache:
+    """Class to remember the size of wrapped Paragraphs so the same text
+    does not have to be wrapped again at the same width.
+
+    Measurements are keyed on the Paragraph's text, its style and the exact
+    width it was wrapped to, so a measurement is always the same as the
+    Paragraph wrapped to that width for drawing.  Styles are identified by
+    the values of their properties, so a style recreated with the same
+    settings for each PDF shares measurements with the styles used before
+    it.
+
+    When full the least recently used measurement is discarded.  Instances
+    can be shared by several threads.
+
+    Attributes:
+        max_size: An int storing the most measurements to keep.
+        hits: An int storing how many measurements were found in the cache.
+        misses: An int storing how many measurements needed a Paragraph to
+        be wrapped.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """Initialise Instance.
+
+        Args:
+            max_size: An int storing the most measurements to keep.
+
+        Raises:
+            ValueError: If max_size is less than 1.
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be 1 or greater")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__measurements: OrderedDict = OrderedDict()
+        self.__style_keys: WeakKeyDictionary = WeakKeyDictionary()
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        """Get number of measurements in this instance."""
+        return len(self.__measurements)
+
+    def __get_style_key(self, style: ParagraphStyle) -> Hashable:
+        """Get a key made from the values of all of a style's properties."""
+        key = self.__style_keys.get(style)
+        if key is None:
+            key = tuple(sorted(style.__dict__.items()))
+            self.__style_keys[style] = key
+
+        return key
+
+    def __get_key(self, paragraph: Paragraph, width: float) -> Hashable:
+        """Get the key of a Paragraph's measurement at width."""
+        return (paragraph.text, self.__get_style_key(paragraph.style), width)
+
+    def get_height(
+        self, paragraph: Paragraph, width: float
+    ) -> Optional[float]:
+        """Get the height of a Paragraph wrapped to width if it is in the
+        cache, without wrapping it.
+
+        Args:
+            paragraph: A Paragraph to measure.
+            width: A float storing the width to wrap the Paragraph to.
+
+        Returns:
+            A float storing the height, or None if it has not been measured.
+        """
+        with self.__lock:
+            key = self.__get_key(paragraph, width)
+            height = self.__measurements.get(key)
+            if height is not None:
+                self.__measurements.move_to_end(key)
+                self.hits += 1
+
+        return height
+
+    def wrap(self, paragraph: Paragraph, width: float) -> Tuple[float, float]:
+        """Get the width and height of a Paragraph wrapped to width.
+
+        Only wraps the Paragraph when the measurement is not in the cache, so
+        it must be wrapped again before it is drawn.
+
+        Args:
+            paragraph: A Paragraph to measure.
+            width: A float storing the width to wrap the Paragraph to.
+
+        Returns:
+            A tuple of the width and height the same as Paragraph.wrap.
+        """
+        height = self.get_height(paragraph, width)
+        if height is not None:
+            return width, height
+
+        with self.__lock:
+            key = self.__get_key(paragraph, width)
+            self.misses += 1
+
+        _, height = paragraph.wrap(width, 0)
+
+        with self.__lock:
+            self.__measurements[key] = height
+            self.__measurements.move_to_end(key)
+            while len(self.__measurements) > self.max_size:
+                self.__measurements.popitem(last=False)
+
+        return width, height
+
+    def clear(self):
+        """Remove all measurements and reset the hit and miss counts."""
+        with self.__lock:
+            self.__measurements.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+"""MeasurementCache shared by everything drawn on timeline PDFs."""
+measurement_cache = MeasurementCache()
+
+
+def is_wrapped_to(paragraph: Paragraph, width: float) -> bool:
+    """Test if a Paragraph was last wrapped for drawing to width.
+
+    Args:
+        paragraph: A Paragraph.
+        width: A float storing the width it will be drawn at.
+
+    Returns:
+        A bool set to True if it does not need wrapping again.
+    """
+    return getattr(paragraph, "width", None) == width
+
+
+def wrap_for_drawing(
+    paragraph: Paragraph, canvas: Canvas, width: float
+) -> Tuple[float, float]:
+    """Wrap a Paragraph measured with a MeasurementCache so it can be drawn.
+
+    Skips wrapping if the Paragraph was last wrapped to the same width.
+
+    Args:
+        paragraph: A Paragraph to wrap.
+        canvas: A Canvas the Paragraph will be drawn on.
+        width: A float storing the width to wrap the Paragraph to.
+
+    Returns:
+        A tuple of the width and height the same as Paragraph.wrapOn.
+    """
+    if is_wrapped_to(paragraph, width):
+        return paragraph.width, paragraph.height
+
+    return paragraph.wrapOn(canvas, width, 0)
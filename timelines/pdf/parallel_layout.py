@@ -0,0 +1,176 @@
+"""Contains functions to size and position the events on a timeline in a
+pool of worker processes.
+
+The PDFEvents are sized in worker processes and sent back with their
+Paragraphs already wrapped, ready to be drawn on the timeline's Canvas.
+Each PDFEventArea's events are then positioned in a worker process from
+plain Areas of the same size, and the coordinates copied back.  Everything
+is calculated by the same code as when it is done in one process, so the
+PDF is exactly the same.
+
+Functions:
+    size_pdf_events
+    place_pdf_events
+
+Usage:
+    pdf_events = size_pdf_events(
+        [(PDFEvent, {"time": "1 Jan 2000", ...}), ...], canvas
+    )
+    ...
+    overlap = place_pdf_events(
+        pdf_event_areas, pdf_events_by_area, "L", False
+    )
+"""
+
+import io
+import multiprocessing
+import os
+from concurrent.futures.process import BrokenProcessPool
+from math import ceil
+from typing import Any, Dict, List, Tuple, Type
+
+from reportlab.pdfgen.canvas import Canvas
+
+from .area import Area
+from .pdf_event import PDFEvent
+from .pdf_event_area import PDFEventArea
+from .process_pools import discard_process_pool, get_process_pool
+
+"""Name of the pool of worker processes laying out timelines."""
+LAYOUT_POOL = "layout"
+
+"""Number of worker processes laying out timelines."""
+LAYOUT_WORKERS = os.cpu_count() or 1
+
+"""Number of batches of PDFEvents given to each worker to size, so workers
+finishing early can take on more."""
+BATCHES_PER_WORKER = 4
+
+"""A PDFEvent class and the arguments to create it with, except canvas."""
+PDFEventSpec = Tuple[Type[PDFEvent], Dict[str, Any]]
+
+
+def _size_batch(pdf_event_specs: List[PDFEventSpec]) -> List[PDFEvent]:
+    """Creates PDFEvents on a Canvas only used for measuring and detaches
+    them from it so they can be sent to another process."""
+    canvas = Canvas(io.BytesIO())
+    pdf_events = []
+    for pdf_event_class, arguments in pdf_event_specs:
+        pdf_event = pdf_event_class(canvas=canvas, **arguments)
+        pdf_event.canvas = None
+        pdf_events.append(pdf_event)
+
+    return pdf_events
+
+
+def _place_area(
+    geometry: Tuple[float, float, float, float],
+    geometries: List[Tuple[float, float, float, float]],
+    orientation: str,
+    stacked: bool,
+) -> Tuple[List[Tuple[float, float]], float]:
+    """Positions Areas of the given geometries in a PDFEventArea and returns
+    their coordinates and the largest overlap."""
+    pdf_event_area = PDFEventArea(*geometry, None)
+    areas = [Area(*area_geometry) for area_geometry in geometries]
+    overlap = pdf_event_area.place_events(areas, orientation, stacked)
+
+    return [(area.x, area.y) for area in areas], overlap
+
+
+def _map(function, *iterables) -> list:
+    """Calls function on each set of arguments in the pool of worker
+    processes, or in this process if it is a daemon, which can not start
+    worker processes, or the pool is broken."""
+    if multiprocessing.current_process().daemon:
+        return list(map(function, *iterables))
+
+    process_pool = get_process_pool(LAYOUT_POOL, LAYOUT_WORKERS)
+    try:
+        return list(process_pool.map(function, *iterables))
+    except BrokenProcessPool:
+        discard_process_pool(LAYOUT_POOL, process_pool)
+        return list(map(function, *iterables))
+
+
+def size_pdf_events(
+    pdf_event_specs: List[PDFEventSpec], canvas: Canvas
+) -> List[PDFEvent]:
+    """Creates PDFEvents in the pool of worker processes.
+
+    Args:
+        pdf_event_specs: A list of tuples of a PDFEvent class and a dict of
+        the arguments to create it with, except canvas.
+        canvas: A Canvas to draw the PDFEvents on.
+
+    Returns:
+        A list of PDFEvents, in the same order as pdf_event_specs.
+    """
+    batch_size = max(
+        1, ceil(len(pdf_event_specs) / (LAYOUT_WORKERS * BATCHES_PER_WORKER))
+    )
+    batches = [
+        pdf_event_specs[start:start + batch_size]
+        for start in range(0, len(pdf_event_specs), batch_size)
+    ]
+
+    pdf_events = []
+    for batch in _map(_size_batch, batches):
+        for pdf_event in batch:
+            pdf_event.canvas = canvas
+            pdf_events.append(pdf_event)
+
+    return pdf_events
+
+
+def place_pdf_events(
+    pdf_event_areas: List[PDFEventArea],
+    pdf_events_by_area: List[List[PDFEvent]],
+    orientation: str,
+    stacked: bool,
+) -> float:
+    """Positions the PDFEvents in each PDFEventArea in the pool of worker
+    processes, the same as PDFEventArea.place_events.
+
+    Args:
+        pdf_event_areas: A list of PDFEventAreas.
+        pdf_events_by_area: A list of the lists of PDFEvents to position in
+        each PDFEventArea, with their preferred positions set.
+        orientation: A str holding L for a landscape timeline or P for
+        portrait.
+        stacked: A bool stating if the PDFEvents are sorted along the scale
+        and should be positioned with the skyline methods.
+
+    Returns:
+        A float storing the largest amount any PDFEvent overlaps the
+        expandable side of its PDFEventArea.
+    """
+    results = _map(
+        _place_area,
+        [
+            (area.x, area.y, area.width, area.height)
+            for area in pdf_event_areas
+        ],
+        [
+            [
+                (pdf_event.x, pdf_event.y, pdf_event.width, pdf_event.height)
+                for pdf_event in pdf_events
+            ]
+            for pdf_events in pdf_events_by_area
+        ],
+        [orientation] * len(pdf_event_areas),
+        [stacked] * len(pdf_event_areas),
+    )
+
+    max_overlap = 0
+    for pdf_event_area, pdf_events, (coordinates, overlap) in zip(
+        pdf_event_areas, pdf_events_by_area, results
+    ):
+        for pdf_event, (x, y) in zip(pdf_events, coordinates):
+            pdf_event.x, pdf_event.y = x, y
+            pdf_event_area.events.append(pdf_event)
+
+        if overlap > max_overlap:
+            max_overlap = overlap
+
+    return max_overlap
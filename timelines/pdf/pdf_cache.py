@@ -0,0 +1,198 @@
+"""Contains functions to cache the PDFs drawn for timelines.
+
+PDFs are stored in the Django cache named by PDF_CACHE_ALIAS, keyed on a
+fingerprint of everything drawn on them, so a timeline is only drawn again
+after it has changed.  The fingerprint is worked out again for every
+request, rather than remembered, so a change made by any process is seen by
+every other process, and the cache's size limit evicts PDFs that are no
+longer used.
+
+PDFs are drawn into a SpooledTemporaryFile, which moves to disk once it
+grows past PDF_SPOOL_MAX_SIZE, and only PDFs up to the PDF_CACHE_MAX_SIZE
+setting are cached, so the memory needed to serve a PDF does not grow with
+its size.
+
+Functions:
+    get_fingerprint
+    spool_timeline_pdf
+    draw_timeline_pdf_file
+    draw_timeline_pdf
+    open_timeline_pdf
+    get_timeline_pdf
+
+Usage:
+    pdf_data = get_timeline_pdf(
+        timeline,
+        PDFDateTimeTimeline,
+        DateTimeEvent.objects.filter(date_time_timeline=timeline),
+    )
+
+    with open_timeline_pdf(timeline, PDFDateTimeTimeline, events) as pdf_file:
+        chunk = pdf_file.read(65536)
+"""
+
+import hashlib
+import io
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Type
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import QuerySet
+
+from timelines.models import Timeline
+
+"""Name of the Django cache PDFs are stored in."""
+PDF_CACHE_ALIAS = "pdf"
+
+"""Version of the drawing code, change to stop PDFs drawn by older versions
+being served."""
+PDF_CACHE_VERSION = 1
+
+"""Largest PDF, in bytes, kept in memory while it is drawn, larger PDFs are
+moved to a temporary file."""
+PDF_SPOOL_MAX_SIZE = 1024 * 1024
+
+"""Largest PDF, in bytes, stored in the cache, larger PDFs are drawn each
+time they are needed rather than held in memory."""
+PDF_CACHE_MAX_SIZE = settings.PDF_CACHE_MAX_SIZE
+
+
+def _get_pdf_key(fingerprint: str) -> str:
+    """Get key to cache the PDF with a fingerprint under."""
+    return f"timeline-pdf-{PDF_CACHE_VERSION}-{fingerprint}"
+
+
+def get_fingerprint(timeline: Timeline, events: QuerySet) -> str:
+    """Get a hash of the fields of a timeline and everything drawn with it.
+
+    Args:
+        timeline: A subclass of Timeline.
+        events: A QuerySet of the timeline's Event subclasses.
+
+    Returns:
+        A str holding the hex digest of the hash.
+    """
+    event_tag_model = events.model.tags.through
+    rows = [
+        type(timeline).objects.filter(pk=timeline.pk).values_list(),
+        timeline.eventarea_set.order_by("pk").values_list(),
+        timeline.tag_set.order_by("pk").values_list(),
+        events.order_by("pk").values_list(),
+        event_tag_model.objects.filter(event__timeline=timeline)
+        .order_by("pk")
+        .values_list("event_id", "tag_id"),
+    ]
+
+    fingerprint = hashlib.sha256()
+    for query_set in rows:
+        fingerprint.update(repr(list(query_set)).encode())
+
+    return fingerprint.hexdigest()
+
+
+def spool_timeline_pdf(timeline: Timeline, pdf_class: Type) -> BinaryIO:
+    """Draw the PDF of a timeline into a SpooledTemporaryFile.
+
+    Args:
+        timeline: A subclass of Timeline.
+        pdf_class: A subclass of PDFTimeline to draw the timeline with.
+
+    Returns:
+        A SpooledTemporaryFile holding the PDF, at its start, which the
+        caller should close.
+    """
+    pdf_file = SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_SIZE)
+    pdf_class(
+        timeline,
+        parallel_layout=settings.PDF_PARALLEL_LAYOUT,
+        buffer=pdf_file,
+        incremental_layout=settings.PDF_INCREMENTAL_LAYOUT,
+    )
+    pdf_file.seek(0)
+    return pdf_file
+
+
+def draw_timeline_pdf_file(
+    timeline: Timeline, pdf_class: Type, fingerprint: str
+) -> BinaryIO:
+    """Get the PDF with a fingerprint as a file, only drawing it if it is
+    not cached.
+
+    Args:
+        timeline: A subclass of Timeline.
+        pdf_class: A subclass of PDFTimeline to draw the timeline with.
+        fingerprint: A str holding the fingerprint of the timeline.
+
+    Returns:
+        A binary file holding the PDF, at its start, which the caller should
+        close.
+    """
+    cache = caches[PDF_CACHE_ALIAS]
+    pdf_key = _get_pdf_key(fingerprint)
+    pdf_data = cache.get(pdf_key)
+    if pdf_data is not None:
+        return io.BytesIO(pdf_data)
+
+    pdf_file = spool_timeline_pdf(timeline, pdf_class)
+    if pdf_file.seek(0, io.SEEK_END) <= PDF_CACHE_MAX_SIZE:
+        pdf_file.seek(0)
+        cache.set(pdf_key, pdf_file.read())
+
+    pdf_file.seek(0)
+    return pdf_file
+
+
+def draw_timeline_pdf(
+    timeline: Timeline, pdf_class: Type, fingerprint: str
+) -> bytes:
+    """Get the PDF with a fingerprint, only drawing it if it is not cached.
+
+    Args:
+        timeline: A subclass of Timeline.
+        pdf_class: A subclass of PDFTimeline to draw the timeline with.
+        fingerprint: A str holding the fingerprint of the timeline.
+
+    Returns:
+        A bytes object holding the PDF.
+    """
+    with draw_timeline_pdf_file(timeline, pdf_class, fingerprint) as pdf_file:
+        return pdf_file.read()
+
+
+def open_timeline_pdf(
+    timeline: Timeline, pdf_class: Type, events: QuerySet
+) -> BinaryIO:
+    """Get the PDF of a timeline as a file, only drawing it if it is not
+    cached.
+
+    Args:
+        timeline: A subclass of Timeline.
+        pdf_class: A subclass of PDFTimeline to draw the timeline with.
+        events: A QuerySet of the timeline's Event subclasses.
+
+    Returns:
+        A binary file holding the PDF, at its start, which the caller should
+        close.
+    """
+    return draw_timeline_pdf_file(
+        timeline, pdf_class, get_fingerprint(timeline, events)
+    )
+
+
+def get_timeline_pdf(
+    timeline: Timeline, pdf_class: Type, events: QuerySet
+) -> bytes:
+    """Get the PDF of a timeline, only drawing it if it is not cached.
+
+    Args:
+        timeline: A subclass of Timeline.
+        pdf_class: A subclass of PDFTimeline to draw the timeline with.
+        events: A QuerySet of the timeline's Event subclasses.
+
+    Returns:
+        A bytes object holding the PDF.
+    """
+    return draw_timeline_pdf(
+        timeline, pdf_class, get_fingerprint(timeline, events)
+    )
@@ -5,20 +5,30 @@ Classes:
     PDFEvent
 """
 
+from math import sqrt
+from typing import Callable, List, Optional, Tuple
+
 from reportlab.lib.styles import ParagraphStyle
-from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.lib.units import mm
 from reportlab.pdfgen.canvas import Canvas
 from reportlab.platypus import Paragraph
 
 from .area import Area
+from .font_metrics import string_width
+from .measurement_cache import (
+    is_wrapped_to,
+    measurement_cache,
+    wrap_for_drawing,
+)
+from .wrap_estimator import WrapEstimator
 
 """Ideal ratio between width and height of a PDFEvent, if possible should be
 twice as wide a high."""
 WIDTH_HEIGHT_RATIO = 2.0
 
-"""Fraction to reduce width of PDFEvent by until it meets constraints of
-width / height ratio, minimum width and maximum height """
-INCREMENT_SIZE = 0.1
+"""Default largest gap left between the width chosen for a PDFEvent and the
+narrowest width meeting its constraints when searching for the best width."""
+WIDTH_TOLERANCE = 2 * mm
 
 
 class PDFEvent(Area):
@@ -37,8 +47,34 @@ class PDFEvent(Area):
         border_size: A float storing the gap between the Paragraphs and their
         bounding box.
         canvas: A Canvas to draw the Event on.
+        width_tolerance: A float storing the largest gap left between the
+        width chosen and the narrowest width meeting the constraints.
+        wrap_count: An int storing how many times the Paragraphs have been
+        wrapped while sizing this instance, not counting measurements found
+        in the measurement_cache.
+        wrap_estimators: A list of WrapEstimators for the Paragraphs, used to
+        estimate the best width before measuring the Paragraphs.
     """
 
+    __slots__ = (
+        "time_paragraph",
+        "title_paragraph",
+        "description_paragraph",
+        "tags_paragraph",
+        "wrap_estimators",
+        "border_size",
+        "canvas",
+        "width_tolerance",
+        "wrap_count",
+        "min_width",
+        "sized_to_ratio",
+        "sized_to_min_width",
+        "sized_to_max_width",
+        "sized_to_max_height",
+        "position_on_scale",
+        "text_width",
+    )
+
     def __init__(
         self,
         time: str,
@@ -54,6 +90,7 @@ class PDFEvent(Area):
         border_size: float,
         max_width: float = 0,
         max_height: float = 0,
+        width_tolerance: float = WIDTH_TOLERANCE,
     ):
         """Initialise Instance.
 
@@ -79,6 +116,8 @@ class PDFEvent(Area):
             on a portrait timeline.
             max_height: A float storing the maximum width the PDFEvent can be
             on a landscape timeline.
+            width_tolerance: A float storing the largest gap to leave between
+            the width chosen and the narrowest width meeting the constraints.
             position_on_scale: A float storing where along the scale (either x
             or y depending on timeline orientation) this instance should
             ideally be positioned.  Set by PDFTimeline.
@@ -98,23 +137,26 @@ class PDFEvent(Area):
             description, description_style
         )
         self.tags_paragraph: Paragraph = Paragraph(tags, tags_style)
+        self.wrap_estimators = self._create_wrap_estimators()
 
         self.border_size = border_size
         self.canvas = canvas
+        self.width_tolerance = width_tolerance
+        self.wrap_count = 0
 
         self.x = 0
         self.y = 0
 
-        time_width = stringWidth(
+        time_width = string_width(
             time, time_style.fontName, time_style.fontSize
         )
-        title_width = stringWidth(
+        title_width = string_width(
             title, title_style.fontName, title_style.fontSize
         )
-        description_width = stringWidth(
+        description_width = string_width(
             description, description_style.fontName, description_style.fontSize
         )
-        tags_width = stringWidth(
+        tags_width = string_width(
             tags, tags_style.fontName, tags_style.fontSize
         )
 
@@ -146,30 +188,206 @@ class PDFEvent(Area):
             )
 
         self.width = self.text_width + (2 * self.border_size)
-        self.time_paragraph.wrapOn(self.canvas, self.text_width, 0)
-        self.title_paragraph.wrapOn(self.canvas, self.text_width, 0)
-        self.description_paragraph.wrapOn(self.canvas, self.text_width, 0)
-        self.tags_paragraph.wrapOn(self.canvas, self.text_width, 0)
+        self._wrap_paragraphs(self.text_width)
+
+    def _wrap_paragraphs(self, width: float) -> float:
+        """Wraps the Paragraphs to the width they will be drawn at and
+        returns their total height."""
+        for paragraph in self._get_paragraphs():
+            if not is_wrapped_to(paragraph, width):
+                self.wrap_count += 1
+
+        _, time_height = wrap_for_drawing(
+            self.time_paragraph, self.canvas, width
+        )
+        _, title_height = wrap_for_drawing(
+            self.title_paragraph, self.canvas, width
+        )
+        _, description_height = wrap_for_drawing(
+            self.description_paragraph, self.canvas, width
+        )
+        _, tags_height = wrap_for_drawing(
+            self.tags_paragraph, self.canvas, width
+        )
+
+        return time_height + title_height + description_height + tags_height
+
+    def _get_paragraphs(self) -> List[Paragraph]:
+        """Gets the Paragraphs in the order they are drawn."""
+        return [
+            self.time_paragraph,
+            self.title_paragraph,
+            self.description_paragraph,
+            self.tags_paragraph,
+        ]
 
     def _get_dimensions(self, width: float):
         """Calculates the total width and height needed to display the time,
-        title and description Paragraphs for a given width."""
-        time_width, time_height = self.time_paragraph.wrap(width, 0)
-        title_width, title_height = self.title_paragraph.wrap(width, 0)
+        title and description Paragraphs for a given width.
+
+        Measures the Paragraphs through the shared measurement_cache, so they
+        are not left wrapped to width."""
+        # measurement_cache gives the width the Paragraphs are wrapped to
         (
-            description_width,
+            time_height,
+            title_height,
             description_height,
-        ) = self.description_paragraph.wrap(width, 0)
-        tags_width, tags_height = self.tags_paragraph.wrap(width, 0)
-
-        max_width = max(
-            max(time_width, title_width), max(description_width, tags_width)
-        )
+            tags_height,
+        ) = [
+            self.__get_height(paragraph, width)
+            for paragraph in self._get_paragraphs()
+        ]
         total_height = (
             time_height + title_height + description_height + tags_height
         )
 
-        return max_width, total_height
+        return width, total_height
+
+    def __get_height(self, paragraph: Paragraph, width: float) -> float:
+        """Gets the height of a Paragraph wrapped to width through the
+        measurement_cache, counting it in wrap_count if it is wrapped."""
+        height = measurement_cache.get_height(paragraph, width)
+        if height is None:
+            _, height = measurement_cache.wrap(paragraph, width)
+            self.wrap_count += 1
+
+        return height
+
+    def _create_wrap_estimators(self) -> List[WrapEstimator]:
+        """Creates a WrapEstimator for each of the Paragraphs."""
+        return [
+            WrapEstimator(paragraph.text, paragraph.style)
+            for paragraph in self._get_paragraphs()
+        ]
+
+    def _estimate_width(
+        self,
+        narrow_width: float,
+        wide_width: float,
+        fits: Callable[[float, float], bool],
+    ) -> float:
+        """Estimates the narrowest width between narrow_width and wide_width
+        at which the Paragraphs fit, using the wrap_estimators instead of
+        measuring the Paragraphs.
+
+        Args:
+            narrow_width: A float storing the narrowest width to consider.
+            wide_width: A float storing the widest width to consider, which
+            the Paragraphs should fit at.
+            fits: A function taking a width and height and returning if a
+            layout of that size meets the constraints, which must not change
+            from True to False as the width increases.
+
+        Returns:
+            A float storing the width estimated to within a quarter of
+            width_tolerance.
+        """
+        def estimate_fits(width: float) -> bool:
+            height = sum(
+                estimator.get_height(width)
+                for estimator in self.wrap_estimators
+            )
+            return fits(width, height)
+
+        if estimate_fits(narrow_width):
+            return narrow_width
+
+        while (wide_width - narrow_width) > (self.width_tolerance / 4):
+            width = (narrow_width + wide_width) / 2
+            if estimate_fits(width):
+                wide_width = width
+            else:
+                narrow_width = width
+
+        return wide_width
+
+    def _search_width(
+        self,
+        wide: Tuple[float, float],
+        fits: Callable[[float, float], bool],
+        get_lower_limit: Callable[[float, float], float],
+        get_guess: Optional[Callable[..., float]] = None,
+        failed: Optional[Tuple[float, float]] = None,
+        estimate: Optional[float] = None,
+    ):
+        """Searches for the narrowest layout of the Paragraphs which fits.
+
+        Narrows the gap between the narrowest width that could fit and the
+        narrowest layout known to fit until they are within width_tolerance
+        of each other.  If given, the estimate is tried first along with the
+        width just past it on the other side of the answer, which finishes
+        the search when the estimate is right.  After that each step
+        alternates between trying the width get_guess predicts and bisecting
+        the gap, so a good guess finishes the search in a couple of steps and
+        a bad one can not slow it down by more than half.
+
+        Args:
+            wide: A tuple of the width and height of a layout which fits.
+            fits: A function taking a width and height and returning if a
+            layout of that size meets the constraints, which must not change
+            from True to False as the width increases.
+            get_lower_limit: A function taking the width and height of a
+            layout which fits and returning the narrowest width any narrower
+            layout could fit at.
+            get_guess: A function taking the narrowest layout tried which
+            does not fit, or None, and the narrowest layout which does and
+            returning a width likely to be close to the narrowest that fits.
+            failed: A tuple of the width and height of a layout which does
+            not fit, if one is already known.
+            estimate: A float storing a width estimated to be the narrowest
+            that fits, from _estimate_width.
+
+        Returns:
+            A tuple of the narrowest layout tried which does not fit, or None
+            if no layout narrower than wide was tried, and the narrowest
+            layout found which does fit.
+        """
+        lower_limit = get_lower_limit(*wide)
+        if failed is not None:
+            lower_limit = max(lower_limit, failed[0])
+
+        widths_to_try = [] if estimate is None else [estimate]
+        use_guess = get_guess is not None
+        while (wide[0] - lower_limit) > self.width_tolerance:
+            if widths_to_try:
+                width = widths_to_try.pop()
+                if not (lower_limit < width < wide[0]):
+                    continue
+            else:
+                width = (lower_limit + wide[0]) / 2
+                if use_guess:
+                    guess = get_guess(failed, wide)
+                    if lower_limit < guess < wide[0]:
+                        width = guess
+                use_guess = (get_guess is not None) and (not use_guess)
+
+            layout = self._get_dimensions(width)
+            layout_fits = fits(*layout)
+            if layout_fits:
+                wide = layout
+                lower_limit = max(lower_limit, get_lower_limit(*layout))
+            else:
+                failed = layout
+                lower_limit = max(lower_limit, width)
+
+            if width == estimate:
+                # confirm the estimate from the other side of the answer
+                if layout_fits:
+                    widths_to_try.append(width - (self.width_tolerance / 2))
+                else:
+                    widths_to_try.append(width + (self.width_tolerance / 2))
+
+        return failed, wide
+
+    def __guess_ratio_width(
+        self,
+        failed: Optional[Tuple[float, float]],
+        wide: Tuple[float, float],
+    ) -> float:
+        """Guesses the width at which the text meets WIDTH_HEIGHT_RATIO by
+        assuming its area stays the same as in the narrowest layout tried."""
+        width, height = wide if failed is None else failed
+        return sqrt(WIDTH_HEIGHT_RATIO * width * height)
 
     def __landscape_init(
         self,
@@ -187,27 +405,47 @@ class PDFEvent(Area):
             time_width, title_width, description_width, tags_width
         )
         min_width = time_width
+        self.min_width = min_width + (2 * self.border_size)
 
-        width, height = self._get_dimensions(init_width)
-        best_width, best_height = width, height
-        width_reduction_increment = width * INCREMENT_SIZE
+        def fits(width: float, height: float) -> bool:
+            return (
+                ((width / height) >= target_ratio)
+                and (width >= min_width)
+                and (height <= max_height)
+            )
 
-        # reduce width until within parameters
-        while (
-            ((width / height) >= target_ratio)
-            and (width >= min_width)
-            and (height <= max_height)
-        ):
-            best_width, best_height = width, height
-            new_width = width - width_reduction_increment
-            width, height = self._get_dimensions(new_width)
+        def get_lower_limit(width: float, height: float) -> float:
+            # narrower layouts are at least as high so need at least this
+            # width to meet the target ratio
+            return max(min_width, height * target_ratio)
 
-        self.min_width = min_width + (2 * self.border_size)
-        self.sized_to_ratio = ((width / height) < target_ratio)
-        self.sized_to_min_width = (width < min_width)
-        self.sized_to_max_height = (height > max_height)
+        best = self._get_dimensions(init_width)
+        if fits(*best):
+            estimate = self._estimate_width(
+                get_lower_limit(*best), best[0], fits
+            )
+            failed, best = self._search_width(
+                best,
+                fits,
+                get_lower_limit,
+                self.__guess_ratio_width,
+                estimate=estimate,
+            )
+        else:
+            failed = best
+
+        if failed is None:
+            self.sized_to_min_width = (
+                (best[0] - min_width) <= self.width_tolerance
+            )
+            self.sized_to_ratio = not self.sized_to_min_width
+        else:
+            width, height = failed
+            self.sized_to_ratio = ((width / height) < target_ratio)
+            self.sized_to_min_width = (width < min_width)
+            self.sized_to_max_height = (height > max_height)
 
-        return best_width, best_height
+        return best
 
     def __portrait_init(
         self,
@@ -227,26 +465,43 @@ class PDFEvent(Area):
         internal_max_width = max_width - (2 * self.border_size)
         init_width = min(largest_width, internal_max_width)
         min_width = min(time_width, internal_max_width)
+        self.min_width = min_width + (2 * self.border_size)
 
-        width, height = self._get_dimensions(init_width)
-        best_width, best_height = width, height
-        width_reduction_increment = width * INCREMENT_SIZE
+        def fits(width: float, height: float) -> bool:
+            return ((width / height) >= target_ratio) and (width >= min_width)
 
-        # reduce width until within parameters
-        while (
-            ((width / height) >= target_ratio)
-            and (width >= min_width)
-        ):
-            best_width, best_height = width, height
-            new_width = width - width_reduction_increment
-            width, height = self._get_dimensions(new_width)
+        def get_lower_limit(width: float, height: float) -> float:
+            # narrower layouts are at least as high so need at least this
+            # width to meet the target ratio
+            return max(min_width, height * target_ratio)
 
-        self.min_width = min_width + (2 * self.border_size)
-        self.sized_to_ratio = ((width / height) < target_ratio)
-        self.sized_to_min_width = (width < min_width)
-        self.sized_to_max_width = (width == internal_max_width)
+        best = self._get_dimensions(init_width)
+        if fits(*best):
+            estimate = self._estimate_width(
+                get_lower_limit(*best), best[0], fits
+            )
+            failed, best = self._search_width(
+                best,
+                fits,
+                get_lower_limit,
+                self.__guess_ratio_width,
+                estimate=estimate,
+            )
+        else:
+            failed = best
+
+        if failed is None:
+            self.sized_to_min_width = (
+                (best[0] - min_width) <= self.width_tolerance
+            )
+            self.sized_to_ratio = not self.sized_to_min_width
+        else:
+            width, height = failed
+            self.sized_to_ratio = ((width / height) < target_ratio)
+            self.sized_to_min_width = (width < min_width)
+            self.sized_to_max_width = (width == internal_max_width)
 
-        return best_width, best_height
+        return best
 
     def draw(self):
         """Draw PDFEvent on it's canvas."""
@@ -295,6 +550,9 @@ class PDFEvent(Area):
 
 class PDFEventEmpty(PDFEvent):
     """An empty PDFEvent for testing only."""
+
+    __slots__ = ()
+
     def __init__(self, x: float, y: float, width: float, height: float):
         """Initialise Instance.
 
@@ -12,8 +12,14 @@ from reportlab.lib.units import mm
 from timelines.models import EventArea
 
 from .area import Area
+from .event_index import EventIndex
 from .inside import Inside
 from .pdf_event import PDFEvent
+from .skyline import Skyline
+
+"""Default maximum number of candidate positions search_landscape_position
+and search_portrait_position will test before giving up."""
+DEFAULT_SEARCH_BUDGET = 10000
 
 
 class PDFEventArea(Area):
@@ -28,8 +34,33 @@ class PDFEventArea(Area):
     Attributes:
         event_area: A EventArea instance this represents on the Canvas.
         events: A list of PDFEvent instances to contained in this area.
+        event_index: An EventIndex of the PDFEvent instances in events, used
+        to find overlapping events without testing every one of them.  Kept
+        up to date with events each time it is used.
+        search_count: An int storing how many candidate positions the last
+        call to search_landscape_position or search_portrait_position tested.
+        search_budget_exhausted: A bool set to True when the last call to
+        search_landscape_position or search_portrait_position ran out of
+        budget before testing every candidate position.
+        skyline: A Skyline of the PDFEvent instances positioned by
+        skyline_landscape_position or skyline_portrait_position.
+        search_span: A pair of floats storing the start and end, along the
+        scale axis (x for landscape and y for portrait), of every candidate
+        position tested by the last call to a method positioning an Area.
+        Only the Areas already positioned across this span can change where
+        that Area is positioned.
     """
 
+    __slots__ = (
+        "event_area",
+        "events",
+        "event_index",
+        "search_count",
+        "search_budget_exhausted",
+        "skyline",
+        "search_span",
+    )
+
     def __init__(
         self,
         x: float,
@@ -51,6 +82,11 @@ class PDFEventArea(Area):
         Area.__init__(self, x, y, width, height)
         self.event_area = event_area
         self.events: List[PDFEvent] = []
+        self.event_index: Union[EventIndex, None] = None
+        self.search_count = 0
+        self.search_budget_exhausted = False
+        self.skyline: Union[Skyline, None] = None
+        self.search_span = (0.0, 0.0)
 
     def get_landscape_position(
         self,
@@ -92,7 +128,7 @@ class PDFEventArea(Area):
         if (fully_inside or right_outside_only) is False:
             return best_position
 
-        overlap_area = self.__get_overlapping_area(area)
+        overlap_area = self.__get_overlapping_area(area, "x")
         if overlap_area is None:
             return area.x, area.y
         else:
@@ -174,7 +210,7 @@ class PDFEventArea(Area):
         if (fully_inside or bottom_overlap_only) is False:
             return best_position
 
-        overlap_area = self.__get_overlapping_area(area)
+        overlap_area = self.__get_overlapping_area(area, "y")
         if overlap_area is None:
             return area.x, area.y
         else:
@@ -215,18 +251,483 @@ class PDFEventArea(Area):
 
             return updated_best_position
 
-    def __get_overlapping_area(self, area: Area) -> Union[PDFEvent, None]:
+    def search_landscape_position(
+        self,
+        area: Area,
+        gap: float = mm,
+        budget: int = DEFAULT_SEARCH_BUDGET,
+    ) -> Union[tuple[float, float], None]:
+        """Finds the closest position to the current position of an Area that
+        it can be placed in this PDFEventArea instance.
+
+        Gives the same result as get_landscape_position(area, True, True)
+        but searches without recursion and tests each candidate position only
+        once, however many collisions lead to it.
+
+        Args:
+            area: An Area instance to find the best position for.
+            gap: A float storing the minimum gap that should be between two
+            PDFEvent instances.
+            budget: An int storing the maximum number of candidate positions
+            to test.  If reached, search_budget_exhausted is set to True and
+            the best position found from the candidates tested is returned.
+
+        return:
+            A pair of floats storing coordinates of the best position found
+            for Area. Or None if Area is too big to fit into this instance.
+        """
+        return self.__search(area, "L", gap, budget)
+
+    def search_portrait_position(
+        self,
+        area: Area,
+        gap: float = mm,
+        budget: int = DEFAULT_SEARCH_BUDGET,
+    ) -> Union[tuple[float, float], None]:
+        """Finds the closest position to the current position of an Area that
+        it can be placed in this PDFEventArea instance.
+
+        Gives the same result as get_portrait_position(area, True, True)
+        but searches without recursion and tests each candidate position only
+        once, however many collisions lead to it.
+
+        Args:
+            area: An Area instance to find the best position for.
+            gap: A float storing the minimum gap that should be between two
+            PDFEvent instances.
+            budget: An int storing the maximum number of candidate positions
+            to test.  If reached, search_budget_exhausted is set to True and
+            the best position found from the candidates tested is returned.
+
+        return:
+            A pair of floats storing coordinates of the best position found
+            for Area. Or None if Area is too big to fit into this instance.
+        """
+        return self.__search(area, "P", gap, budget)
+
+    def skyline_landscape_position(
+        self, area: Area, gap: float = mm
+    ) -> Union[tuple[float, float], None]:
+        """Finds the lowest position an Area can be placed in this
+        PDFEventArea at or to the right of its current position.
+
+        Areas must be positioned in order of their x coordinate, each is
+        dropped onto those already positioned and moved right only when it
+        would otherwise go over the top of this PDFEventArea.
+
+        Args:
+            area: An Area instance to find the position for.
+            gap: A float storing the minimum gap that should be between two
+            PDFEvent instances.
+
+        return:
+            A pair of floats storing coordinates of the position found for
+            Area. Or None if Area is too big to fit into this instance.
+        """
+        self.search_span = (area.x, area.right())
+        if area.height > self.height:
+            return None
+
+        position = self.__skyline_place(
+            area.x, area.width, area.height, self.height
+        )
+        self.__raise_skyline(*position, area.width, area.height, "L", gap)
+        self.search_span = (area.x, position[0] + area.width)
+        return position
+
+    def skyline_portrait_position(
+        self, area: Area, gap: float = mm
+    ) -> Union[tuple[float, float], None]:
+        """Finds the left most position an Area can be placed in this
+        PDFEventArea at or below its current position.
+
+        Areas must be positioned in order of the y coordinate of their top
+        edge from highest to lowest, each is placed against those already
+        positioned and moved down only when it would otherwise go over the
+        right edge of this PDFEventArea.
+
+        Args:
+            area: An Area instance to find the position for.
+            gap: A float storing the minimum gap that should be between two
+            PDFEvent instances.
+
+        return:
+            A pair of floats storing coordinates of the position found for
+            Area. Or None if Area is too big to fit into this instance.
+        """
+        self.search_span = (area.y, area.top())
+        if area.width > self.width:
+            return None
+
+        # measure down from the top so the skyline runs towards the bottom
+        # edge which can be expanded
+        start, x = self.__skyline_place(
+            -area.top(), area.height, area.width, self.width
+        )
+        y = -start - area.height
+        self.__raise_skyline(x, y, area.width, area.height, "P", gap)
+        self.search_span = (y, area.top())
+        return x, y
+
+    def place_events(
+        self, areas: List[Area], orientation: str, stacked: bool
+    ) -> float:
+        """Positions Areas in this PDFEventArea in order, each starting from
+        its preferred position, and adds them to events.
+
+        Args:
+            areas: A list of Area instances, usually PDFEvents, each with its
+            x (landscape) or y (portrait) coordinate set to its preferred
+            position.
+            orientation: A str holding L for a landscape timeline or P for
+            portrait.
+            stacked: A bool stating if the Areas are sorted along the scale
+            and should be positioned with the skyline methods rather than
+            searched for.
+
+        Returns:
+            A float storing the largest amount any of the Areas overlap the
+            expandable side of this PDFEventArea, right for landscape and
+            bottom for portrait.
+        """
+        max_overlap = 0
+        for area in areas:
+            overlap = self.place_event(area, orientation, stacked)
+            if overlap > max_overlap:
+                max_overlap = overlap
+
+        return max_overlap
+
+    def place_event(
+        self, area: Area, orientation: str, stacked: bool
+    ) -> float:
+        """Positions an Area in this PDFEventArea, starting from its preferred
+        position, and adds it to events.
+
+        Args:
+            area: An Area instance, usually a PDFEvent, with its x (landscape)
+            or y (portrait) coordinate set to its preferred position.
+            orientation: A str holding L for a landscape timeline or P for
+            portrait.
+            stacked: A bool stating if the Area should be positioned with the
+            skyline methods rather than searched for.
+
+        Returns:
+            A float storing the amount the Area overlaps the expandable side
+            of this PDFEventArea.
+        """
+        coordinates = self.__get_position(area, orientation, stacked)
+        if coordinates is not None:
+            area.x, area.y = coordinates
+
+        # todo - handle case were coordinates is none
+
+        self.events.append(area)
+
+        # todo - handle case where event is too big to fit event area
+        return self.__get_overlap(area, orientation)
+
+    def add_placed_event(
+        self,
+        area: Area,
+        x: float,
+        y: float,
+        orientation: str,
+        stacked: bool,
+        gap: float = mm,
+    ) -> float:
+        """Adds an Area to events at a position found for it before, such as
+        by place_event when the timeline was last drawn, without searching
+        for it again.
+
+        When stacked the skyline is raised the same as when the Area was
+        positioned, so Areas positioned after it are positioned the same.
+
+        Args:
+            area: An Area instance, usually a PDFEvent.
+            x: A float storing the x coordinate to position the Area at.
+            y: A float storing the y coordinate to position the Area at.
+            orientation: A str holding L for a landscape timeline or P for
+            portrait.
+            stacked: A bool stating if the Area was positioned with the
+            skyline methods.
+            gap: A float storing the minimum gap that should be between two
+            PDFEvent instances.
+
+        Returns:
+            A float storing the amount the Area overlaps the expandable side
+            of this PDFEventArea.
+        """
+        area.x, area.y = x, y
+        if stacked:
+            self.__raise_skyline(
+                x, y, area.width, area.height, orientation, gap
+            )
+
+        self.events.append(area)
+        return self.__get_overlap(area, orientation)
+
+    def __get_position(
+        self, area: Area, orientation: str, stacked: bool
+    ) -> Union[tuple[float, float], None]:
+        """Get the best position for area in this PDFEventArea, making sure
+        it does not overlap any other Areas or any part of this PDFEventArea
+        which cannot be expanded."""
+        if orientation == "L":
+            if stacked:
+                return self.skyline_landscape_position(area)
+            return self.search_landscape_position(area)
+        else:
+            if stacked:
+                return self.skyline_portrait_position(area)
+            return self.search_portrait_position(area)
+
+    def __get_overlap(self, area: Area, orientation: str) -> float:
+        """Get how much area overlaps the expandable side (right for
+        landscape and bottom for portrait) of this PDFEventArea."""
+        inside_event_area = Inside(area, self)
+        if orientation == "L":
+            if inside_event_area.test(right_inside=False):
+                return abs(area.right() - self.width)
+        else:
+            if inside_event_area.test(bottom_inside=False):
+                return abs(area.y)
+
+        return 0
+
+    def __skyline_place(
+        self,
+        start: float,
+        length: float,
+        size: float,
+        limit: float,
+    ) -> tuple[float, float]:
+        """Get the first position at or after start along the skyline where
+        something length long fits at the skyline's level without going past
+        limit.
+
+        Returns the position along the skyline and the level."""
+        if self.skyline is None:
+            self.skyline = Skyline()
+
+        level = self.skyline.get_level(start, start + length)
+        while level + size > limit:
+            start = self.skyline.get_next_start(start)
+            level = self.skyline.get_level(start, start + length)
+
+        return start, level
+
+    def __raise_skyline(
+        self,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        orientation: str,
+        gap: float,
+    ):
+        """Raise the skyline over an Area positioned at x, y.
+
+        The skyline is raised for a gap after it along the scale too, so the
+        next Area moved along the skyline does not touch it.  It is worked
+        out from the Area's coordinates alone, so an Area added at a stored
+        position raises it exactly the same as when it was positioned."""
+        if self.skyline is None:
+            self.skyline = Skyline()
+
+        if orientation == "L":
+            self.skyline.raise_level(x, x + width + gap, y + height + gap)
+        else:
+            # measured down from the top, the same as skyline_portrait_position
+            start = -(y + height)
+            self.skyline.raise_level(
+                start, start + height + gap, x + width + gap
+            )
+
+    def __search(
+        self,
+        area: Area,
+        orientation: str,
+        gap: float,
+        budget: int,
+    ) -> Union[tuple[float, float], None]:
+        """Searches the same tree of candidate positions as the recursive
+        get_landscape_position and get_portrait_position methods using a
+        stack.
+
+        Each candidate is identified by its coordinates and the directions it
+        may still search in.  The best position found below a candidate is
+        stored the first time it is calculated and reused each time the
+        candidate is reached again.  Candidates are combined in the same
+        order as the recursive methods so __get_best_position breaks ties in
+        the same way.  Candidates are the same size as area so only their
+        coordinates are kept, rather than creating an Area for each one.
+        """
+        self.search_count = 0
+        self.search_budget_exhausted = False
+
+        width, height = area.width, area.height
+        axis = "x" if orientation == "L" else "y"
+        event_index = self.__get_event_index(axis)
+
+        # best position found for each candidate, None if it has no position
+        results = {}
+        # each frame is [key, candidates still to combine, best]
+        root_key = (area.x, area.y, True, True)
+        stack = [[root_key, None, None]]
+        searching = {root_key}
+        # start of candidates tested furthest along the scale each way
+        span_start = span_end = area.x if orientation == "L" else area.y
+
+        while len(stack) > 0:
+            frame = stack[-1]
+            key, candidates, best = frame
+            x, y = key[0], key[1]
+
+            if candidates is None:
+                if self.search_count >= budget:
+                    self.search_budget_exhausted = True
+                    results[key] = None
+                    searching.discard(stack.pop()[0])
+                    continue
+
+                self.search_count += 1
+                position = x if orientation == "L" else y
+                if position < span_start:
+                    span_start = position
+                elif position > span_end:
+                    span_end = position
+
+                can_expand = self.__can_expand_into(
+                    x, y, width, height, orientation
+                )
+                overlap_area = None
+                if can_expand:
+                    overlap_area = event_index.get_overlapping_area_at(
+                        x, y, width, height
+                    )
+
+                if not can_expand:
+                    results[key] = None
+                    searching.discard(stack.pop()[0])
+                    continue
+
+                if overlap_area is None:
+                    results[key] = (x, y)
+                    searching.discard(stack.pop()[0])
+                    continue
+
+                candidates = self.__get_search_keys(
+                    key, width, height, overlap_area, orientation, gap
+                )
+                candidates.reverse()
+                frame[1] = candidates
+
+            # combine candidates already searched, stop at first unsearched
+            while len(candidates) > 0:
+                candidate_key = candidates[-1]
+                if candidate_key in results:
+                    candidates.pop()
+                    best = self.__get_best_position(
+                        (x, y), best, results[candidate_key], orientation
+                    )
+                elif candidate_key in searching:
+                    # candidate leads back to itself so can't be used
+                    candidates.pop()
+                else:
+                    stack.append([candidate_key, None, None])
+                    searching.add(candidate_key)
+                    break
+
+            frame[2] = best
+            if len(candidates) == 0:
+                results[key] = best
+                searching.discard(stack.pop()[0])
+
+        self.search_span = (
+            span_start,
+            span_end + (width if orientation == "L" else height),
+        )
+        return results[root_key]
+
+    def __can_expand_into(
+        self,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        orientation: str,
+    ) -> bool:
+        """Test if an area with the given geometry is inside this
+        PDFEventArea or only overlaps the edge which can be expanded, right
+        for landscape or bottom for portrait.
+
+        Tests the same edges as Inside with relative coordinates."""
+        if x < 0 or y + height > self.height:
+            return False
+
+        if orientation == "L":
+            return y >= 0
+        else:
+            return x + width <= self.width
+
+    def __get_search_keys(
+        self,
+        key: tuple[float, float, bool, bool],
+        width: float,
+        height: float,
+        overlap_area: Area,
+        orientation: str,
+        gap: float,
+    ) -> List[tuple[float, float, bool, bool]]:
+        """Get the keys of the candidate positions to search around
+        overlap_area in the order the recursive methods search them.
+
+        Calculates the same coordinates as Area.get_area_above and the other
+        methods creating Areas next to another."""
+        x, y, search_before, search_after = key
+        above_y = overlap_area.y + overlap_area.height + gap
+        right_x = overlap_area.x + overlap_area.width + gap
+        keys = []
+        if orientation == "L":
+            keys.append((x, above_y, True, True))
+            if search_before:
+                keys.append((overlap_area.x - width - gap, y, True, False))
+            if search_after:
+                keys.append((right_x, y, False, True))
+        else:
+            keys.append((right_x, y, True, True))
+            if search_before:
+                keys.append((x, above_y, True, False))
+            if search_after:
+                keys.append((x, overlap_area.y - height - gap, False, True))
+
+        return keys
+
+    def __get_overlapping_area(
+        self, area: Area, axis: str
+    ) -> Union[PDFEvent, None]:
         """Gets 1st Area that overlaps with event.
 
         Assumes Areas already in this PDFEventArea have been positioned in
-        order and without overlapping any others.
+        order and without overlapping any others.  Only the Areas near event
+        along axis (x for landscape and y for portrait) are tested.
 
         Return None is there are no overlapping events."""
-        for positioned_event in self.events:
-            if area.overlaps(positioned_event):
-                return positioned_event
-
-        return None
+        return self.__get_event_index(axis).get_overlapping_area(area)
+
+    def __get_event_index(self, axis: str) -> EventIndex:
+        """Get event_index up to date with events, rebuilding it if axis
+        changes or events is replaced."""
+        if (
+            self.event_index is None
+            or self.event_index.axis != axis
+            or len(self.event_index) > len(self.events)
+        ):
+            self.event_index = EventIndex(axis)
+
+        self.event_index.sync(self.events)
+        return self.event_index
 
     def __get_best_position(
         self,
@@ -0,0 +1,200 @@
+"""Contains functions to draw timeline PDFs in background processes.
+
+Jobs are stored as PDFJob rows, so no message broker is needed, and are run
+by worker processes polling the database for queued jobs, see the
+run_pdf_jobs management command.  Every worker on every server takes jobs
+from the same table, so a job is not lost when the web process that queued
+it stops.  There is one job for each fingerprint of a timeline, so several
+requests for the same PDF share the job started by the first of them.
+
+Each job's PDF is written to a file in the default storage, which is
+deleted along with the job, see timelines.signals, rather than kept in the
+database.  Finished jobs are removed once they are older than
+PDF_JOB_EXPIRY.
+
+Functions:
+    enqueue_pdf_job
+    requeue_lost_pdf_jobs
+    run_next_pdf_job
+    run_pdf_job
+
+Usage:
+    pdf_job = enqueue_pdf_job(
+        timeline,
+        PDFDateTimeTimeline,
+        DateTimeEvent.objects.filter(date_time_timeline=timeline),
+    )
+    ...
+    # in a worker process
+    requeue_lost_pdf_jobs()
+    run_next_pdf_job()
+    ...
+    pdf_job.refresh_from_db()
+    if pdf_job.status == PDFJob.STATUS_DONE:
+        pdf_file = pdf_job.pdf_file.open("rb")
+"""
+
+import logging
+from datetime import timedelta
+from typing import Type
+
+from django.apps import apps
+from django.core.files import File
+from django.db.models import QuerySet
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from timelines.models import PDFJob, Timeline
+
+from .pdf_cache import draw_timeline_pdf_file, get_fingerprint
+
+logger = logging.getLogger(__name__)
+
+"""Error shown for a failed job, the exception itself is only logged."""
+PDF_JOB_ERROR = "The PDF could not be drawn, please try again later."
+
+"""Time after which a job that has not finished is assumed to have been
+lost, for example when its worker process stopped while it was running."""
+PDF_JOB_TIMEOUT = timedelta(minutes=10)
+
+"""Time after which a finished job is removed, along with its PDF."""
+PDF_JOB_EXPIRY = timedelta(days=1)
+
+
+def _needs_restart(pdf_job: PDFJob) -> bool:
+    """Check whether a job failed or was lost."""
+    if pdf_job.status == PDFJob.STATUS_FAILED:
+        return True
+
+    return (
+        pdf_job.status != PDFJob.STATUS_DONE
+        and pdf_job.updated < timezone.now() - PDF_JOB_TIMEOUT
+    )
+
+
+def enqueue_pdf_job(
+    timeline: Timeline, pdf_class: Type, events: QuerySet
+) -> PDFJob:
+    """Get the job drawing the current version of a timeline's PDF,
+    starting one if there is not one already.
+
+    The job is queued for a worker process to run.  Failed and lost jobs
+    are queued again and jobs for earlier versions of the timeline are
+    removed, unless they are still running, as are the jobs of any timeline
+    that finished more than PDF_JOB_EXPIRY ago.
+
+    Args:
+        timeline: A subclass of Timeline.
+        pdf_class: A subclass of PDFTimeline to draw the timeline with.
+        events: A QuerySet of the timeline's Event subclasses.
+
+    Returns:
+        A PDFJob, which may already be finished.
+    """
+    PDFJob.objects.filter(
+        status__in=[PDFJob.STATUS_DONE, PDFJob.STATUS_FAILED],
+        updated__lt=timezone.now() - PDF_JOB_EXPIRY,
+    ).delete()
+
+    fingerprint = get_fingerprint(timeline, events)
+    PDFJob.objects.filter(timeline_id=timeline.pk).exclude(
+        fingerprint=fingerprint
+    ).exclude(
+        status=PDFJob.STATUS_RUNNING,
+        updated__gte=timezone.now() - PDF_JOB_TIMEOUT,
+    ).delete()
+
+    pdf_job, created = PDFJob.objects.get_or_create(
+        timeline_id=timeline.pk,
+        fingerprint=fingerprint,
+        defaults={
+            "timeline_model": timeline._meta.label,
+            "pdf_class": f"{pdf_class.__module__}.{pdf_class.__qualname__}",
+        },
+    )
+    if not created and _needs_restart(pdf_job):
+        # only one of several requests retrying a job restarts it
+        PDFJob.objects.filter(
+            id=pdf_job.id, status=pdf_job.status, updated=pdf_job.updated
+        ).update(
+            status=PDFJob.STATUS_QUEUED, error="", updated=timezone.now()
+        )
+        pdf_job.refresh_from_db()
+
+    return pdf_job
+
+
+def requeue_lost_pdf_jobs() -> int:
+    """Queue again the jobs which have been running for longer than
+    PDF_JOB_TIMEOUT, as their worker process has stopped.
+
+    Returns:
+        An int storing the number of jobs queued again.
+    """
+    return PDFJob.objects.filter(
+        status=PDFJob.STATUS_RUNNING,
+        updated__lt=timezone.now() - PDF_JOB_TIMEOUT,
+    ).update(status=PDFJob.STATUS_QUEUED, updated=timezone.now())
+
+
+def run_next_pdf_job() -> bool:
+    """Run the job that has been queued the longest, if there is one.
+
+    Several workers can call this at the same time, each job is only run by
+    the first of them to start it.
+
+    Returns:
+        A bool which is True when a job was found, so there may be more.
+    """
+    pdf_job_id = (
+        PDFJob.objects.filter(status=PDFJob.STATUS_QUEUED)
+        .order_by("updated", "id")
+        .values_list("id", flat=True)
+        .first()
+    )
+    if pdf_job_id is None:
+        return False
+
+    run_pdf_job(pdf_job_id)
+    return True
+
+
+def run_pdf_job(pdf_job_id: int):
+    """Draw the PDF for a job and write it to the job's file.
+
+    Does nothing if the job has been removed or another worker has already
+    started it.
+
+    Args:
+        pdf_job_id: An int storing the primary key of the PDFJob.
+    """
+    started = PDFJob.objects.filter(
+        id=pdf_job_id, status=PDFJob.STATUS_QUEUED
+    ).update(status=PDFJob.STATUS_RUNNING, updated=timezone.now())
+    if not started:
+        return
+
+    pdf_job = PDFJob.objects.get(id=pdf_job_id)
+    try:
+        timeline_model = apps.get_model(pdf_job.timeline_model)
+        timeline = timeline_model.objects.get(pk=pdf_job.timeline_id)
+        with draw_timeline_pdf_file(
+            timeline, import_string(pdf_job.pdf_class), pdf_job.fingerprint
+        ) as pdf_file:
+            # copied to the file in chunks, not read into memory
+            pdf_job.pdf_file.save(
+                f"{pdf_job_id}.pdf", File(pdf_file), save=False
+            )
+    except Exception:
+        logger.exception("PDFJob %s failed", pdf_job_id)
+        PDFJob.objects.filter(id=pdf_job_id).update(
+            status=PDFJob.STATUS_FAILED,
+            error=PDF_JOB_ERROR,
+            updated=timezone.now(),
+        )
+    else:
+        PDFJob.objects.filter(id=pdf_job_id).update(
+            status=PDFJob.STATUS_DONE,
+            pdf_file=pdf_job.pdf_file.name,
+            updated=timezone.now(),
+        )
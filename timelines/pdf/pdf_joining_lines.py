@@ -4,13 +4,15 @@ representation  of a timeline.
 Classes:
     PDFJoiningLines
 """
-from reportlab.graphics.shapes import Drawing, Line
+from typing import Optional
+
 from reportlab.pdfgen.canvas import Canvas
 
 from ..models import EventArea, Timeline
 from .area import Area
 from .pdf_event import PDFEvent
 from .pdf_event_area import PDFEventArea
+from .pdf_lines import LineCoordinates, PDFLines
 from .pdf_scale import PDFScale
 
 
@@ -23,19 +25,29 @@ class PDFJoiningLines(Area):
 
     Attributes:
         canvas: A Canvas instance to draw the timeline on.
-        drawing: A Drawing instance to add the lines to before drawing on the
-        canvas.
+        lines: A PDFLines instance to add the lines to before drawing on the
+        canvas, indexed along the scale when the timeline's orientation is
+        given.
     """
-    def __init__(self, canvas: Canvas, drawable_area: Area):
+    def __init__(
+        self,
+        canvas: Canvas,
+        drawable_area: Area,
+        orientation: Optional[str] = None,
+    ):
         """Initialise Instance.
 
-        Creates a Drawing instance equal to size of this area.
+        Creates an empty PDFLines instance to add the lines to.
 
         Args:
             canvas: A Canvas instance to draw the joining lines on.
             drawable_area: An Area instance from a timeline layout representing
             the area inside the page borders that can be drawn on to produce
             the timeline.
+            orientation: A str describing the timelines orientation, L for
+            landscape or P for portrait, so only the lines near an area of
+            the canvas are tested when drawing it, or None to test every
+            line.
         """
         super().__init__(
             drawable_area.x,
@@ -44,7 +56,10 @@ class PDFJoiningLines(Area):
             drawable_area.height
         )
         self.canvas = canvas
-        self.drawing = Drawing(int(self.width), int(self.height))
+        if orientation is None:
+            self.lines = PDFLines()
+        else:
+            self.lines = PDFLines("x" if orientation == "L" else "y")
 
     def is_before(self, event_area: EventArea, timeline: Timeline) -> bool:
         """Test if event area is before timeline scale.
@@ -67,7 +82,7 @@ class PDFJoiningLines(Area):
             pdf_scale: PDFScale,
             orientation: str,
             event_is_before_scale: bool
-    ) -> Line:
+    ) -> LineCoordinates:
         """Get a line joining the given PDFEvent and PDFScale instances.
 
         Coordinates of returned line are relative to start of the area this
@@ -82,7 +97,7 @@ class PDFJoiningLines(Area):
             positioned before pdf_scale on the PDF timeline.
 
         Returns:
-            A Line instance.
+            A LineCoordinates instance.
         """
         if orientation == "L":
             x_from = pdf_event_area.x + pdf_event.x
@@ -112,16 +127,21 @@ class PDFJoiningLines(Area):
         x_to -= self.x
         y_to -= self.y
 
-        return Line(x_from, y_from, x_to, y_to)
+        return LineCoordinates(x_from, y_from, x_to, y_to)
 
-    def add_line(self, line: Line):
-        """Add line to drawing.
+    def add_line(self, line: LineCoordinates):
+        """Add line to lines.
 
         Args:
-            line: A Line instance to add.
+            line: A LineCoordinates instance to add.
         """
-        self.drawing.add(line)
+        self.lines.add(*line)
+
+    def draw(self, visible_area: Optional[Area] = None):
+        """Draw PDFJoiningLines on it's canvas.
 
-    def draw(self):
-        """Draw PDFJoiningLines on it's canvas."""
-        self.drawing.drawOn(self.canvas, self.x, self.y)
+        Args:
+            visible_area: An Area of the canvas, only lines overlapping it
+            are drawn, or None to draw every line.
+        """
+        self.lines.draw(self.canvas, self.x, self.y, visible_area)
@@ -0,0 +1,207 @@
+"""Contains class to draw many straight lines on a Canvas as one path.
+
+Coordinates are kept in flat arrays of floats rather than as a shape object
+for each line, and every line is written to the PDF with a single path, so
+drawing thousands of lines neither allocates thousands of objects nor goes
+through renderPDF.  Lines are drawn the same as a Drawing of Lines with
+their default style, black and 1 point wide.
+
+Lines that are drawn over and over, one area of the Canvas at a time, can be
+indexed along an axis, so finding those in an area only tests the lines
+near it rather than every line.
+
+Classes:
+    LineCoordinates
+    PDFLines
+
+Usage:
+    lines = PDFLines()
+    lines.add(0, 10, 300, 10)
+    lines.extend((x, 0, x, 10) for x in range(0, 301, 50))
+    lines.draw(canvas, x, y)
+    lines.draw(canvas, x, y, visible_area)
+
+    indexed_lines = PDFLines("x")
+"""
+
+from array import array
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from reportlab.lib.colors import black
+from reportlab.pdfgen.canvas import Canvas
+
+from .area import Area
+from .event_index import EventIndex
+
+"""Width of the lines drawn, the same as the default width of a Line."""
+LINE_WIDTH = 1
+
+
+def _overlaps(start: float, end: float, low: float, high: float) -> bool:
+    """Test if the span from start to end overlaps the span from low to
+    high, the same as Area.horizontal_overlap and Area.vertical_overlap."""
+    return (
+        (start >= low and end <= high)
+        or (start < low and end > low)
+        or (start < high and end > high)
+    )
+
+
+class LineCoordinates(NamedTuple):
+    """The coordinates of the two ends of a line.
+
+    Attributes:
+        x1: A float equal to the x coordinate of the start of the line.
+        y1: A float equal to the y coordinate of the start of the line.
+        x2: A float equal to the x coordinate of the end of the line.
+        y2: A float equal to the y coordinate of the end of the line.
+    """
+
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+
+
+class PDFLines:
+    """Class to hold many straight lines and draw them on a Canvas as one
+    path.
+
+    Attributes:
+        x1s: An array of floats storing the x coordinate of the start of each
+        line.
+        y1s: An array of floats storing the y coordinate of the start of each
+        line.
+        x2s: An array of floats storing the x coordinate of the end of each
+        line.
+        y2s: An array of floats storing the y coordinate of the end of each
+        line.
+        index: An EventIndex of the Area covered by each line, at the same
+        indexes, or None if the lines are not indexed.
+    """
+
+    __slots__ = ("x1s", "y1s", "x2s", "y2s", "index")
+
+    def __init__(self, axis: Optional[str] = None):
+        """Initialise Instance.
+
+        Args:
+            axis: A str holding the axis to index the lines along, x or y,
+            or None to not index them.
+        """
+        self.x1s = array("d")
+        self.y1s = array("d")
+        self.x2s = array("d")
+        self.y2s = array("d")
+        self.index: Optional[EventIndex] = None
+        if axis is not None:
+            self.index = EventIndex(axis)
+
+    def __len__(self) -> int:
+        """Get number of lines in this instance."""
+        return len(self.x1s)
+
+    def add(self, x1: float, y1: float, x2: float, y2: float):
+        """Add a line.
+
+        Args:
+            x1: A float equal to the x coordinate of the start of the line.
+            y1: A float equal to the y coordinate of the start of the line.
+            x2: A float equal to the x coordinate of the end of the line.
+            y2: A float equal to the y coordinate of the end of the line.
+        """
+        self.x1s.append(x1)
+        self.y1s.append(y1)
+        self.x2s.append(x2)
+        self.y2s.append(y2)
+        if self.index is not None:
+            self.index.add(
+                Area(
+                    min(x1, x2), min(y1, y2), abs(x2 - x1), abs(y2 - y1)
+                )
+            )
+
+    def extend(self, lines: Iterable[Tuple[float, float, float, float]]):
+        """Add lines.
+
+        Args:
+            lines: An iterable of tuples of the x1, y1, x2 and y2 coordinates
+            of each line, such as LineCoordinates.
+        """
+        for x1, y1, x2, y2 in lines:
+            self.add(x1, y1, x2, y2)
+
+    def get_lines(
+        self, x: float = 0, y: float = 0, visible_area: Optional[Area] = None
+    ) -> List[LineCoordinates]:
+        """Get the lines, only those overlapping an area of the Canvas when
+        visible_area is not None.
+
+        Args:
+            x: A float equal to the x coordinate the lines are drawn from.
+            y: A float equal to the y coordinate the lines are drawn from.
+            visible_area: An Area of the Canvas, or None for every line.
+
+        Returns:
+            A list of LineCoordinates, relative to x and y, in the order the
+            lines were added.
+        """
+        lines = zip(self.x1s, self.y1s, self.x2s, self.y2s)
+        if visible_area is None:
+            return [LineCoordinates(*line) for line in lines]
+
+        left = visible_area.x - x
+        right = visible_area.right() - x
+        bottom = visible_area.y - y
+        top = visible_area.top() - y
+        if self.index is not None:
+            # a point wider on each side, so rounding can't leave out a line
+            # touching the edge of visible_area
+            nearby_area = Area(
+                left - 1, bottom - 1, right - left + 2, top - bottom + 2
+            )
+            lines = (
+                (self.x1s[i], self.y1s[i], self.x2s[i], self.y2s[i])
+                for i in self.index.get_candidate_indexes(nearby_area)
+            )
+
+        return [
+            LineCoordinates(x1, y1, x2, y2)
+            for x1, y1, x2, y2 in lines
+            if _overlaps(min(x1, x2), max(x1, x2), left, right)
+            and _overlaps(min(y1, y2), max(y1, y2), bottom, top)
+        ]
+
+    def draw(
+        self,
+        canvas: Canvas,
+        x: float,
+        y: float,
+        visible_area: Optional[Area] = None,
+    ):
+        """Draw the lines on a Canvas as one path.
+
+        Args:
+            canvas: A Canvas to draw the lines on.
+            x: A float equal to the x coordinate to draw the lines from.
+            y: A float equal to the y coordinate to draw the lines from.
+            visible_area: An Area of canvas, only lines overlapping it are
+            drawn, or None to draw every line.
+        """
+        if visible_area is None:
+            if len(self) == 0:
+                return
+
+            # written straight from the arrays
+            lines = zip(self.x1s, self.y1s, self.x2s, self.y2s)
+        else:
+            lines = self.get_lines(x, y, visible_area)
+            if not lines:
+                return
+
+        canvas.saveState()
+        canvas.setStrokeColor(black)
+        canvas.setLineWidth(LINE_WIDTH)
+        canvas.translate(x, y)
+        canvas.lines(lines)
+        canvas.restoreState()
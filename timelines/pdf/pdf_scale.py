@@ -4,6 +4,7 @@ Classes:
     PDFScale
 """
 
+from typing import Optional
 
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.pdfgen.canvas import Canvas
@@ -84,10 +85,15 @@ class PDFScale(Area):
             self.line.x = self.units.x + self.units.width
             self.line.y = self.units.y + self.units.start_offset
 
-    def draw(self):
-        """Draw this instance on it's canvas."""
-        self.units.draw()
-        self.line.draw()
+    def draw(self, visible_area: Optional[Area] = None):
+        """Draw this instance on it's canvas.
+
+        Args:
+            visible_area: An Area of the canvas, only the parts of the scale
+            overlapping it are drawn, or None to draw all of it.
+        """
+        self.units.draw(visible_area)
+        self.line.draw(visible_area)
 
     def plot(self, time_unit: TimeUnit, pdf_event: PDFEvent) -> float:
         """Get distance relative to the start of this instance where
@@ -1,17 +1,22 @@
 """Contains class to draw the line of a timeline's scale on a Canvas.
 
+The lines marking units are not kept, they are worked out when they are
+drawn, only for the units in the area drawn, so the memory needed for a
+scale does not grow with its number of units.
+
 Classes:
     PDFScaleLine
 """
 
-from typing import Union
+import math
+from typing import Optional
 
-from reportlab.graphics.shapes import Drawing, Line
 from reportlab.lib.units import mm
 from reportlab.pdfgen.canvas import Canvas
 
 from .area import Area
-from .scale_description import ScaleDescription
+from .pdf_lines import PDFLines
+from .scale_description import ScaleDescription, positions_between
 
 
 class PDFScaleLine(Area):
@@ -22,8 +27,13 @@ class PDFScaleLine(Area):
 
     Attributes:
         canvas: A Canvas to draw the PDFScaleLine on.
-        drawing: A Drawing instance to add lines needed for the PDFScaleLine
-        to.
+        orientation: A str holding the page orientation of the timeline, "L"
+        or "P".
+        unit_line_indexes: A range of the indexes of the units marked with
+        a line, the same as those labelled.
+        unit_line_gap: A float equal to the distance between each unit.
+        unit_line_length: A float equal to the length of the lines marking
+        units.
     """
 
     def __init__(
@@ -44,70 +54,71 @@ class PDFScaleLine(Area):
         self.x = 0
         self.y = 0
         self.canvas: Canvas = canvas
-        self.drawing: Union[Drawing, None] = None
+        self.orientation = scale_description.timeline.page_orientation
+        self.unit_line_indexes = scale_description.get_label_indexes()
+        self.unit_line_length = unit_line_length
 
         scale_line_length = scale_description.get_scale_length() * mm
-        unit_line_count = scale_description.get_scale_units() + 1
-        unit_line_gap = scale_line_length / scale_description.get_scale_units()
-
-        if scale_description.timeline.page_orientation == "L":
-            self.__landscape_init(
-                scale_line_length,
-                unit_line_count,
-                unit_line_gap,
-                unit_line_length,
+        self.unit_line_gap = (
+            scale_line_length / scale_description.get_scale_units()
+        )
+
+        if self.orientation == "L":
+            self.width = scale_line_length
+            self.height = unit_line_length
+        else:
+            self.width = unit_line_length
+            self.height = scale_line_length
+
+    def get_lines(self, visible_area: Optional[Area] = None) -> PDFLines:
+        """Get the line of the scale and the lines marking its units, only
+        the units along an area of the canvas when visible_area is not None.
+
+        Args:
+            visible_area: An Area of the canvas, or None for every unit.
+
+        Returns:
+            A PDFLines holding the lines, relative to the scale line.
+        """
+        if visible_area is None:
+            positions = range(len(self.unit_line_indexes))
+        elif self.orientation == "L":
+            positions = positions_between(
+                self.unit_line_indexes,
+                math.floor((visible_area.x - self.x) / self.unit_line_gap),
+                math.ceil(
+                    (visible_area.right() - self.x) / self.unit_line_gap
+                ),
             )
         else:
-            self.__portrait_init(
-                scale_line_length,
-                unit_line_count,
-                unit_line_gap,
-                unit_line_length,
+            positions = positions_between(
+                self.unit_line_indexes,
+                math.floor((visible_area.y - self.y) / self.unit_line_gap),
+                math.ceil((visible_area.top() - self.y) / self.unit_line_gap),
             )
 
-    def __landscape_init(
-        self,
-        scale_line_length: float,
-        unit_line_count: int,
-        unit_line_gap: float,
-        unit_line_length: float,
-    ):
-        """Set the dimensions and draw the lines for the scale line of a
-        landscape timeline."""
-        self.width = scale_line_length
-        self.height = unit_line_length
-        self.drawing = Drawing(int(scale_line_length), int(unit_line_length))
-
-        self.drawing.add(
-            Line(0, unit_line_length, scale_line_length, unit_line_length)
-        )
-
-        for i in range(unit_line_count):
-            x = i * unit_line_gap
-            self.drawing.add(Line(x, 0, x, unit_line_length))
+        lines = PDFLines()
+        length = self.unit_line_length
+        if self.orientation == "L":
+            lines.add(0, length, self.width, length)
+            for position in positions:
+                x = self.unit_line_indexes[position] * self.unit_line_gap
+                lines.add(x, 0, x, length)
+        else:
+            lines.add(length, 0, length, self.height)
+            for position in positions:
+                y = self.unit_line_indexes[position] * self.unit_line_gap
+                lines.add(0, y, length, y)
 
-    def __portrait_init(
-        self,
-        scale_line_length: float,
-        unit_line_count: int,
-        unit_line_gap: float,
-        unit_line_length: float,
-    ):
-        """Set the dimensions and draw the lines for the scale line of a
-        portrait timeline."""
-        self.width = unit_line_length
-        self.height = scale_line_length
-        self.drawing = Drawing(int(unit_line_length), int(scale_line_length))
-
-        self.drawing.add(
-            Line(unit_line_length, 0, unit_line_length, scale_line_length)
-        )
+        return lines
 
-        for i in range(unit_line_count):
-            y = i * unit_line_gap
-            self.drawing.add(Line(0, y, unit_line_length, y))
+    def draw(self, visible_area: Optional[Area] = None):
+        """Draw this instance on it's canvas.
 
-    def draw(self):
-        """Draw this instance on it's canvas."""
-        if self.drawing is not None:
-            self.drawing.drawOn(self.canvas, self.x, self.y)
+        Args:
+            visible_area: An Area of the canvas, only lines overlapping it
+            are drawn, or None to draw every line.
+        """
+        self.get_lines(visible_area).draw(
+            self.canvas, self.x, self.y, visible_area
+        )
@@ -5,11 +5,12 @@ Classes:
 """
 
 from reportlab.lib.styles import ParagraphStyle
-from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.pdfgen.canvas import Canvas
 from reportlab.platypus import Paragraph
 
 from .area import Area
+from .font_metrics import string_width
+from .measurement_cache import measurement_cache, wrap_for_drawing
 
 
 class PDFScaleUnitLabel(Area):
@@ -24,6 +25,8 @@ class PDFScaleUnitLabel(Area):
         paragraph: A Paragraph instance to draw the unit in.
     """
 
+    __slots__ = ("canvas", "paragraph")
+
     def __init__(
         self, text: str, style: ParagraphStyle, canvas: Canvas, max_width: int
     ):
@@ -38,12 +41,12 @@ class PDFScaleUnitLabel(Area):
         """
         self.canvas = canvas
         self.paragraph = Paragraph(text, style)
-        wrap_width = stringWidth(text, style.fontName, style.fontSize)
+        wrap_width = string_width(text, style.fontName, style.fontSize)
         if wrap_width > max_width:
             wrap_width = max_width
 
-        self.paragraph.wrapOn(self.canvas, wrap_width, 0)
-        super().__init__(0, 0, self.paragraph.width, self.paragraph.height)
+        width, height = measurement_cache.wrap(self.paragraph, wrap_width)
+        super().__init__(0, 0, width, height)
 
     def set_landscape_position(self, x: float, y: float):
         """Position the paragraph describing time unit for a landscape
@@ -72,4 +75,5 @@ class PDFScaleUnitLabel(Area):
 
     def draw(self):
         """Draw this instance on it's canvas."""
+        wrap_for_drawing(self.paragraph, self.canvas, self.width)
         self.paragraph.drawOn(self.canvas, self.x, self.y)
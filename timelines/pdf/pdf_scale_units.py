@@ -1,16 +1,53 @@
-"""Contains class to draw timeline's scale units on a Canvas.
+"""Contains classes to draw timeline's scale units on a Canvas.
+
+Labels are not kept for every unit, they are created as they are needed,
+so the memory needed for a scale does not grow with its number of units.
 
 Classes:
+    PDFScaleUnitLabels
     PDFScaleUnits
 """
 
+import math
+from collections.abc import Sequence
+from typing import Iterator, Optional
+
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import mm
 from reportlab.pdfgen.canvas import Canvas
 
 from .area import Area
 from .pdf_scale_unit_label import PDFScaleUnitLabel
-from .scale_description import ScaleDescription
+from .scale_description import ScaleDescription, positions_between
+
+
+class PDFScaleUnitLabels(Sequence):
+    """Class to get the positioned label of each unit labelled on a scale,
+    creating it when it is needed rather than storing it.
+
+    Attributes:
+        scale_units: The PDFScaleUnits the labels are on.
+    """
+
+    __slots__ = ("scale_units",)
+
+    def __init__(self, scale_units: "PDFScaleUnits"):
+        """Initialise Instance.
+
+        Args:
+            scale_units: The PDFScaleUnits the labels are on.
+        """
+        self.scale_units = scale_units
+
+    def __len__(self) -> int:
+        """Get number of units labelled."""
+        return len(self.scale_units.label_indexes)
+
+    def __getitem__(self, position: int) -> PDFScaleUnitLabel:
+        """Get the label at a position, positioned on the scale."""
+        return self.scale_units.create_unit_label(
+            self.scale_units.label_indexes[position]
+        )
 
 
 class PDFScaleUnits(Area):
@@ -25,7 +62,10 @@ class PDFScaleUnits(Area):
         of the scale to draw.
         style: A ParagraphStyle for the text of each unit label.
         canvas: A Canvas to draw the PDFScaleLine on.
-        init_labels: A list of PDFScaleUnitLabel instances
+        unit_labels: A PDFScaleUnitLabels creating the PDFScaleUnitLabel of
+        each unit labelled as it is needed.
+        label_indexes: A range of the indexes of the units labelled, every
+        unit on the scale.
         start_offset: A float equal to distance (x or y depending on
         timeline orientation) to center of first until label, used to
         correctly position the a scale line.
@@ -52,101 +92,188 @@ class PDFScaleUnits(Area):
         self.scale_description = scale_description
         self.style = style
         self.canvas = canvas
-        self.unit_labels = []
+        self.unit_labels = PDFScaleUnitLabels(self)
+        self.label_indexes = scale_description.get_label_indexes()
         self.start_offset = 0
 
-        scale_line_length = scale_description.get_scale_length() * mm
-        distance_between_label_centers = (
-            scale_line_length / scale_description.get_scale_units()
+        self.__orientation = scale_description.timeline.page_orientation
+        self.__scale_line_length = scale_description.get_scale_length() * mm
+        self.__distance_between_label_centers = (
+            self.__scale_line_length / scale_description.get_scale_units()
         )
+        # largest size of a label along the scale, to find those in an area
+        self.__max_label_length = 0
 
-        if self.scale_description.timeline.page_orientation == "L":
+        if self.__orientation == "L":
             self.__landscape_init(
-                scale_line_length, distance_between_label_centers
+                self.__scale_line_length,
+                self.__distance_between_label_centers,
             )
         else:
             self.__portrait_init(
-                scale_line_length, distance_between_label_centers
+                self.__scale_line_length,
+                self.__distance_between_label_centers,
             )
 
     def __landscape_init(
         self, scale_line_length, distance_between_label_centers
     ):
-        """Creates and positions the required labels for a landscape timeline
-        then sets the dimensions of the area surrounding them."""
-        max_label_width = distance_between_label_centers - (2 * mm)
+        """Measures the required labels for a landscape timeline then sets
+        the dimensions of the area surrounding them."""
+        self.__max_label_width = distance_between_label_centers - (2 * mm)
         max_label_height = 0
 
-        for i in range(self.scale_description.get_scale_units() + 1):
-            unit_label = PDFScaleUnitLabel(
-                self.scale_description.get_scale_label(i),
-                self.style,
-                self.canvas,
-                max_label_width,
-            )
-            self.unit_labels.append(unit_label)
+        for unit_label in self.__measure_unit_labels():
             if unit_label.height > max_label_height:
                 max_label_height = unit_label.height
+            if unit_label.width > self.__max_label_length:
+                self.__max_label_length = unit_label.width
 
-        start_offset = self.unit_labels[0].width / 2
-        end_offset = self.unit_labels[-1].width / 2
+        start_offset = self.__first_label_offset
+        end_offset = self.__last_label_offset
         total_width = start_offset + scale_line_length + end_offset
 
         self.width = total_width
         self.height = max_label_height
         self.start_offset = start_offset
 
-        for i in range(self.scale_description.get_scale_units() + 1):
-            x_pos = start_offset + (i * distance_between_label_centers)
-            y_pos = max_label_height - self.unit_labels[i].height
-            self.unit_labels[i].set_landscape_position(x_pos, y_pos)
-
     def __portrait_init(
         self, scale_line_length, distance_between_label_centers
     ):
-        """Creates and positions the required labels for a portrait timeline
-        then sets the dimensions of the area surrounding them."""
+        """Measures the required labels for a portrait timeline then sets
+        the dimensions of the area surrounding them."""
         # TODO - move to const
-        max_label_width = 30 * mm
+        self.__max_label_width = int(30 * mm)
         calculated_max_label_width = 0
 
-        for i in range(self.scale_description.get_scale_units() + 1):
-            unit_label = PDFScaleUnitLabel(
-                self.scale_description.get_scale_label(i),
-                self.style,
-                self.canvas,
-                int(max_label_width),
-            )
-            self.unit_labels.append(unit_label)
+        for unit_label in self.__measure_unit_labels():
             if unit_label.width > calculated_max_label_width:
                 calculated_max_label_width = unit_label.width
+            if unit_label.height > self.__max_label_length:
+                self.__max_label_length = unit_label.height
 
-        start_offset = self.unit_labels[0].height / 2
-        end_offset = self.unit_labels[-1].height / 2
+        start_offset = self.__first_label_offset
+        end_offset = self.__last_label_offset
         total_height = start_offset + scale_line_length + end_offset
 
         self.width = calculated_max_label_width
         self.height = total_height
         self.start_offset = start_offset
 
-        for i in range(self.scale_description.get_scale_units() + 1):
-            x_pos = calculated_max_label_width
+    def __measure_unit_labels(self) -> Iterator[PDFScaleUnitLabel]:
+        """Create the label of each labelled unit in turn, without keeping
+        them, recording how far the first and last reach past the ends of the
+        scale line."""
+        for position, i in enumerate(self.label_indexes):
+            unit_label = PDFScaleUnitLabel(
+                self.scale_description.get_scale_label(i),
+                self.style,
+                self.canvas,
+                self.__max_label_width,
+            )
+            if self.__orientation == "L":
+                label_length = unit_label.width
+            else:
+                label_length = unit_label.height
+            if position == 0:
+                self.__first_label_offset = label_length / 2
+            self.__last_label_offset = label_length / 2
+
+            yield unit_label
+
+    def create_unit_label(self, i: int) -> PDFScaleUnitLabel:
+        """Create the label of a unit, positioned on the scale.
+
+        Args:
+            i: An int storing the index of the unit on the scale.
+
+        Returns:
+            A PDFScaleUnitLabel.
+        """
+        unit_label = PDFScaleUnitLabel(
+            self.scale_description.get_scale_label(i),
+            self.style,
+            self.canvas,
+            self.__max_label_width,
+        )
+        if self.__orientation == "L":
+            x_pos = self.start_offset + (
+                i * self.__distance_between_label_centers
+            )
+            y_pos = self.height - unit_label.height
+            unit_label.set_landscape_position(x_pos, y_pos)
+        else:
+            x_pos = self.width
             y_pos = (
-                start_offset
-                + scale_line_length
-                - (i * distance_between_label_centers)
+                self.start_offset
+                + self.__scale_line_length
+                - (i * self.__distance_between_label_centers)
             )
-            self.unit_labels[i].set_portrait_position(x_pos, y_pos)
+            unit_label.set_portrait_position(x_pos, y_pos)
+
+        return unit_label
 
-    def draw(self):
-        """Draw this instance on it's canvas."""
+    def __get_visible_positions(self, visible_area: Area) -> range:
+        """Get the positions in label_indexes of the labels which could
+        overlap an area of the canvas, only looking at the units along the
+        area rather than at every label."""
+        distance = self.__distance_between_label_centers
+        margin = self.__max_label_length / 2
+        if self.__orientation == "L":
+            first_centre = visible_area.x - self.x - margin
+            last_centre = visible_area.right() - self.x + margin
+            first_unit = (first_centre - self.start_offset) / distance
+            last_unit = (last_centre - self.start_offset) / distance
+        else:
+            scale_top = self.y + self.start_offset + self.__scale_line_length
+            first_unit = (scale_top - visible_area.top() - margin) / distance
+            last_unit = (scale_top - visible_area.y + margin) / distance
+
+        return positions_between(
+            self.label_indexes, math.floor(first_unit), math.ceil(last_unit)
+        )
+
+    def get_unit_labels(
+        self, visible_area: Optional[Area] = None
+    ) -> Iterator[PDFScaleUnitLabel]:
+        """Create the positioned label of each unit in turn, only those
+        overlapping an area of the canvas when visible_area is not None.
+
+        Args:
+            visible_area: An Area of the canvas, or None for every label.
+
+        Returns:
+            An iterator of PDFScaleUnitLabel instances, in scale order.
+        """
+        if visible_area is None:
+            yield from self.unit_labels
+            return
+
+        for position in self.__get_visible_positions(visible_area):
+            unit_label = self.unit_labels[position]
+            if Area(
+                self.x + unit_label.x,
+                self.y + unit_label.y,
+                unit_label.width,
+                unit_label.height,
+            ).overlaps(visible_area):
+                yield unit_label
+
+    def draw(self, visible_area: Optional[Area] = None):
+        """Draw this instance on it's canvas.
+
+        Args:
+            visible_area: An Area of the canvas, only labels overlapping it
+            are drawn, or None to draw every label.
+        """
         self.canvas.saveState()
         self.canvas.translate(self.x, self.y)
 
-        for i in range(self.scale_description.get_scale_units() + 1):
-            self.unit_labels[i].draw()
+        unit_labels = list(self.get_unit_labels(visible_area))
+        for unit_label in unit_labels:
+            unit_label.draw()
 
-        for unit_label in self.unit_labels:
+        for unit_label in unit_labels:
             unit_label.draw()
 
         self.canvas.restoreState()
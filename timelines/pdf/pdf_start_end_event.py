@@ -4,12 +4,11 @@ Classes:
     PDFStartEndEvent
 """
 from reportlab.lib.styles import ParagraphStyle
-from reportlab.lib.units import mm
-from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.pdfgen.canvas import Canvas
 from reportlab.platypus import Paragraph
 
-from .pdf_event import PDFEvent, INCREMENT_SIZE
+from .font_metrics import string_width
+from .pdf_event import PDFEvent, WIDTH_TOLERANCE
 
 
 class PDFStartEndEvent(PDFEvent):
@@ -27,8 +26,17 @@ class PDFStartEndEvent(PDFEvent):
         border_size: A float storing the gap between the Paragraphs and their
         bounding box.
         canvas: A Canvas to draw the Event on.
+        width_tolerance: A float storing the largest gap left between the
+        width chosen and the narrowest width meeting the constraints.
+        wrap_count: An int storing how many times the Paragraphs have been
+        wrapped while sizing this instance, not counting measurements found
+        in the measurement_cache.
+        wrap_estimators: A list of WrapEstimators for the Paragraphs, used to
+        estimate the best width before measuring the Paragraphs.
     """
 
+    __slots__ = ()
+
     # TODO: remove duplication with PDFEvent
     def __init__(
         self,
@@ -46,6 +54,7 @@ class PDFStartEndEvent(PDFEvent):
         fixed_size: float,
         max_width: float = 0,
         max_height: float = 0,
+        width_tolerance: float = WIDTH_TOLERANCE,
     ):
         """Initialise Instance.
 
@@ -71,6 +80,8 @@ class PDFStartEndEvent(PDFEvent):
             on a portrait timeline.
             max_height: A float storing the maximum width the PDFEvent can be
             on a landscape timeline.
+            width_tolerance: A float storing the largest gap to leave between
+            the width chosen and the narrowest width meeting the constraints.
 
         Raises:
             ValueError: If orientation is not L for landscape or P for
@@ -87,27 +98,30 @@ class PDFStartEndEvent(PDFEvent):
             description, description_style
         )
         self.tags_paragraph: Paragraph = Paragraph(tags, tags_style)
+        self.wrap_estimators = self._create_wrap_estimators()
         self.border_size = border_size
         self.canvas = canvas
+        self.width_tolerance = width_tolerance
+        self.wrap_count = 0
 
         self.x = 0
         self.y = 0
 
-        time_width = stringWidth(
+        time_width = string_width(
             time, time_style.fontName, time_style.fontSize
         )
-        title_width = stringWidth(
+        title_width = string_width(
             title, title_style.fontName, title_style.fontSize
         )
-        description_width = stringWidth(
+        description_width = string_width(
             description, description_style.fontName, description_style.fontSize
         )
-        tags_width = stringWidth(
+        tags_width = string_width(
             tags, tags_style.fontName, tags_style.fontSize
         )
 
         if orientation == "L":
-            _, self.height = self.__landscape_init(
+            self.height = self._wrap_paragraphs(
                 fixed_size - (2 * self.border_size)
             )
             self.width = fixed_size
@@ -116,37 +130,41 @@ class PDFStartEndEvent(PDFEvent):
             largest_width = max(
                 time_width, title_width, description_width, tags_width
             )
-            init_width = min(largest_width, max_width)
             min_width = min(time_width, max_width)
 
             self.width, _ = self.__portrait_init(
-                fixed_size, min_width, init_width
+                fixed_size, min_width, largest_width
             )
             self.height = fixed_size
+            self._wrap_paragraphs(self.width - (2 * self.border_size))
 
-    def __landscape_init(self, width):
-        """Calculates height for a landscape PDFStartEndEvent given that it
-        needs to be a set width."""
-        return PDFEvent._get_dimensions(self, width)
-
-    def __portrait_init(self, height, desired_width, max_width):
+    def __portrait_init(self, height, desired_width, widest_width):
         """Calculates width for a portrait PDFStartEndEvent given that it
-        needs to be a set height."""
-        current_width, current_height = PDFEvent._get_dimensions(
-            self,
-            desired_width
-        )
-
-        if (max_width > desired_width):
-            width_increment = (max_width - desired_width) * INCREMENT_SIZE
+        needs to be a set height, using widest_width, where every Paragraph
+        fits on one line, if the text is too tall to fit at any width."""
+        def fits(width: float, text_height: float) -> bool:
+            return text_height <= height
+
+        narrowest = PDFEvent._get_dimensions(self, desired_width)
+        if fits(*narrowest):
+            best = narrowest
         else:
-            width_increment = 5 * mm
-
-        while current_height > height:
-            expanded_width = current_width + width_increment
-            current_width, current_height = PDFEvent._get_dimensions(
-                self,
-                expanded_width
-            )
-
-        return current_width + (2 * self.border_size), current_height
+            if widest_width > desired_width:
+                widest = PDFEvent._get_dimensions(self, widest_width)
+            else:
+                widest = narrowest
+
+            if fits(*widest):
+                _, best = self._search_width(
+                    widest,
+                    fits,
+                    lambda width, text_height: desired_width,
+                    failed=narrowest,
+                    estimate=self._estimate_width(
+                        desired_width, widest[0], fits
+                    ),
+                )
+            else:
+                best = widest
+
+        return best[0] + (2 * self.border_size), best[1]
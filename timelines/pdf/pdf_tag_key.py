@@ -3,6 +3,7 @@ from reportlab.pdfgen.canvas import Canvas
 from reportlab.platypus import Paragraph
 from reportlab.lib.units import mm
 from .area import Area
+from .measurement_cache import measurement_cache, wrap_for_drawing
 
 
 TAG_KEY_COLUMN_WIDTH = 70 * mm
@@ -21,11 +22,12 @@ class PDFParagraph(Area):
         self.y = 0
 
         self.paragraph: Paragraph = Paragraph(text, style)
-        self.width, self.height = self.paragraph.wrapOn(
-            self.canvas, max_width, 0
+        self.width, self.height = measurement_cache.wrap(
+            self.paragraph, max_width
         )
 
     def draw(self):
+        wrap_for_drawing(self.paragraph, self.canvas, self.width)
         self.paragraph.drawOn(self.canvas, self.x, self.y)
 
 
@@ -0,0 +1,122 @@
+"""Contains class to draw a timeline across tiled pages.
+
+A timeline with tiled pages is drawn once for each page, translated so
+that page's area of the whole PDF is on the page, and only the parts of
+the timeline that overlap the page are drawn on it.  The content of each
+page then grows with the page size rather than the length of the scale.
+
+This does not bound the memory used to draw the PDF, as the Canvas keeps
+every page until it is saved, so that grows with the number of pages.  The
+PDF is written to the buffer the Canvas was created with once all of them
+have been drawn, which for timelines.pdf.pdf_cache is a file spooled to
+disk.
+
+Classes:
+    PDFTileMarkers
+
+Usage:
+    tiles = layout.page_tiles()
+    tile_markers = PDFTileMarkers(canvas, "L", DEFAULT_TILE_OVERLAP, border)
+    for index, tile in enumerate(tiles):
+        canvas.setPageSize((tile.width, tile.height))
+        canvas.translate(-tile.x, -tile.y)
+        lines.draw(canvas, x, y, tile)
+        tile_markers.draw(index, len(tiles), tile)
+        canvas.showPage()
+"""
+
+from reportlab.lib.colors import grey
+from reportlab.lib.units import mm
+from reportlab.pdfgen.canvas import Canvas
+
+from .area import Area
+
+"""Length of the marks showing where pages overlap."""
+TILE_MARKER_LENGTH = 5 * mm
+
+"""Size of the font of each page's number."""
+TILE_NUMBER_FONT_SIZE = 8
+
+
+class PDFTileMarkers:
+    """Class to draw the marks showing where tiled pages overlap, and each
+    page's number, in the page border.
+
+    Attributes:
+        canvas: A Canvas instance to draw the marks on.
+        orientation: A str describing the timeline's orientation.
+        overlap: A float equal to the distance each page overlaps the one
+        before.
+        page_border: A float equal to the width of the page border.
+    """
+
+    def __init__(
+        self,
+        canvas: Canvas,
+        orientation: str,
+        overlap: float,
+        page_border: float,
+    ):
+        """Initialise Instance.
+
+        Args:
+            canvas: A Canvas instance to draw the marks on.
+            orientation: A str describing the timeline's orientation.
+            overlap: A float equal to the distance each page overlaps the one
+            before.
+            page_border: A float equal to the width of the page border.
+        """
+        self.canvas = canvas
+        self.orientation = orientation
+        self.overlap = overlap
+        self.page_border = page_border
+
+    def draw(self, index: int, count: int, tile: Area):
+        """Draw the marks on the page of a tile, nothing is drawn when there
+        is only one page.
+
+        Args:
+            index: An int holding the position of the tile, from 0.
+            count: An int holding the number of tiles.
+            tile: An Area holding the size of the page.
+        """
+        if count < 2:
+            return
+
+        self.canvas.saveState()
+        self.canvas.setStrokeColor(grey)
+        self.canvas.setFillColor(grey)
+        self.canvas.setDash(2, 2)
+
+        if self.orientation == "L":
+            if index > 0:
+                self.__draw_landscape_marks(tile, self.overlap)
+            if index < count - 1:
+                self.__draw_landscape_marks(tile, tile.width - self.overlap)
+        else:
+            if index > 0:
+                self.__draw_portrait_marks(tile, tile.height - self.overlap)
+            if index < count - 1:
+                self.__draw_portrait_marks(tile, self.overlap)
+
+        self.canvas.setFont("Times-Roman", TILE_NUMBER_FONT_SIZE)
+        self.canvas.drawRightString(
+            tile.width - self.page_border,
+            self.page_border / 3,
+            f"Page {index + 1} of {count}",
+        )
+        self.canvas.restoreState()
+
+    def __draw_landscape_marks(self, tile: Area, x: float):
+        """Draw marks in the top and bottom borders where a page overlaps
+        the one next to it."""
+        length = min(TILE_MARKER_LENGTH, self.page_border)
+        self.canvas.line(x, 0, x, length)
+        self.canvas.line(x, tile.height - length, x, tile.height)
+
+    def __draw_portrait_marks(self, tile: Area, y: float):
+        """Draw marks in the left and right borders where a page overlaps
+        the one next to it."""
+        length = min(TILE_MARKER_LENGTH, self.page_border)
+        self.canvas.line(0, y, length, y)
+        self.canvas.line(tile.width - length, y, tile.width, y)
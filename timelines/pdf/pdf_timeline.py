@@ -6,18 +6,22 @@ Classes:
 
 import io
 from abc import ABC, abstractmethod
-from typing import List, Union
+from typing import BinaryIO, Dict, List, Optional
 
+from django.db.models import QuerySet
 from reportlab.lib.colors import black
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.pdfgen.canvas import Canvas
 from reportlab.platypus import Paragraph
 
+from timelines.event_loader import NO_EVENT_AREA, load_events_by_area
 from timelines.models import Event, EventArea, Timeline
-from timelines.pdf.inside import Inside
 from timelines.pdf.pdf_event import PDFEvent
 from timelines.pdf.pdf_joining_lines import PDFJoiningLines
-from timelines.pdf.layout import DEFAULT_COMPONENT_BORDER
+from timelines.pdf.layout import (
+    DEFAULT_COMPONENT_BORDER,
+    DEFAULT_TILE_OVERLAP,
+)
 from timelines.pdf.landscape_layout import LandscapeLayout
 from timelines.pdf.portrait_layout import PortraitLayout
 from timelines.pdf.pdf_scale import PDFScale
@@ -26,7 +30,16 @@ from timelines.pdf.pdf_tag_key import PDFTagKey, TAG_KEY_COLUMN_WIDTH
 from timelines.pdf.scale_description import ScaleDescription
 
 from .area import Area
+from .event_index import EventIndex
+from .incremental_layout import (
+    get_layout_key,
+    load_event_geometry,
+    place_events_incrementally,
+    save_event_geometry,
+)
+from .parallel_layout import PDFEventSpec, place_pdf_events, size_pdf_events
 from .pdf_event_area import PDFEventArea
+from .pdf_tiles import PDFTileMarkers
 
 
 class PDFTimeline(ABC):
@@ -39,9 +52,17 @@ class PDFTimeline(ABC):
 
     Attributes:
         timeline: An instance of a sub-class of Timeline.
+        parallel_layout: A bool stating if the timeline's events are sized
+        and positioned in a pool of worker processes.
+        incremental_layout: A bool stating if the timeline's events are
+        positioned reusing where they were positioned the last time it was
+        drawn, see incremental_layout.
+        reused_placements: An int storing how many events kept the position
+        stored for them rather than being positioned again.
         layout: A PDFTimelineLayout instance describing all the graphics
         elements all the timeline to draw on the PDF.
-        buffer: ???
+        buffer: A binary file the PDF is written to, left at its start once
+        the PDF has been drawn.
         canvas: A Canvas instance to draw the timeline on.
         title_style: A ParagraphStyle instance to use for the title.
         basic_text_style: A ParagraphStyle instance to use for all other text
@@ -53,9 +74,17 @@ class PDFTimeline(ABC):
         description.
         joining_lines: A PDFJoiningLines instance to draw lines joining events
         to the scale.
+        events_without_event_area: A list of the timeline's Events that are
+        not in an EventArea, so are not drawn.
     """
 
-    def __init__(self, timeline: Timeline):
+    def __init__(
+        self,
+        timeline: Timeline,
+        parallel_layout: bool = False,
+        buffer: Optional[BinaryIO] = None,
+        incremental_layout: bool = False,
+    ):
         """Initialise Instance.
 
         Creates an initial PDF to to measure the size of the timeline's
@@ -66,12 +95,27 @@ class PDFTimeline(ABC):
         arrange all the graphical elements of the timeline on the PDF.
 
         Updates the size of the PDF inline with the layout and draws all the
-        graphical elements of the timeline on the PDF.
+        graphical elements of the timeline on the PDF.  When the timeline's
+        page_tiling is tiled the PDF is split across pages of the page size
+        instead, see pdf_tiles.
 
         Args:
             timeline: An instance of a sub-class of Timeline.
+            parallel_layout: A bool stating if the timeline's events should
+            be sized and positioned in a pool of worker processes.  The PDF
+            is the same either way.
+            buffer: A binary file to write the PDF to, such as a
+            SpooledTemporaryFile, or None to write it to a new BytesIO.
+            incremental_layout: A bool stating if the timeline's events
+            should be positioned reusing the EventGeometry stored the last
+            time it was drawn, which is then updated.  The PDF is the same
+            either way.  Events are positioned in this process even when
+            parallel_layout is True.
         """
         self.timeline = timeline
+        self.parallel_layout = parallel_layout
+        self.incremental_layout = incremental_layout
+        self.reused_placements = 0
 
         if timeline.page_orientation == "L":
             self.layout = LandscapeLayout(timeline)
@@ -79,7 +123,7 @@ class PDFTimeline(ABC):
             self.layout = PortraitLayout(timeline)
 
         # create initial canvas
-        self.buffer = io.BytesIO()
+        self.buffer = io.BytesIO() if buffer is None else buffer
         self.canvas = Canvas(
             self.buffer,
             pagesize=(
@@ -148,27 +192,41 @@ class PDFTimeline(ABC):
         self.tag_key.y = self.layout.tag_key_area.y
 
         # add events to event areas
-        overlap = self.__add_events()
+        events_by_area = load_events_by_area(self._get_timeline_events())
+        self.events_without_event_area = events_by_area.get(
+            NO_EVENT_AREA, []
+        )
+        overlap = self.__add_events(events_by_area)
 
         # update layout if any events go over the edge of their event areas
         if overlap > 0:
             self.layout.expand_event_overlap(overlap)
             self.scale.move(self.layout.scale_area.x, self.layout.scale_area.y)
 
+        # tiled timelines are drawn a page at a time, so their joining lines
+        # are indexed to find those on each page
         self.joining_lines = PDFJoiningLines(
             self.canvas,
-            self.layout.drawable_area
+            self.layout.drawable_area,
+            (
+                self.timeline.page_orientation
+                if self.timeline.page_tiling == "T"
+                else None
+            ),
         )
         self.__add_joining_lines()
 
-        # set final page size & draw
-        self.canvas.setPageSize(
-            (self.layout.page_area.width, self.layout.page_area.height)
-        )
-        self.__draw()
+        if self.timeline.page_tiling == "T":
+            self.__draw_tiles()
+        else:
+            # set final page size & draw
+            self.canvas.setPageSize(
+                (self.layout.page_area.width, self.layout.page_area.height)
+            )
+            self.__draw()
+            self.canvas.showPage()
 
         # close the PDF object
-        self.canvas.showPage()
         self.canvas.save()
 
         # FileResponse sets the Content-Disposition header so that browsers
@@ -185,8 +243,8 @@ class PDFTimeline(ABC):
         raise NotImplementedError("Subclasses should implement this")
 
     @abstractmethod
-    def _get_events(self, event_area_id: int) -> List[Event]:
-        """Gets list of all Events in an EventArea.  Objects in list will be
+    def _get_timeline_events(self) -> QuerySet:
+        """Gets QuerySet of all Events in the Timeline.  Objects in it will be
         the subclass of Event specific to the type of timeline, eg AgeEvent
         for AgeTimeline."""
         raise NotImplementedError("Subclasses should implement this")
@@ -222,108 +280,178 @@ class PDFTimeline(ABC):
         paragraph.wrapOn(self.canvas, self.layout.drawable_area.width, 0)
         return paragraph
 
-    def __create_pdf_event(
+    def __get_pdf_event_spec(
         self, event: Event, pdf_event_area: PDFEventArea
-    ) -> PDFEvent:
-        """Creates a PDFEvent of a size and layout suitable for it's Event,
-        PDFEventArea and Timeline."""
+    ) -> PDFEventSpec:
+        """Gets the class and arguments, except canvas, to create a PDFEvent
+        of a size and layout suitable for it's Event, PDFEventArea and
+        Timeline."""
+        arguments = {
+            "title": str(event.title),
+            "description": str(event.description),
+            "tags": Event.join_tag_names(event.display_tags),
+            "orientation": str(self.timeline.page_orientation),
+            "time_style": self.basic_text_style,
+            "title_style": self.basic_text_style,
+            "description_style": self.basic_text_style,
+            "tags_style": self.basic_text_style,
+            "border_size": self.layout.event_border,
+            "max_width": pdf_event_area.width,
+            "max_height": pdf_event_area.height,
+        }
         if event.has_end:
-            return PDFStartEndEvent(
-                self._get_event_start_to_end_time(event),
-                str(event.title),
-                str(event.description),
-                event.event_ptr.tag_string(True),
-                str(self.timeline.page_orientation),
-                self.canvas,
-                self.basic_text_style,
-                self.basic_text_style,
-                self.basic_text_style,
-                self.basic_text_style,
-                self.layout.event_border,
-                self._get_event_start_to_end_size(event),
-                pdf_event_area.width,
-                pdf_event_area.height,
-            )
+            arguments["time"] = self._get_event_start_to_end_time(event)
+            arguments["fixed_size"] = self._get_event_start_to_end_size(event)
+            return PDFStartEndEvent, arguments
         else:
-            return PDFEvent(
-                self._get_event_start_time(event),
-                str(event.title),
-                str(event.description),
-                event.event_ptr.tag_string(True),
-                str(self.timeline.page_orientation),
-                self.canvas,
-                self.basic_text_style,
-                self.basic_text_style,
-                self.basic_text_style,
-                self.basic_text_style,
-                self.layout.event_border,
-                pdf_event_area.width,
-                pdf_event_area.height,
-            )
-
-    def __add_events(self) -> float:
+            arguments["time"] = self._get_event_start_time(event)
+            return PDFEvent, arguments
+
+    def __create_pdf_events(
+        self, pdf_event_specs: List[PDFEventSpec]
+    ) -> List[PDFEvent]:
+        """Creates PDFEvents on this timeline's Canvas, in the pool of worker
+        processes when parallel_layout is True."""
+        if self.parallel_layout:
+            return size_pdf_events(pdf_event_specs, self.canvas)
+
+        return [
+            pdf_event_class(canvas=self.canvas, **arguments)
+            for pdf_event_class, arguments in pdf_event_specs
+        ]
+
+    def __add_events(
+        self, events_by_area: Dict[Optional[int], List[Event]]
+    ) -> float:
         """Creates PDFEvent objects for each Event object in a Timeline, then
         positions and adds it to it's PDFEventArea. Checks to see if any of
         PDFEvents overlap the expandable side of it's PDFEventArea and returns
-        the largest overlap."""
-        max_overlap = 0
+        the largest overlap.
+
+        When the Timeline's event_placement is stacked, the PDFEvents in each
+        PDFEventArea are positioned in order along the scale.
+
+        When parallel_layout is True the PDFEvents are sized and positioned
+        in the pool of worker processes, otherwise in this process.  When
+        incremental_layout is True they are positioned in this process
+        reusing the positions stored for them where possible.
+
+        Args:
+            events_by_area: A dict of lists of Events keyed on the id of
+            their EventArea, as returned by load_events_by_area."""
+        events: List[Event] = []
+        pdf_event_specs: List[PDFEventSpec] = []
+        area_sizes: List[int] = []
         for pdf_event_area in self.layout.event_areas:
             event_area: EventArea = pdf_event_area.event_area
-            events: List[Event] = self._get_events(event_area.id)
-
-            for event in events:
-                pdf_event: PDFEvent = self.__create_pdf_event(
-                    event,
-                    pdf_event_area
+            area_events = events_by_area.get(event_area.id, [])
+            events.extend(area_events)
+            pdf_event_specs.extend(
+                self.__get_pdf_event_spec(event, pdf_event_area)
+                for event in area_events
+            )
+            area_sizes.append(len(area_events))
+
+        all_pdf_events = self.__create_pdf_events(pdf_event_specs)
+        for event, pdf_event in zip(events, all_pdf_events):
+            # find preferred position of pdf_event from start of
+            # pdf_event_area
+            pdf_event.position_on_scale = self._plot_event(event, pdf_event)
+            if self.timeline.page_orientation == "L":
+                pdf_event.x = pdf_event.position_on_scale
+            else:
+                pdf_event.y = pdf_event.position_on_scale
+
+        stacked = self.timeline.event_placement == "S"
+        pdf_events_by_area: List[List[PDFEvent]] = []
+        event_ids_by_area: List[List[int]] = []
+        start = 0
+        for area_size in area_sizes:
+            area_events = list(
+                zip(
+                    all_pdf_events[start:start + area_size],
+                    (event.pk for event in events[start:start + area_size]),
                 )
-                coordinates = self.__get_event_position(
-                    event, pdf_event, pdf_event_area
+            )
+            if stacked:
+                area_events.sort(
+                    key=lambda pair: self.__get_scale_order(pair[0])
                 )
-                if coordinates is not None:
-                    pdf_event.x, pdf_event.y = coordinates
+            pdf_events_by_area.append(
+                [pdf_event for pdf_event, _ in area_events]
+            )
+            event_ids_by_area.append(
+                [event_id for _, event_id in area_events]
+            )
+            start += area_size
 
-                # todo - handle case were coordinates is none
+        if self.incremental_layout:
+            return self.__place_events_incrementally(
+                pdf_events_by_area, event_ids_by_area, stacked
+            )
 
-                pdf_event_area.events.append(pdf_event)
+        if self.parallel_layout:
+            return place_pdf_events(
+                self.layout.event_areas,
+                pdf_events_by_area,
+                self.timeline.page_orientation,
+                stacked,
+            )
 
-                # todo - handle case where event is too big to fit event area
-                overlap = self.__get_event_overlap(pdf_event, pdf_event_area)
-                if overlap > max_overlap:
-                    max_overlap = overlap
+        max_overlap = 0
+        for pdf_event_area, pdf_events in zip(
+            self.layout.event_areas, pdf_events_by_area
+        ):
+            overlap = pdf_event_area.place_events(
+                pdf_events, self.timeline.page_orientation, stacked
+            )
+            if overlap > max_overlap:
+                max_overlap = overlap
 
         return max_overlap
 
-    def __get_event_position(
-        self, event: Event, pdf_event: PDFEvent, pdf_event_area: PDFEventArea
-    ) -> Union[tuple[float, float], None]:
-        """Get the best position for pdf_event in pdf_event_area."""
-        # find preferred position of pdf_event from start of pdf_event_area
-        pdf_event.position_on_scale = self._plot_event(event, pdf_event)
+    def __place_events_incrementally(
+        self,
+        pdf_events_by_area: List[List[PDFEvent]],
+        event_ids_by_area: List[List[int]],
+        stacked: bool,
+    ) -> float:
+        """Positions the PDFEvents in each PDFEventArea reusing the
+        EventGeometry stored for them where possible, then stores their new
+        EventGeometry.  Returns the largest overlap the same as
+        __add_events."""
+        orientation = self.timeline.page_orientation
+        stored = load_event_geometry(self.timeline)
+        geometries = []
+        max_overlap = 0
+        for pdf_event_area, pdf_events, event_ids in zip(
+            self.layout.event_areas, pdf_events_by_area, event_ids_by_area
+        ):
+            layout_key = get_layout_key(pdf_event_area, orientation, stacked)
+            overlap, area_geometries, reused = place_events_incrementally(
+                pdf_event_area,
+                event_ids,
+                pdf_events,
+                orientation,
+                stacked,
+                layout_key,
+                stored.get(layout_key, {}),
+            )
+            geometries.extend(area_geometries)
+            self.reused_placements += reused
+            if overlap > max_overlap:
+                max_overlap = overlap
 
-        # place pdf_event in preferred position then get best position making
-        # sure it does not overlap any other PDFEvents or any part of it's
-        # PDFEventArea which cannot be expanded
-        if self.timeline.page_orientation == "L":
-            pdf_event.x = pdf_event.position_on_scale
-            return pdf_event_area.get_landscape_position(pdf_event, True, True)
-        else:
-            pdf_event.y = pdf_event.position_on_scale
-            return pdf_event_area.get_portrait_position(pdf_event, True, True)
+        save_event_geometry(self.timeline, stored, geometries)
+        return max_overlap
 
-    def __get_event_overlap(
-        self, pdf_event: PDFEvent, pdf_event_area: PDFEventArea
-    ) -> float:
-        """Get how much pdf_event overlaps the expandable side (right for
-        landscape and bottom for portrait) of pdf_event_area."""
-        inside_event_area = Inside(pdf_event, pdf_event_area)
+    def __get_scale_order(self, pdf_event: PDFEvent) -> float:
+        """Get key to sort PDFEvents in the order they start along the scale,
+        left to right for landscape and top to bottom for portrait."""
         if self.timeline.page_orientation == "L":
-            if inside_event_area.test(right_inside=False):
-                return abs(pdf_event.right() - pdf_event_area.width)
+            return pdf_event.position_on_scale
         else:
-            if inside_event_area.test(bottom_inside=False):
-                return abs(pdf_event.y)
-
-        return 0
+            return -(pdf_event.position_on_scale + pdf_event.height)
 
     def __add_joining_lines(self):
         """Call after all PDFEvents have been created to add a line to join
@@ -344,36 +472,118 @@ class PDFTimeline(ABC):
                 )
                 self.joining_lines.add_line(line)
 
-    def __draw(self):
-        """Draw all the graphical elements of the timeline on the PDF."""
-        self.title_paragraph.drawOn(
-            self.canvas,
-            self.layout.title_area.x,
-            self.layout.title_area.y,
-        )
+    def __draw_tiles(self):
+        """Draw the timeline on pages of the page size, one after another,
+        each only holding the graphical elements that overlap it.
+
+        Only the events, lines and labels near each page along the scale
+        are tested, so drawing every page does not test every element."""
+        tiles = self.layout.page_tiles(DEFAULT_TILE_OVERLAP)
+        axis = "x" if self.timeline.page_orientation == "L" else "y"
+        event_indexes = []
+        for pdf_event_area in self.layout.event_areas:
+            event_index = EventIndex(axis)
+            event_index.sync(pdf_event_area.events)
+            event_indexes.append(event_index)
 
-        self.description_paragraph.drawOn(
+        tile_markers = PDFTileMarkers(
             self.canvas,
-            self.layout.description_area.x,
-            self.layout.description_area.y,
+            self.timeline.page_orientation,
+            DEFAULT_TILE_OVERLAP,
+            self.layout.page_border,
         )
+        for index, tile in enumerate(tiles):
+            self.canvas.setPageSize((tile.width, tile.height))
+            self.canvas.setStrokeColorRGB(0, 0, 0)
+            self.canvas.setFillColorRGB(1, 1, 1)
 
-        self.scale.draw()
+            self.canvas.saveState()
+            self.canvas.translate(-tile.x, -tile.y)
+            self.__draw(tile, event_indexes)
+            self.canvas.restoreState()
 
-        self.joining_lines.draw()
+            tile_markers.draw(index, len(tiles), tile)
+            self.canvas.showPage()
+
+    def __draw(
+        self,
+        visible_area: Optional[Area] = None,
+        event_indexes: Optional[List[EventIndex]] = None,
+    ):
+        """Draw the graphical elements of the timeline on the PDF, only
+        those overlapping visible_area unless it is None.
+
+        event_indexes holds an EventIndex of the events of each event area,
+        used to find the events near visible_area, or is None to test every
+        event."""
+        if self.__is_visible(self.layout.title_area, visible_area):
+            self.title_paragraph.drawOn(
+                self.canvas,
+                self.layout.title_area.x,
+                self.layout.title_area.y,
+            )
 
-        for pdf_event_area in self.layout.event_areas:
+        if self.__is_visible(self.layout.description_area, visible_area):
+            self.description_paragraph.drawOn(
+                self.canvas,
+                self.layout.description_area.x,
+                self.layout.description_area.y,
+            )
+
+        self.scale.draw(visible_area)
+
+        self.joining_lines.draw(visible_area)
+
+        for area_index, pdf_event_area in enumerate(self.layout.event_areas):
+            # events can reach past the edge of their event area, so each
+            # of them is tested rather than the event area
             self.canvas.saveState()
             self.canvas.translate(pdf_event_area.x, pdf_event_area.y)
 
-            for pdf_event in pdf_event_area.events:
-                pdf_event.draw()
+            pdf_events = pdf_event_area.events
+            if visible_area is not None and event_indexes is not None:
+                pdf_events = self.__get_nearby_events(
+                    pdf_event_area, event_indexes[area_index], visible_area
+                )
+
+            for pdf_event in pdf_events:
+                if visible_area is None or Area(
+                    pdf_event_area.x + pdf_event.x,
+                    pdf_event_area.y + pdf_event.y,
+                    pdf_event.width,
+                    pdf_event.height,
+                ).overlaps(visible_area):
+                    pdf_event.draw()
 
             self.canvas.restoreState()
 
-        if isinstance(self.tag_key, PDFTagKey):
+        if isinstance(self.tag_key, PDFTagKey) and self.__is_visible(
+            self.tag_key, visible_area
+        ):
             self.tag_key.draw()
 
+    def __get_nearby_events(
+        self,
+        pdf_event_area: PDFEventArea,
+        event_index: EventIndex,
+        visible_area: Area,
+    ) -> List[PDFEvent]:
+        """Get the events of an event area near visible_area along the scale,
+        in the order they are drawn, using an EventIndex of them."""
+        # a point wider on each side, so rounding can't leave out an event
+        # touching the edge of visible_area
+        nearby_area = Area(
+            visible_area.x - pdf_event_area.x - 1,
+            visible_area.y - pdf_event_area.y - 1,
+            visible_area.width + 2,
+            visible_area.height + 2,
+        )
+        return event_index.get_candidates(nearby_area)
+
+    def __is_visible(self, area: Area, visible_area: Optional[Area]) -> bool:
+        """Test if area should be drawn when only visible_area is shown."""
+        return visible_area is None or area.overlaps(visible_area)
+
     def __create_title_style(self) -> ParagraphStyle:
         """Create a paragraph style for the timeline's title."""
         return ParagraphStyle(
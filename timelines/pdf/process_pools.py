@@ -0,0 +1,68 @@
+"""Contains functions to share pools of worker processes.
+
+Functions:
+    get_process_pool
+    discard_process_pool
+
+Usage:
+    pool = get_process_pool("layout", 4)
+    try:
+        results = list(pool.map(function, arguments))
+    except BrokenProcessPool:
+        discard_process_pool("layout", pool)
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+from typing import Dict
+
+import django
+
+_process_pools: Dict[str, ProcessPoolExecutor] = {}
+_process_pools_lock = Lock()
+
+
+def get_process_pool(name: str, max_workers: int) -> ProcessPoolExecutor:
+    """Get a pool of worker processes, starting it the first time it is
+    needed.
+
+    Workers are spawned rather than forked so they do not share the web
+    server's database connections, and set up Django before running
+    anything.
+
+    Args:
+        name: A str naming the pool.
+        max_workers: An int storing how many worker processes the pool has
+        when it is started.
+
+    Returns:
+        A ProcessPoolExecutor shared by everything using the same name.
+    """
+    with _process_pools_lock:
+        process_pool = _process_pools.get(name)
+        if process_pool is None:
+            process_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=django.setup,
+            )
+            _process_pools[name] = process_pool
+
+        return process_pool
+
+
+def discard_process_pool(name: str, process_pool: ProcessPoolExecutor):
+    """Stop using a pool, for example after one of its workers died, so a
+    new one is started the next time it is needed.
+
+    Args:
+        name: A str naming the pool.
+        process_pool: The ProcessPoolExecutor to discard, ignored if it has
+        already been replaced.
+    """
+    with _process_pools_lock:
+        if _process_pools.get(name) is process_pool:
+            del _process_pools[name]
+
+    process_pool.shutdown(wait=False)
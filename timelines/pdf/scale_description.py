@@ -1,10 +1,34 @@
 from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from typing import Any, Optional, Tuple
+
+from django.db.models import Case, Max, Min, QuerySet, When
+
 from timelines.models import Timeline
 
 
 MM_PER_CM = 10
 
 
+def positions_between(
+    indexes: range, first_unit: float, last_unit: float
+) -> range:
+    """Get the positions in a range of unit indexes of the units from
+    first_unit to last_unit inclusive, without searching every unit.
+
+    Args:
+        indexes: A range of unit indexes, from get_label_indexes.
+        first_unit: A float equal to the index of the first unit.
+        last_unit: A float equal to the index of the last unit.
+
+    Returns:
+        A range of positions in indexes.
+    """
+    return range(
+        bisect_left(indexes, first_unit), bisect_right(indexes, last_unit)
+    )
+
+
 class ScaleDescription(ABC):
     """Class to represent the description of a timeline's scale.
 
@@ -21,6 +45,47 @@ class ScaleDescription(ABC):
         """
         self.timeline: Timeline = timeline
 
+    def _get_time_bounds(
+        self, events: QuerySet, start: Any, end: Any
+    ) -> Optional[Tuple[Any, Any]]:
+        """Finds the earliest and latest times of a timeline's events in one
+        aggregate query, without loading the events.
+
+        Args:
+            events: A QuerySet of the Event subclass specific to the type of
+            timeline, eg AgeEvents.
+            start: A field name or expression giving an event's start time,
+            in the same order as the events' ordering.
+            end: A field name or expression giving an event's end time, only
+            used for events that have an end.
+
+        Returns:
+            A tuple of the earliest start time and the latest start or end
+            time, or None if there are no events.
+        """
+        bounds = events.aggregate(
+            first_start=Min(start),
+            last_start=Max(start),
+            last_end=Max(Case(When(has_end=True, then=end))),
+        )
+        if bounds["first_start"] is None:
+            return None
+
+        last = bounds["last_start"]
+        if bounds["last_end"] is not None and bounds["last_end"] > last:
+            last = bounds["last_end"]
+
+        return bounds["first_start"], last
+
+    def get_label_indexes(self) -> range:
+        """Get the index of each unit on the scale, every one of which is
+        labelled, without creating a list of them.
+
+        Returns:
+            A range of ints from 0 to get_scale_units() inclusive.
+        """
+        return range(self.get_scale_units() + 1)
+
     @abstractmethod
     def get_scale_units(self) -> int:
         """Calculates number of scales units needed in timeline scale."""
@@ -0,0 +1,99 @@
+"""Contains class to record the lowest free level along a timeline's scale.
+
+Classes:
+    Skyline
+
+Usage:
+    skyline = Skyline()
+    skyline.raise_level(0, 20, 15)
+
+    level = skyline.get_level(10, 30)
+"""
+
+from bisect import bisect_left, bisect_right
+from math import inf
+from typing import List
+
+
+class Skyline:
+    """Class to record, for each position along a timeline's scale, the
+    lowest level events can be placed at without overlapping any placed
+    before them.
+
+    Positions along the scale increase in the direction an event area can
+    be expanded, levels increase away from the scale.  The skyline is stored
+    as a list of the positions where the level changes and the level from
+    each of those positions until the next one.
+
+    Attributes:
+        starts: A sorted list of floats storing the positions where the level
+        changes.
+        levels: A list of floats storing the level from the position at the
+        same index in starts until the next position.
+    """
+
+    def __init__(self, base_level: float = 0):
+        """Initialise Instance.
+
+        Args:
+            base_level: A float storing the level everywhere along the scale
+            before any events are placed.
+        """
+        self.starts: List[float] = [-inf]
+        self.levels: List[float] = [base_level]
+
+    def get_level(self, start: float, end: float) -> float:
+        """Get the lowest level something between start and end can be placed
+        at.
+
+        Args:
+            start: A float storing the position along the scale to start at.
+            end: A float storing the position along the scale to end at.
+
+        Returns:
+            A float storing the highest level between start and end.
+        """
+        i = bisect_right(self.starts, start) - 1
+        level = self.levels[i]
+        i += 1
+        while i < len(self.starts) and self.starts[i] < end:
+            level = max(level, self.levels[i])
+            i += 1
+
+        return level
+
+    def get_next_start(self, start: float) -> float:
+        """Get the next position after start where the level changes.
+
+        Args:
+            start: A float storing a position along the scale.
+
+        Returns:
+            A float storing the position, or inf if the level does not change
+            after start.
+        """
+        i = bisect_right(self.starts, start)
+        if i < len(self.starts):
+            return self.starts[i]
+
+        return inf
+
+    def raise_level(self, start: float, end: float, level: float):
+        """Set the level between start and end after something has been
+        placed there.
+
+        Args:
+            start: A float storing the position along the scale to start at.
+            end: A float storing the position along the scale to end at.
+            level: A float storing the new level between start and end, which
+            should be no lower than get_level(start, end).
+        """
+        if end <= start:
+            return
+
+        end_level = self.levels[bisect_right(self.starts, end) - 1]
+
+        first = bisect_left(self.starts, start)
+        last = bisect_right(self.starts, end)
+        self.starts[first:last] = [start, end]
+        self.levels[first:last] = [level, end_level]
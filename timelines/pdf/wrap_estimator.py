@@ -0,0 +1,120 @@
+"""Contains class to estimate how high a Paragraph will be when wrapped to a
+width without wrapping it.
+
+Classes:
+    WrapEstimator
+
+Usage:
+    estimator = WrapEstimator("text to wrap", style)
+    height = estimator.get_height(50 * mm)
+"""
+
+from typing import List, Tuple
+
+from reportlab.lib.styles import ParagraphStyle
+
+from .font_metrics import string_width
+
+
+class WrapEstimator:
+    """Class to estimate the height of a Paragraph from the widths of the
+    words in its text.
+
+    Fills each line with as many words as fit in the same way as
+    Paragraph.wrap does for plain text, so the estimate is usually exact.
+    It can drift when the text contains markup, which is measured as it is
+    written rather than as it is drawn.
+
+    Attributes:
+        font_name: A str holding the name of the font the text is drawn in.
+        font_size: A float storing the size of the font.
+        words: A list of the words in the text.
+        word_widths: A list of floats storing the width of each word.
+        space_width: A float storing the width of a space.
+        space_shrinkage: A float storing how much narrower each space can be
+        made to fit another word on a line.
+        leading: A float storing the height of each line.
+    """
+
+    def __init__(self, text: str, style: ParagraphStyle):
+        """Initialise Instance.
+
+        Args:
+            text: A str holding the text of the Paragraph.
+            style: A ParagraphStyle the Paragraph will be drawn in.
+        """
+        self.font_name = style.fontName
+        self.font_size = style.fontSize
+        self.words: List[str] = text.split()
+        self.word_widths: List[float] = [
+            string_width(word, self.font_name, self.font_size)
+            for word in self.words
+        ]
+        self.space_width = string_width(" ", self.font_name, self.font_size)
+        self.space_shrinkage = style.spaceShrinkage * self.space_width
+        self.leading = style.leading
+
+    def get_line_count(self, width: float) -> int:
+        """Estimate how many lines the text will take up.
+
+        Args:
+            width: A float storing the width the text will be wrapped to.
+
+        Returns:
+            An int storing the number of lines.
+        """
+        line_count = 0
+        line_width = 0.0
+        line_word_count = 0
+        for word, word_width in zip(self.words, self.word_widths):
+            # lines can overflow by the amount their spaces can shrink
+            limit = width + (self.space_shrinkage * line_word_count)
+            if line_count and (
+                (line_width + self.space_width + word_width) <= limit
+            ):
+                line_width += self.space_width + word_width
+                line_word_count += 1
+            elif word_width > width:
+                line_count, line_width = self.__split_word(
+                    word, width, line_count, line_width
+                )
+                line_word_count = 1
+            else:
+                line_count += 1
+                line_width = word_width
+                line_word_count = 1
+
+        return line_count
+
+    def __split_word(
+        self, word: str, width: float, line_count: int, line_width: float
+    ) -> Tuple[int, float]:
+        """Splits a word too long for a line between lines, starting with
+        whatever space is left on the current line, and returns the new
+        number of lines and width of the last line."""
+        if line_count:
+            line_width += self.space_width
+        else:
+            line_count = 1
+
+        for character in word:
+            character_width = string_width(
+                character, self.font_name, self.font_size
+            )
+            if (line_width + character_width) > width:
+                line_count += 1
+                line_width = 0.0
+            line_width += character_width
+
+        return line_count, line_width
+
+    def get_height(self, width: float) -> float:
+        """Estimate the height of the text.
+
+        Args:
+            width: A float storing the width the text will be wrapped to.
+
+        Returns:
+            A float storing the height.
+        """
+        return self.get_line_count(width) * self.leading
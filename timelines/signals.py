@@ -0,0 +1,23 @@
+"""Contains signal receivers to delete the files of PDFJobs.
+
+Cached timeline PDFs need no receivers, as they are keyed on a fingerprint
+of the timeline worked out for every request, see timelines.pdf.pdf_cache.
+
+Functions:
+    delete_pdf_job_file
+
+Usage:
+    Connected when the timelines app is ready, see TimelinesConfig.
+"""
+
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import PDFJob
+
+
+@receiver(post_delete, sender=PDFJob)
+def delete_pdf_job_file(sender, instance, **kwargs):
+    """Delete the PDF of a PDFJob when it is deleted, including when its
+    timeline is."""
+    instance.pdf_file.delete(save=False)
@@ -303,3 +303,8 @@ class AreaTest(TestCase):
         self.assertEqual(result_area.y, COPY_COORD)
         self.assertEqual(result_area.width, COPY_SIZE)
         self.assertEqual(result_area.height, COPY_SIZE)
+
+    def test_no_instance_dict(self):
+        with self.assertRaises(AttributeError):
+            self.main_area.colour = "red"
+        self.assertFalse(hasattr(self.main_area, "__dict__"))
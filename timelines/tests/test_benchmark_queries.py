@@ -0,0 +1,28 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+
+from timelines.models import Event, Timeline
+
+
+class BenchmarkQueriesCommandTest(TestCase):
+    def test_reports_and_rolls_back(self):
+        output = StringIO()
+        call_command(
+            "benchmark_queries",
+            timelines=2,
+            events=3,
+            repeat=1,
+            stdout=output,
+        )
+
+        report = output.getvalue()
+        for name in ["date & time", "age", "historical", "scientific"]:
+            self.assertIn(f"{name} events grouped by event area: ", report)
+            self.assertIn(f"{name} scale bounds: ", report)
+        self.assertIn("collaborator role: ", report)
+        self.assertEqual(User.objects.count(), 0)
+        self.assertEqual(Timeline.objects.count(), 0)
+        self.assertEqual(Event.objects.count(), 0)
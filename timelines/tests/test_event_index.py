@@ -0,0 +1,141 @@
+import random
+
+from django.test import TestCase
+
+from timelines.pdf.area import Area
+from timelines.pdf.event_index import EventIndex
+
+
+CELL_SIZE = 10
+
+
+class EventIndexTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.landscape_index = EventIndex("x", CELL_SIZE)
+        cls.landscape_index.add(Area(0, 0, 20, 20))
+        cls.landscape_index.add(Area(40, 0, 20, 20))
+        cls.landscape_index.add(Area(0, 30, 60, 20))
+
+        cls.portrait_index = EventIndex("y", CELL_SIZE)
+        cls.portrait_index.add(Area(0, 0, 20, 20))
+        cls.portrait_index.add(Area(0, 40, 20, 20))
+
+    def test_invalid_axis(self):
+        with self.assertRaises(ValueError):
+            EventIndex("z")
+
+    def test_invalid_cell_size(self):
+        with self.assertRaises(ValueError):
+            EventIndex("x", 0)
+
+    def test_candidates_in_order_added(self):
+        candidates = self.landscape_index.get_candidates(Area(45, 0, 5, 5))
+        self.assertEqual(len(candidates), 2)
+        self.assertEqual(candidates[0].x, 40)
+        self.assertEqual(candidates[1].y, 30)
+
+    def test_candidate_indexes(self):
+        self.assertEqual(
+            self.landscape_index.get_candidate_indexes(Area(45, 0, 5, 5)),
+            [1, 2],
+        )
+
+    def test_no_candidates(self):
+        candidates = self.landscape_index.get_candidates(Area(100, 0, 5, 5))
+        self.assertEqual(len(candidates), 0)
+
+    def test_overlapping_area(self):
+        overlap = self.landscape_index.get_overlapping_area(
+            Area(10, 10, 40, 25)
+        )
+        self.assertIsNotNone(overlap)
+        self.assertEqual(overlap.x, 0)
+        self.assertEqual(overlap.y, 0)
+
+    def test_touching_area_does_not_overlap(self):
+        overlap = self.landscape_index.get_overlapping_area(
+            Area(20, 0, 20, 20)
+        )
+        self.assertIsNone(overlap)
+
+    def test_portrait_overlapping_area(self):
+        overlap = self.portrait_index.get_overlapping_area(
+            Area(100, 45, 20, 5)
+        )
+        self.assertIsNone(overlap)
+        overlap = self.portrait_index.get_overlapping_area(
+            Area(10, 45, 20, 5)
+        )
+        self.assertIsNotNone(overlap)
+        self.assertEqual(overlap.y, 40)
+
+    def test_sync(self):
+        areas = [Area(0, 0, 10, 10), Area(20, 0, 10, 10)]
+        index = EventIndex("x", CELL_SIZE)
+        index.sync(areas)
+        self.assertEqual(len(index), 2)
+        areas.append(Area(40, 0, 10, 10))
+        index.sync(areas)
+        self.assertEqual(len(index), 3)
+
+    def test_matches_linear_search(self):
+        generator = random.Random(1)
+        for axis in ["x", "y"]:
+            index = EventIndex(axis, CELL_SIZE)
+            areas = []
+            for _ in range(200):
+                area = Area(
+                    generator.uniform(-50, 500),
+                    generator.uniform(-50, 500),
+                    generator.choice([0, generator.uniform(1, 80)]),
+                    generator.choice([0, generator.uniform(1, 80)]),
+                )
+                areas.append(area)
+                index.add(area)
+
+            for _ in range(500):
+                test_area = Area(
+                    generator.uniform(-50, 500),
+                    generator.uniform(-50, 500),
+                    generator.uniform(0, 80),
+                    generator.uniform(0, 80),
+                )
+                expected = None
+                for area in areas:
+                    if test_area.overlaps(area):
+                        expected = area
+                        break
+
+                self.assertIs(
+                    index.get_overlapping_area(test_area), expected
+                )
+                self.assertIs(
+                    index.get_overlapping_area_at(
+                        test_area.x,
+                        test_area.y,
+                        test_area.width,
+                        test_area.height,
+                    ),
+                    expected,
+                )
+
+    def test_overlap_matches_area_overlaps(self):
+        generator = random.Random(2)
+        areas = [
+            Area(
+                generator.choice([0, 10, generator.uniform(-20, 40)]),
+                generator.choice([0, 10, generator.uniform(-20, 40)]),
+                generator.choice([0, 10, generator.uniform(0, 30)]),
+                generator.choice([0, 10, generator.uniform(0, 30)]),
+            )
+            for _ in range(100)
+        ]
+        for other in areas:
+            index = EventIndex("x", CELL_SIZE)
+            index.add(other)
+            for area in areas:
+                self.assertEqual(
+                    index.get_overlapping_area(area) is other,
+                    area.overlaps(other),
+                )
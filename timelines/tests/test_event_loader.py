@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta, timezone
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from date_time_timelines.models import DateTimeEvent, DateTimeTimeline
+from date_time_timelines.view_data.date_time_timeline_data import (
+    DateTimeTimelineData,
+)
+from timelines.event_loader import NO_EVENT_AREA, load_events_by_area
+from timelines.models import EventArea, Tag
+
+
+class LoadEventsByAreaTest(TestCase):
+    @classmethod
+    def setUpTestData(self):
+        user = User.objects.create_user(
+            username="TestUser", password="TestUser01#"
+        )
+        self.timeline = DateTimeTimeline.objects.create(
+            user=user, title="Test Timeline", scale_unit=86400
+        )
+        self.tag = Tag.objects.create(
+            timeline=self.timeline, name="Shown", display=True
+        )
+        self.hidden_tag = Tag.objects.create(
+            timeline=self.timeline, name="Hidden", display=False
+        )
+
+    def __add_event_areas(self, count):
+        first = EventArea.objects.filter(timeline=self.timeline).count()
+        return [
+            EventArea.objects.create(
+                timeline=self.timeline,
+                name=f"Area {first + i}",
+                page_position=first + i,
+            )
+            for i in range(count)
+        ]
+
+    def __add_event(self, title, event_area):
+        event = DateTimeEvent.objects.create(
+            date_time_timeline=self.timeline,
+            timeline_id=self.timeline.timeline_ptr.pk,
+            title=title,
+            event_area=event_area,
+            start_date_time=datetime(2000, 1, 1, tzinfo=timezone.utc)
+            + timedelta(hours=DateTimeEvent.objects.count()),
+        )
+        event.tags.set([self.tag, self.hidden_tag])
+        return event
+
+    def __get_events(self):
+        return DateTimeEvent.objects.filter(date_time_timeline=self.timeline)
+
+    def test_grouped_by_event_area(self):
+        area_0, area_1, empty_area = self.__add_event_areas(3)
+        event_0 = self.__add_event("Event 0", area_1)
+        event_1 = self.__add_event("Event 1", area_0)
+        event_2 = self.__add_event("Event 2", area_1)
+
+        events_by_area = load_events_by_area(self.__get_events())
+
+        self.assertEqual(events_by_area[area_0.id], [event_1])
+        self.assertEqual(events_by_area[area_1.id], [event_0, event_2])
+        self.assertNotIn(empty_area.id, events_by_area)
+        self.assertNotIn(NO_EVENT_AREA, events_by_area)
+
+    def test_events_without_event_area(self):
+        (event_area,) = self.__add_event_areas(1)
+        self.__add_event("In area", event_area)
+        event = self.__add_event("No area", None)
+
+        events_by_area = load_events_by_area(self.__get_events())
+
+        self.assertEqual(events_by_area[NO_EVENT_AREA], [event])
+
+    def test_display_tags(self):
+        (event_area,) = self.__add_event_areas(1)
+        self.__add_event("Event", event_area)
+
+        events_by_area = load_events_by_area(self.__get_events())
+
+        self.assertEqual(events_by_area[event_area.id][0].display_tags, [
+            self.tag
+        ])
+
+    def test_timeline_data_query_count_constant(self):
+        for event_area in self.__add_event_areas(2):
+            self.__add_event("Event", event_area)
+        with CaptureQueriesContext(connection) as context:
+            DateTimeTimelineData(self.timeline)
+        few_areas_queries = len(context.captured_queries)
+
+        for event_area in self.__add_event_areas(10):
+            self.__add_event("Event", event_area)
+        with CaptureQueriesContext(connection) as context:
+            DateTimeTimelineData(self.timeline)
+
+        self.assertEqual(len(context.captured_queries), few_areas_queries)
+
+    def test_timeline_data_events_without_event_area(self):
+        (event_area,) = self.__add_event_areas(1)
+        self.__add_event("In area", event_area)
+        self.__add_event("No area", None)
+
+        timeline_data = DateTimeTimelineData(self.timeline)
+
+        self.assertTrue(timeline_data.has_events_without_event_area)
+        self.assertEqual(
+            [
+                event_data.title
+                for event_data in timeline_data.events_without_event_area
+            ],
+            ["No area"],
+        )
+        self.assertEqual(
+            timeline_data.events_without_event_area[0].tag_string, "(Shown)"
+        )
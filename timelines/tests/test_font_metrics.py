@@ -0,0 +1,52 @@
+import random
+
+from django.test import TestCase
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+from timelines.pdf.font_metrics import (
+    FontMetrics,
+    get_font_metrics,
+    string_width,
+)
+
+
+class FontMetricsTest(TestCase):
+    def test_precomputed_glyphs(self):
+        font_metrics = FontMetrics("Times-Roman")
+        self.assertEqual(len(font_metrics.glyph_widths), 256)
+        self.assertEqual(font_metrics.glyph_widths["A"], 722)
+
+    def test_matches_string_width(self):
+        generator = random.Random(1)
+        font_metrics = FontMetrics("Times-Roman")
+        characters = [chr(code) for code in range(32, 0x2200)]
+        for i in range(2000):
+            text = "".join(
+                generator.choice(characters[:95] if i % 2 else characters)
+                for _ in range(generator.randint(0, 60))
+            )
+            for font_size in [10, 16, 7.5]:
+                self.assertEqual(
+                    font_metrics.string_width(text, font_size),
+                    stringWidth(text, "Times-Roman", font_size),
+                )
+
+    def test_glyphs_added_when_used(self):
+        font_metrics = FontMetrics("Times-Roman")
+        font_metrics.string_width("γ", 10)
+        self.assertIn("γ", font_metrics.glyph_widths)
+
+    def test_metrics_shared(self):
+        self.assertIs(
+            get_font_metrics("Times-Roman"), get_font_metrics("Times-Roman")
+        )
+
+    def test_string_width(self):
+        self.assertEqual(
+            string_width("12 Years 5 Months", "Times-Roman", 10),
+            stringWidth("12 Years 5 Months", "Times-Roman", 10),
+        )
+        self.assertEqual(
+            string_width("Title", "Times-Bold", 16),
+            stringWidth("Title", "Times-Bold", 16),
+        )
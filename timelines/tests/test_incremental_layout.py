@@ -0,0 +1,158 @@
+from datetime import datetime, timedelta, timezone
+from random import Random
+
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+
+from date_time_timelines.models import DateTimeEvent, DateTimeTimeline
+from date_time_timelines.pdf.pdf_date_time_timeline import (
+    PDFDateTimeTimeline,
+)
+from timelines.models import EventArea, EventGeometry
+from timelines.pdf.incremental_layout import (
+    check_incremental_layout,
+    save_event_geometry,
+)
+
+START = datetime(2000, 1, 1, tzinfo=timezone.utc)
+EVENT_COUNT = 30
+
+
+class IncrementalLayoutTest(TestCase):
+    @classmethod
+    def setUpTestData(self):
+        user = User.objects.create_user(
+            username="TestUser", password="TestUser01#"
+        )
+        self.timeline = DateTimeTimeline.objects.create(
+            user=user, title="Test Timeline", scale_unit=86400
+        )
+        self.event_areas = [
+            EventArea.objects.create(
+                timeline=self.timeline, name=f"Area {i}", page_position=i
+            )
+            for i in range(2)
+        ]
+        for i in range(EVENT_COUNT):
+            self.__create_event(i, timedelta(hours=7 * i))
+
+    @classmethod
+    def __create_event(cls, i, offset, has_end=None):
+        return DateTimeEvent.objects.create(
+            date_time_timeline=cls.timeline,
+            timeline_id=cls.timeline.timeline_ptr.pk,
+            title=f"Event {i}",
+            event_area=cls.event_areas[i % 2],
+            start_date_time=START + offset,
+            has_end=(i % 4 == 0) if has_end is None else has_end,
+            end_date_time=START + offset + timedelta(days=2),
+        )
+
+    def __draw(self):
+        return PDFDateTimeTimeline(self.timeline, incremental_layout=True)
+
+    def __set_layout(self, page_orientation, event_placement):
+        self.timeline.page_orientation = page_orientation
+        self.timeline.event_placement = event_placement
+        self.timeline.save()
+
+    def test_first_draw_stores_geometry(self):
+        pdf_timeline = self.__draw()
+        self.assertEqual(pdf_timeline.reused_placements, 0)
+        self.assertEqual(EventGeometry.objects.count(), EVENT_COUNT)
+
+    def test_redraw_reuses_every_event(self):
+        self.__draw()
+        geometry_ids = set(EventGeometry.objects.values_list("pk", flat=True))
+        pdf_timeline = self.__draw()
+        self.assertEqual(pdf_timeline.reused_placements, EVENT_COUNT)
+        # nothing changed so nothing is stored again
+        self.assertEqual(
+            set(EventGeometry.objects.values_list("pk", flat=True)),
+            geometry_ids,
+        )
+
+    def test_edit_one_event(self):
+        self.__draw()
+        event = DateTimeEvent.objects.get(title="Event 20")
+        event.start_date_time += timedelta(hours=3)
+        event.end_date_time += timedelta(hours=3)
+        event.save()
+
+        pdf_timeline = self.__draw()
+        self.assertGreater(pdf_timeline.reused_placements, 0)
+        self.assertLess(pdf_timeline.reused_placements, EVENT_COUNT)
+        self.assertTrue(
+            check_incremental_layout(self.timeline, PDFDateTimeTimeline)
+        )
+
+    def test_delete_event(self):
+        self.__draw()
+        DateTimeEvent.objects.get(title="Event 20").delete()
+
+        pdf_timeline = self.__draw()
+        self.assertLess(pdf_timeline.reused_placements, EVENT_COUNT - 1)
+        self.assertEqual(EventGeometry.objects.count(), EVENT_COUNT - 1)
+
+    def test_layout_change_places_every_event(self):
+        self.__draw()
+        self.__set_layout("P", "N")
+        pdf_timeline = self.__draw()
+        self.assertEqual(pdf_timeline.reused_placements, 0)
+        self.assertEqual(EventGeometry.objects.count(), EVENT_COUNT)
+
+    def test_stale_save_replaces_geometry(self):
+        self.__draw()
+        geometries = list(EventGeometry.objects.all())
+        for geometry in geometries:
+            geometry.pk = None
+        # as saved by a PDF drawn at the same time as the one above, before
+        # either of them stored any geometry
+        save_event_geometry(self.timeline, {}, geometries)
+        self.assertEqual(EventGeometry.objects.count(), EVENT_COUNT)
+
+    def test_geometry_unique_for_each_event(self):
+        self.__draw()
+        geometry = EventGeometry.objects.first()
+        geometry.pk = None
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            geometry.save()
+
+    def test_matches_full_layout(self):
+        random = Random(0)
+        for page_orientation in ["L", "P"]:
+            for event_placement in ["N", "S"]:
+                self.__set_layout(page_orientation, event_placement)
+                self.assertTrue(
+                    check_incremental_layout(
+                        self.timeline, PDFDateTimeTimeline
+                    )
+                )
+                for i in range(6):
+                    self.__edit_random_event(random, i)
+                    self.assertTrue(
+                        check_incremental_layout(
+                            self.timeline, PDFDateTimeTimeline
+                        ),
+                        f"{page_orientation}{event_placement} edit {i}",
+                    )
+
+    def __edit_random_event(self, random, i):
+        events = list(DateTimeEvent.objects.order_by("pk"))
+        event = random.choice(events)
+        change = i % 3
+        if change == 0:
+            event.title = event.title + " and more" * random.randrange(1, 8)
+            event.save()
+        elif change == 1:
+            event.start_date_time += timedelta(hours=random.randrange(-30, 30))
+            event.end_date_time = event.start_date_time + timedelta(days=1)
+            event.save()
+        else:
+            event.delete()
+            self.__create_event(
+                random.randrange(EVENT_COUNT),
+                timedelta(hours=random.randrange(7 * EVENT_COUNT)),
+                has_end=random.random() < 0.3,
+            )
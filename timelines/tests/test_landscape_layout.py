@@ -8,6 +8,8 @@ from timelines.models import EventArea
 from timelines.pdf.layout import (
     DEFAULT_PAGE_BORDER,
     DEFAULT_COMPONENT_BORDER,
+    DEFAULT_TILE_OVERLAP,
+    A4_LONG,
     A4_SHORT,
 )
 from timelines.pdf.landscape_layout import LandscapeLayout
@@ -229,3 +231,33 @@ class LandscapeLayoutTest(TestCase):
             self.layout.drawable_area.width,
             expected_drawable_width
         )
+
+    def test_page_tiles(self):
+        tiles = self.layout.page_tiles()
+        self.assertEqual(len(tiles), 2)
+        for index, tile in enumerate(tiles):
+            self.assertAlmostEqual(
+                tile.x, index * (A4_LONG - DEFAULT_TILE_OVERLAP)
+            )
+            self.assertEqual(tile.y, 0)
+            self.assertEqual(tile.width, A4_LONG)
+            self.assertEqual(tile.height, A4_SHORT)
+        self.assertGreaterEqual(tiles[-1].right(), self.layout.page_area.width)
+
+    def test_page_tiles_expand(self):
+        self.layout.expand_event_overlap(A4_LONG)
+        tiles = self.layout.page_tiles()
+        self.assertEqual(len(tiles), 3)
+        self.assertGreaterEqual(tiles[-1].right(), self.layout.page_area.width)
+
+    def test_page_tiles_short_scale(self):
+        self.layout.set_dimensions(
+            TITLE_HEIGHT,
+            DESCRIPTION_HEIGHT,
+            100 * mm,
+            SCALE_HEIGHT,
+            TAG_KEY_HEIGHT,
+        )
+        tiles = self.layout.page_tiles()
+        self.assertEqual(len(tiles), 1)
+        self.assertEqual(tiles[0].width, self.layout.page_area.width)
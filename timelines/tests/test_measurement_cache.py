@@ -0,0 +1,156 @@
+import io
+from threading import Thread
+
+from django.test import TestCase
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import mm
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Paragraph
+
+from timelines.pdf.measurement_cache import (
+    MeasurementCache,
+    wrap_for_drawing,
+)
+
+TEXT = "some text to wrap over a few lines of a paragraph"
+
+
+class MeasurementCacheTest(TestCase):
+    def __create_paragraph_style(self, font_size: float = 10):
+        return ParagraphStyle(
+            "Basic Text ParagraphStyle",
+            fontName="Times-Roman",
+            fontSize=font_size,
+            leading=14,
+        )
+
+    def test_invalid_max_size(self):
+        with self.assertRaises(ValueError):
+            MeasurementCache(max_size=0)
+
+    def test_matches_wrap(self):
+        cache = MeasurementCache()
+        style = self.__create_paragraph_style()
+        for width in [10 * mm, 20 * mm, 40 * mm, 100 * mm]:
+            expected = Paragraph(TEXT, style).wrap(width, 0)
+            self.assertEqual(
+                cache.wrap(Paragraph(TEXT, style), width), expected
+            )
+            self.assertEqual(
+                cache.wrap(Paragraph(TEXT, style), width), expected
+            )
+
+        self.assertEqual(cache.misses, 4)
+        self.assertEqual(cache.hits, 4)
+
+    def test_get_height(self):
+        cache = MeasurementCache()
+        paragraph = Paragraph(TEXT, self.__create_paragraph_style())
+        self.assertIsNone(cache.get_height(paragraph, 20 * mm))
+
+        _, height = cache.wrap(paragraph, 20 * mm)
+        self.assertEqual(cache.get_height(paragraph, 20 * mm), height)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    def test_equal_styles_share_measurements(self):
+        cache = MeasurementCache()
+        cache.wrap(Paragraph(TEXT, self.__create_paragraph_style()), 20 * mm)
+        cache.wrap(Paragraph(TEXT, self.__create_paragraph_style()), 20 * mm)
+        cache.wrap(
+            Paragraph(TEXT, self.__create_paragraph_style(12)), 20 * mm
+        )
+
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+
+    def test_exact_width(self):
+        cache = MeasurementCache()
+        style = self.__create_paragraph_style()
+        cache.wrap(Paragraph(TEXT, style), 50)
+        cache.wrap(Paragraph(TEXT, style), 50.001)
+        cache.wrap(Paragraph(TEXT, style), 50)
+
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+
+    def test_matches_drawing_near_line_break(self):
+        cache = MeasurementCache()
+        canvas = Canvas(io.BytesIO())
+        style = self.__create_paragraph_style()
+
+        # find the narrowest width the text fits on one line at
+        narrow, wide = 0.0, 100.0
+        while wide - narrow > 1e-6:
+            width = (narrow + wide) / 2
+            if Paragraph("some text", style).wrap(width, 0)[1] == 14:
+                wide = width
+            else:
+                narrow = width
+
+        heights = []
+        for width in [narrow, wide]:
+            _, height = cache.wrap(Paragraph("some text", style), width)
+            self.assertEqual(
+                wrap_for_drawing(
+                    Paragraph("some text", style), canvas, width
+                )[1],
+                height,
+            )
+            heights.append(height)
+
+        self.assertEqual(heights, [28, 14])
+
+    def test_least_recently_used_removed(self):
+        cache = MeasurementCache(max_size=2)
+        style = self.__create_paragraph_style()
+        cache.wrap(Paragraph("first", style), 50)
+        cache.wrap(Paragraph("second", style), 50)
+        cache.wrap(Paragraph("first", style), 50)
+        cache.wrap(Paragraph("third", style), 50)
+        self.assertEqual(len(cache), 2)
+
+        cache.wrap(Paragraph("first", style), 50)
+        self.assertEqual(cache.hits, 2)
+        cache.wrap(Paragraph("second", style), 50)
+        self.assertEqual(cache.misses, 4)
+
+    def test_clear(self):
+        cache = MeasurementCache()
+        cache.wrap(Paragraph(TEXT, self.__create_paragraph_style()), 50)
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.misses, 0)
+
+    def test_threads(self):
+        cache = MeasurementCache(max_size=50)
+        style = self.__create_paragraph_style()
+
+        def measure():
+            for i in range(200):
+                cache.wrap(Paragraph(f"{TEXT} {i % 80}", style), 20 * mm)
+
+        threads = [Thread(target=measure) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(cache.hits + cache.misses, 800)
+        self.assertEqual(len(cache), 50)
+
+    def test_wrap_for_drawing(self):
+        cache = MeasurementCache()
+        canvas = Canvas(io.BytesIO())
+        style = self.__create_paragraph_style()
+        cache.wrap(Paragraph(TEXT, style), 20 * mm)
+
+        paragraph = Paragraph(TEXT, style)
+        width, height = cache.wrap(paragraph, 20 * mm)
+        self.assertFalse(hasattr(paragraph, "blPara"))
+
+        self.assertEqual(
+            wrap_for_drawing(paragraph, canvas, 20 * mm), (width, height)
+        )
+        self.assertTrue(hasattr(paragraph, "blPara"))
@@ -1,7 +1,18 @@
 from django.contrib.auth.models import User
-from django.test import TestCase
-
-from timelines.models import Event, EventArea, Tag, Timeline
+from django.test import RequestFactory, TestCase
+
+from timelines.models import (
+    Collaborator,
+    Event,
+    EventArea,
+    Tag,
+    Timeline,
+    ROLE_EVENT_EDITOR,
+    ROLE_NONE,
+    ROLE_OWNER,
+    ROLE_VIEWER,
+)
+from timelines.mixins import UserRoleMixin
 
 
 class TimelineModel(TestCase):
@@ -61,6 +72,21 @@ class TimelineModel(TestCase):
         default = timeline._meta.get_field("page_size").default
         self.assertEqual(default, "4")
 
+    def test_page_tiling_max_length(self):
+        timeline = Timeline.objects.get(id=self.timeline_id)
+        max_length = timeline._meta.get_field("page_tiling").max_length
+        self.assertEqual(max_length, 1)
+
+    def test_page_tiling_choices(self):
+        timeline = Timeline.objects.get(id=self.timeline_id)
+        choices = timeline._meta.get_field("page_tiling").choices
+        self.assertEqual(choices, Timeline.PAGE_TILINGS)
+
+    def test_page_tiling_default(self):
+        timeline = Timeline.objects.get(id=self.timeline_id)
+        default = timeline._meta.get_field("page_tiling").default
+        self.assertEqual(default, "S")
+
     def test_page_orientation_max_length(self):
         timeline = Timeline.objects.get(id=self.timeline_id)
         max_length = timeline._meta.get_field("page_orientation").max_length
@@ -258,3 +284,71 @@ class TagModel(TestCase):
         tag = Tag.objects.get(id=self.tag_id)
         expected_owner = tag.timeline.user
         self.assertEqual(tag.get_owner(), expected_owner)
+
+
+class TimelineRoleTest(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="Owner", password="TestUser01#"
+        )
+        self.user = User.objects.create_user(
+            username="Collaborator", password="TestUser01#"
+        )
+        self.timeline = Timeline.objects.create(
+            user=self.owner, title="Test Timeline Title"
+        )
+
+    def test_owner(self):
+        with self.assertNumQueries(0):
+            role = self.timeline.get_role(self.owner)
+        self.assertEqual(role, ROLE_OWNER)
+
+    def test_none(self):
+        self.assertEqual(self.timeline.get_role(None), ROLE_NONE)
+        self.assertEqual(self.timeline.get_role(self.user), ROLE_NONE)
+
+    def test_reads_current_role(self):
+        Collaborator.objects.create(
+            timeline=self.timeline, user=self.user, role=ROLE_VIEWER
+        )
+        self.assertEqual(self.timeline.get_role(self.user), ROLE_VIEWER)
+
+        # as another process would, without sending signals
+        Collaborator.objects.filter(timeline=self.timeline).delete()
+        with self.assertNumQueries(1):
+            role = self.timeline.get_role(self.user)
+        self.assertEqual(role, ROLE_NONE)
+
+    def test_user_role_mixin_reads_role_once(self):
+        Collaborator.objects.create(
+            timeline=self.timeline, user=self.user, role=ROLE_VIEWER
+        )
+        view = UserRoleMixin()
+        view.request = RequestFactory().get("/")
+        view.request.user = self.user
+        self.assertEqual(view.get_user_role(self.timeline), ROLE_VIEWER)
+        with self.assertNumQueries(0):
+            role = view.get_user_role(self.timeline)
+        self.assertEqual(role, ROLE_VIEWER)
+
+    def test_invalidated_on_save(self):
+        self.assertEqual(self.timeline.get_role(self.user), ROLE_NONE)
+        collaborator = Collaborator.objects.create(
+            timeline=self.timeline, user=self.user, role=ROLE_VIEWER
+        )
+        self.assertEqual(self.timeline.get_role(self.user), ROLE_VIEWER)
+
+        collaborator.role = ROLE_EVENT_EDITOR
+        collaborator.save()
+        self.assertEqual(
+            self.timeline.get_role(self.user), ROLE_EVENT_EDITOR
+        )
+
+    def test_invalidated_on_delete(self):
+        collaborator = Collaborator.objects.create(
+            timeline=self.timeline, user=self.user, role=ROLE_VIEWER
+        )
+        self.assertEqual(self.timeline.get_role(self.user), ROLE_VIEWER)
+
+        collaborator.delete()
+        self.assertEqual(self.timeline.get_role(self.user), ROLE_NONE)
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from reportlab import rl_config
+
+from date_time_timelines.models import DateTimeEvent, DateTimeTimeline
+from date_time_timelines.pdf.pdf_date_time_timeline import (
+    PDFDateTimeTimeline,
+)
+from timelines.models import EventArea, Tag
+
+
+class ParallelLayoutTest(TestCase):
+    @classmethod
+    def setUpTestData(self):
+        user = User.objects.create_user(
+            username="TestUser", password="TestUser01#"
+        )
+        self.timelines = []
+        for orientation in ["L", "P"]:
+            for event_placement in ["N", "S"]:
+                self.timelines.append(
+                    self.__create_timeline(
+                        user, orientation, event_placement
+                    )
+                )
+
+    @classmethod
+    def __create_timeline(self, user, orientation, event_placement):
+        timeline = DateTimeTimeline.objects.create(
+            user=user,
+            title="Test Timeline",
+            scale_unit=86400,
+            page_orientation=orientation,
+            page_scale_position=1,
+            event_placement=event_placement,
+        )
+        event_areas = [
+            EventArea.objects.create(
+                timeline=timeline, name=f"Area {i}", page_position=i * 2
+            )
+            for i in range(3)
+        ]
+        tag = Tag.objects.create(timeline=timeline, name="Tag")
+        start = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        for i in range(30):
+            event = DateTimeEvent.objects.create(
+                date_time_timeline=timeline,
+                timeline_id=timeline.timeline_ptr.pk,
+                title=f"Event {i}" + " title" * (i % 4),
+                description="some words to wrap " * (i % 6),
+                event_area=event_areas[i % 3],
+                start_date_time=start + timedelta(hours=(i * 7) % 100),
+                has_end=(i % 5 == 0),
+                end_date_time=start + timedelta(hours=(i * 7) % 100 + 30),
+            )
+            if i % 2:
+                event.tags.add(tag)
+
+        return timeline
+
+    def setUp(self):
+        self.invariant = rl_config.invariant
+        rl_config.invariant = 1
+
+    def tearDown(self):
+        rl_config.invariant = self.invariant
+
+    def test_same_as_serial(self):
+        for timeline in self.timelines:
+            serial = PDFDateTimeTimeline(timeline)
+            parallel = PDFDateTimeTimeline(timeline, parallel_layout=True)
+            self.assertEqual(
+                parallel.buffer.getvalue(), serial.buffer.getvalue()
+            )
+
+            for serial_area, parallel_area in zip(
+                serial.layout.event_areas, parallel.layout.event_areas
+            ):
+                self.assertEqual(
+                    [(e.x, e.y, e.width, e.height)
+                     for e in parallel_area.events],
+                    [(e.x, e.y, e.width, e.height)
+                     for e in serial_area.events],
+                )
@@ -0,0 +1,190 @@
+from datetime import datetime
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+
+from date_time_timelines.models import DateTimeEvent, DateTimeTimeline
+from date_time_timelines.pdf.pdf_date_time_timeline import (
+    PDFDateTimeTimeline,
+)
+from timelines.models import EventArea, Tag
+from timelines.pdf.pdf_cache import (
+    PDF_CACHE_ALIAS,
+    get_fingerprint,
+    get_timeline_pdf,
+    open_timeline_pdf,
+)
+
+
+class CountingPDFDateTimeTimeline(PDFDateTimeTimeline):
+    draw_count = 0
+
+    def __init__(
+        self,
+        timeline,
+        parallel_layout=False,
+        buffer=None,
+        incremental_layout=False,
+    ):
+        CountingPDFDateTimeTimeline.draw_count += 1
+        super().__init__(
+            timeline, parallel_layout, buffer, incremental_layout
+        )
+
+
+class PDFCacheTest(TestCase):
+    @classmethod
+    def setUpTestData(self):
+        self.user = User.objects.create_user(
+            username="TestUser", password="TestUser01#"
+        )
+        self.timeline = DateTimeTimeline.objects.create(
+            user=self.user,
+            title="Test Timeline",
+            page_orientation="L",
+        )
+        self.event_area = EventArea.objects.create(
+            timeline=self.timeline, name="Area", page_position=1
+        )
+        self.tag = Tag.objects.create(timeline=self.timeline, name="Tag")
+        self.event = DateTimeEvent.objects.create(
+            date_time_timeline=self.timeline,
+            timeline_id=self.timeline.timeline_ptr.pk,
+            title="Event",
+            start_date_time=datetime(year=2000, month=2, day=24),
+            event_area=self.event_area,
+        )
+
+    def setUp(self):
+        caches[PDF_CACHE_ALIAS].clear()
+        CountingPDFDateTimeTimeline.draw_count = 0
+
+    def __get_events(self):
+        return DateTimeEvent.objects.filter(date_time_timeline=self.timeline)
+
+    def __get_pdf(self):
+        return get_timeline_pdf(
+            self.timeline, CountingPDFDateTimeTimeline, self.__get_events()
+        )
+
+    def test_pdf_cached(self):
+        pdf_data = self.__get_pdf()
+        self.assertTrue(pdf_data.startswith(b"%PDF"))
+        self.assertEqual(self.__get_pdf(), pdf_data)
+        self.assertEqual(CountingPDFDateTimeTimeline.draw_count, 1)
+
+    def test_fingerprint_stable(self):
+        self.assertEqual(
+            get_fingerprint(self.timeline, self.__get_events()),
+            get_fingerprint(self.timeline, self.__get_events()),
+        )
+
+    def test_fingerprint_changes(self):
+        fingerprint = get_fingerprint(self.timeline, self.__get_events())
+        self.event.title = "New Title"
+        self.event.save()
+        self.assertNotEqual(
+            get_fingerprint(self.timeline, self.__get_events()), fingerprint
+        )
+
+    def test_invalidated_by_event_save(self):
+        self.__get_pdf()
+        self.event.title = "New Title"
+        self.event.save()
+        self.__get_pdf()
+        self.assertEqual(CountingPDFDateTimeTimeline.draw_count, 2)
+
+    def test_invalidated_by_event_delete(self):
+        self.__get_pdf()
+        self.event.delete()
+        self.__get_pdf()
+        self.assertEqual(CountingPDFDateTimeTimeline.draw_count, 2)
+
+    def test_invalidated_by_timeline_save(self):
+        self.__get_pdf()
+        self.timeline.title = "New Title"
+        self.timeline.save()
+        self.__get_pdf()
+        self.assertEqual(CountingPDFDateTimeTimeline.draw_count, 2)
+
+    def test_invalidated_by_event_area_save(self):
+        self.__get_pdf()
+        self.event_area.display_event_time = False
+        self.event_area.save()
+        self.__get_pdf()
+        self.assertEqual(CountingPDFDateTimeTimeline.draw_count, 2)
+
+    def test_invalidated_by_tag_save(self):
+        self.__get_pdf()
+        self.tag.display = False
+        self.tag.save()
+        self.__get_pdf()
+        self.assertEqual(CountingPDFDateTimeTimeline.draw_count, 2)
+
+    def test_invalidated_by_tags_change(self):
+        first = self.__get_pdf()
+        self.event.tags.add(self.tag)
+        self.assertNotEqual(self.__get_pdf(), first)
+        self.tag.event_set.remove(self.event)
+        self.assertEqual(self.__get_pdf(), first)
+        self.assertEqual(CountingPDFDateTimeTimeline.draw_count, 2)
+
+    def test_change_without_signals_redrawn(self):
+        self.__get_pdf()
+        DateTimeEvent.objects.filter(pk=self.event.pk).update(
+            title="New Title"
+        )
+        self.__get_pdf()
+        self.assertEqual(CountingPDFDateTimeTimeline.draw_count, 2)
+
+    def test_unchanged_content_shares_pdf(self):
+        self.__get_pdf()
+        self.event.save()
+        self.__get_pdf()
+        self.assertEqual(CountingPDFDateTimeTimeline.draw_count, 1)
+
+    def test_pdf_view(self):
+        self.client.login(username="TestUser", password="TestUser01#")
+        url = reverse(
+            "date_time_timelines:date-time-timeline-pdf",
+            args=[self.timeline.id],
+        )
+        first = b"".join(self.client.get(url).streaming_content)
+        second = b"".join(self.client.get(url).streaming_content)
+        self.assertTrue(first.startswith(b"%PDF"))
+        self.assertEqual(first, second)
+
+    def test_open_pdf(self):
+        pdf_data = self.__get_pdf()
+        with open_timeline_pdf(
+            self.timeline, CountingPDFDateTimeTimeline, self.__get_events()
+        ) as pdf_file:
+            self.assertEqual(pdf_file.read(), pdf_data)
+        self.assertEqual(CountingPDFDateTimeTimeline.draw_count, 1)
+
+    def test_large_pdf_not_cached(self):
+        with patch("timelines.pdf.pdf_cache.PDF_CACHE_MAX_SIZE", 100):
+            pdf_data = self.__get_pdf()
+            self.__get_pdf()
+        self.assertTrue(pdf_data.startswith(b"%PDF"))
+        self.assertEqual(CountingPDFDateTimeTimeline.draw_count, 2)
+
+    def test_pdf_view_range(self):
+        self.client.login(username="TestUser", password="TestUser01#")
+        url = reverse(
+            "date_time_timelines:date-time-timeline-pdf",
+            args=[self.timeline.id],
+        )
+        whole = self.client.get(url)
+        pdf_data = b"".join(whole.streaming_content)
+        self.assertEqual(whole["Accept-Ranges"], "bytes")
+        self.assertEqual(whole["Content-Length"], str(len(pdf_data)))
+
+        response = self.client.get(url, HTTP_RANGE="bytes=100-")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(
+            b"".join(response.streaming_content), pdf_data[100:]
+        )
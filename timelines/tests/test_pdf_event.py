@@ -6,6 +6,7 @@ from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import mm
 from reportlab.pdfgen.canvas import Canvas
 
+from timelines.pdf.measurement_cache import measurement_cache
 from timelines.pdf.pdf_event import PDFEvent
 
 DEFAULT_EVENT_BORDER = 0.5 * mm
@@ -191,3 +192,79 @@ class PDFEventTest(TestCase):
         self.assertTrue(test_event.sized_to_max_width)
         self.assertGreaterEqual(test_event.width, test_event.min_width)
         self.assertLessEqual(test_event.width, max_width)
+
+    def test_landscape_within_tolerance(self):
+        canvas = self.__create_canvas()
+        paragraph_style = self.__create_paragraph_style()
+        max_height = 100 * mm
+        width_tolerance = 0.5 * mm
+
+        test_event = PDFEvent(
+            "12 Years 5 Months",
+            LARGE_STRING,
+            VERY_LARGE_STRING,
+            "Tags(Tag Name 0, Tag Name 1, Tag Name 2)",
+            "L",
+            canvas,
+            paragraph_style,
+            paragraph_style,
+            paragraph_style,
+            paragraph_style,
+            DEFAULT_EVENT_BORDER,
+            max_height=max_height,
+            width_tolerance=width_tolerance,
+        )
+
+        self.assertTrue(test_event.sized_to_ratio)
+        self.assertGreaterEqual(
+            test_event.text_width / test_event.height, 2.0
+        )
+        narrower_width, narrower_height = test_event._get_dimensions(
+            test_event.text_width - width_tolerance
+        )
+        self.assertLess(narrower_width / narrower_height, 2.0)
+
+    def test_wrap_count(self):
+        canvas = self.__create_canvas()
+        paragraph_style = self.__create_paragraph_style()
+        measurement_cache.clear()
+
+        def create_small_event():
+            return PDFEvent(
+                "12 Years 5 Months",
+                "small",
+                "",
+                "",
+                "L",
+                canvas,
+                paragraph_style,
+                paragraph_style,
+                paragraph_style,
+                paragraph_style,
+                DEFAULT_EVENT_BORDER,
+                max_height=100 * mm,
+            )
+
+        small_event = create_small_event()
+        cached_event = create_small_event()
+        large_event = PDFEvent(
+            "12 Years 5 Months",
+            LARGE_STRING,
+            VERY_LARGE_STRING,
+            "Tags(Tag Name 0, Tag Name 1, Tag Name 2)",
+            "L",
+            canvas,
+            paragraph_style,
+            paragraph_style,
+            paragraph_style,
+            paragraph_style,
+            DEFAULT_EVENT_BORDER,
+            max_height=100 * mm,
+        )
+
+        # measured once at full width, which leaves it wrapped to be drawn
+        self.assertEqual(small_event.wrap_count, 4)
+        # measured from the measurement_cache then wrapped to be drawn
+        self.assertEqual(cached_event.wrap_count, 4)
+        # and for large events the estimate and the width either side of it
+        self.assertLessEqual(large_event.wrap_count, 16)
@@ -1,10 +1,48 @@
+import random
+
 from django.test import TestCase
+from reportlab.lib.units import mm
 
 from timelines.pdf.area import Area
 from timelines.pdf.pdf_event import PDFEventEmpty
 from timelines.pdf.pdf_event_area import PDFEventArea
 
 
+def create_random_event_area(generator, orientation, event_count):
+    """Create a PDFEventArea with randomly sized events positioned in it
+    using the recursive search."""
+    if orientation == "L":
+        pdf_event_area = PDFEventArea(0, 0, 300, 80, None)
+    else:
+        pdf_event_area = PDFEventArea(0, 0, 80, 300, None)
+
+    for _ in range(event_count):
+        event = create_random_event(generator, orientation)
+        if orientation == "L":
+            position = pdf_event_area.get_landscape_position(
+                event, True, True, None, 5
+            )
+        else:
+            position = pdf_event_area.get_portrait_position(
+                event, True, True, None, 5
+            )
+        if position is not None:
+            event.x, event.y = position
+        pdf_event_area.events.append(event)
+
+    return pdf_event_area
+
+
+def create_random_event(generator, orientation):
+    """Create an event at a random position along the scale."""
+    width = generator.randint(10, 40)
+    height = generator.randint(5, 25)
+    if orientation == "L":
+        return PDFEventEmpty(generator.randint(0, 280), 0, width, height)
+    else:
+        return PDFEventEmpty(0, generator.randint(-20, 280), width, height)
+
+
 class PDFEventAreaTest(TestCase):
     @classmethod
     def setUpTestData(cls):
@@ -187,3 +225,157 @@ class PDFEventAreaTest(TestCase):
             5
         )
         self.assertIsNone(position)
+
+    def test_search_landscape_matches_recursive(self):
+        test_areas = [
+            Area(10, 0, 20, 30),
+            Area(40, 0, 20, 20),
+            Area(60, 0, 30, 30),
+            Area(80, 0, 30, 30),
+            Area(140, 0, 30, 30),
+            Area(0, 0, 30, 90),
+        ]
+        for test_area in test_areas:
+            self.assertEqual(
+                self.pdf_event_area_landscape.search_landscape_position(
+                    test_area, 5
+                ),
+                self.pdf_event_area_landscape.get_landscape_position(
+                    test_area, True, True, None, 5
+                ),
+            )
+            self.assertFalse(
+                self.pdf_event_area_landscape.search_budget_exhausted
+            )
+
+    def test_search_portrait_matches_recursive(self):
+        test_areas = [
+            Area(0, 10, 20, 20),
+            Area(0, 40, 20, 20),
+            Area(0, 60, 30, 30),
+            Area(0, 80, 30, 30),
+            Area(0, -20, 30, 30),
+            Area(0, 0, 90, 30),
+        ]
+        for test_area in test_areas:
+            self.assertEqual(
+                self.pdf_event_area_portrait.search_portrait_position(
+                    test_area, 5
+                ),
+                self.pdf_event_area_portrait.get_portrait_position(
+                    test_area, True, True, None, 5
+                ),
+            )
+            self.assertFalse(
+                self.pdf_event_area_portrait.search_budget_exhausted
+            )
+
+    def test_search_matches_recursive_crowded(self):
+        generator = random.Random(2)
+        for orientation in ["L", "P"]:
+            pdf_event_area = create_random_event_area(
+                generator, orientation, 12
+            )
+            for _ in range(50):
+                event = create_random_event(generator, orientation)
+                if orientation == "L":
+                    expected = pdf_event_area.get_landscape_position(
+                        event, True, True, None, 5
+                    )
+                    position = pdf_event_area.search_landscape_position(
+                        event, 5
+                    )
+                else:
+                    expected = pdf_event_area.get_portrait_position(
+                        event, True, True, None, 5
+                    )
+                    position = pdf_event_area.search_portrait_position(
+                        event, 5
+                    )
+                self.assertEqual(position, expected)
+                self.assertFalse(pdf_event_area.search_budget_exhausted)
+
+    def test_search_budget_exhausted(self):
+        test_area = Area(60, 0, 30, 30)
+        position = self.pdf_event_area_landscape.search_landscape_position(
+            test_area, 5, 1
+        )
+        self.assertIsNone(position)
+        self.assertTrue(self.pdf_event_area_landscape.search_budget_exhausted)
+        self.assertEqual(self.pdf_event_area_landscape.search_count, 1)
+
+        position = self.pdf_event_area_landscape.search_landscape_position(
+            test_area, 5
+        )
+        self.assertEqual(position, (35, 25))
+        self.assertFalse(
+            self.pdf_event_area_landscape.search_budget_exhausted
+        )
+
+    def test_skyline_landscape_position(self):
+        pdf_event_area = PDFEventArea(0, 0, 160, 80, None)
+        areas = [
+            Area(10, 0, 30, 30),
+            Area(20, 0, 30, 30),
+            Area(30, 0, 30, 30),
+            Area(45, 0, 30, 30),
+        ]
+        positions = [
+            pdf_event_area.skyline_landscape_position(area, 5)
+            for area in areas
+        ]
+        self.assertEqual(positions, [(10, 0), (20, 35), (55, 0), (55, 35)])
+
+    def test_skyline_landscape_too_big(self):
+        pdf_event_area = PDFEventArea(0, 0, 160, 80, None)
+        position = pdf_event_area.skyline_landscape_position(
+            Area(0, 0, 30, 90), 5
+        )
+        self.assertIsNone(position)
+
+    def test_skyline_portrait_position(self):
+        pdf_event_area = PDFEventArea(0, 0, 80, 160, None)
+        areas = [
+            Area(0, 120, 30, 30),
+            Area(0, 110, 30, 30),
+            Area(0, 100, 30, 30),
+            Area(0, 85, 30, 30),
+        ]
+        positions = [
+            pdf_event_area.skyline_portrait_position(area, 5)
+            for area in areas
+        ]
+        self.assertEqual(
+            positions, [(0, 120), (35, 110), (0, 75), (35, 75)]
+        )
+
+    def test_skyline_portrait_too_big(self):
+        pdf_event_area = PDFEventArea(0, 0, 80, 160, None)
+        position = pdf_event_area.skyline_portrait_position(
+            Area(0, 0, 90, 30), 5
+        )
+        self.assertIsNone(position)
+
+    def test_place_events(self):
+        pdf_event_area = PDFEventArea(0, 0, 160, 80, None)
+        areas = [
+            Area(10, 0, 30, 30),
+            Area(20, 0, 30, 30),
+            Area(150, 0, 30, 30),
+        ]
+        overlap = pdf_event_area.place_events(areas, "L", True)
+
+        self.assertEqual(overlap, 20)
+        self.assertEqual(pdf_event_area.events, areas)
+        self.assertEqual(
+            [(area.x, area.y) for area in areas],
+            [(10, 0), (20, 30 + mm), (150, 0)],
+        )
+
+    def test_place_events_portrait(self):
+        pdf_event_area = PDFEventArea(0, 0, 80, 160, None)
+        areas = [Area(0, 120, 30, 30), Area(0, -10, 30, 30)]
+        overlap = pdf_event_area.place_events(areas, "P", False)
+
+        self.assertEqual(overlap, 10)
+        self.assertEqual(len(pdf_event_area.events), 2)
@@ -0,0 +1,256 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from date_time_timelines.models import DateTimeEvent, DateTimeTimeline
+from date_time_timelines.pdf.pdf_date_time_timeline import (
+    PDFDateTimeTimeline,
+)
+from timelines.models import PDFJob
+from timelines.pdf.pdf_cache import PDF_CACHE_ALIAS
+from timelines.pdf.pdf_jobs import (
+    PDF_JOB_ERROR,
+    PDF_JOB_EXPIRY,
+    PDF_JOB_TIMEOUT,
+    enqueue_pdf_job,
+    requeue_lost_pdf_jobs,
+    run_next_pdf_job,
+    run_pdf_job,
+)
+
+
+class PDFJobTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        media_root = cls.enterClassContext(tempfile.TemporaryDirectory())
+        cls.enterClassContext(override_settings(MEDIA_ROOT=media_root))
+
+    @classmethod
+    def setUpTestData(self):
+        self.user = User.objects.create_user(
+            username="TestUser", password="TestUser01#"
+        )
+        User.objects.create_user(
+            username="OtherUser", password="OtherUser01#"
+        )
+        self.timeline = DateTimeTimeline.objects.create(
+            user=self.user,
+            title="Test Timeline",
+        )
+        self.event = DateTimeEvent.objects.create(
+            date_time_timeline=self.timeline,
+            timeline_id=self.timeline.timeline_ptr.pk,
+            title="Event",
+            start_date_time=datetime(year=2000, month=2, day=24),
+        )
+
+    def setUp(self):
+        caches[PDF_CACHE_ALIAS].clear()
+
+    def __enqueue(self):
+        return enqueue_pdf_job(
+            self.timeline,
+            PDFDateTimeTimeline,
+            DateTimeEvent.objects.filter(date_time_timeline=self.timeline),
+        )
+
+    def test_enqueue(self):
+        pdf_job = self.__enqueue()
+
+        self.assertEqual(pdf_job.status, PDFJob.STATUS_QUEUED)
+        self.assertEqual(
+            pdf_job.timeline_model, "date_time_timelines.DateTimeTimeline"
+        )
+
+    def test_enqueue_deduplicated(self):
+        first = self.__enqueue()
+        second = self.__enqueue()
+
+        self.assertEqual(first.id, second.id)
+        self.assertEqual(PDFJob.objects.count(), 1)
+
+    def test_run(self):
+        pdf_job = self.__enqueue()
+        run_pdf_job(pdf_job.id)
+        pdf_job.refresh_from_db()
+
+        self.assertEqual(pdf_job.status, PDFJob.STATUS_DONE)
+        with pdf_job.pdf_file.open("rb") as pdf_file:
+            self.assertTrue(pdf_file.read().startswith(b"%PDF"))
+        self.assertTrue(pdf_job.is_finished())
+
+    def test_run_once(self):
+        pdf_job = self.__enqueue()
+        run_pdf_job(pdf_job.id)
+        PDFJob.objects.filter(id=pdf_job.id).update(pdf_file="")
+        run_pdf_job(pdf_job.id)
+        pdf_job.refresh_from_db()
+
+        self.assertEqual(pdf_job.pdf_file.name, "")
+
+    def test_delete_removes_file(self):
+        pdf_job = self.__enqueue()
+        run_pdf_job(pdf_job.id)
+        pdf_job.refresh_from_db()
+        path = pdf_job.pdf_file.path
+        self.assertTrue(os.path.exists(path))
+
+        pdf_job.delete()
+        self.assertFalse(os.path.exists(path))
+
+    def test_expired_job_removed(self):
+        pdf_job = self.__enqueue()
+        run_pdf_job(pdf_job.id)
+        pdf_job.refresh_from_db()
+        PDFJob.objects.filter(id=pdf_job.id).update(
+            updated=timezone.now() - PDF_JOB_EXPIRY - timedelta(minutes=1)
+        )
+        new_job = self.__enqueue()
+
+        self.assertNotEqual(new_job.id, pdf_job.id)
+        self.assertEqual(new_job.status, PDFJob.STATUS_QUEUED)
+        self.assertFalse(os.path.exists(pdf_job.pdf_file.path))
+
+    def test_finished_job_reused(self):
+        pdf_job = self.__enqueue()
+        run_pdf_job(pdf_job.id)
+        pdf_job = self.__enqueue()
+
+        self.assertEqual(pdf_job.status, PDFJob.STATUS_DONE)
+
+    def test_run_failed(self):
+        pdf_job = self.__enqueue()
+        PDFJob.objects.filter(id=pdf_job.id).update(
+            pdf_class="timelines.pdf.missing.PDFMissing"
+        )
+        with self.assertLogs("timelines.pdf.pdf_jobs", "ERROR") as logs:
+            run_pdf_job(pdf_job.id)
+        pdf_job.refresh_from_db()
+
+        self.assertEqual(pdf_job.status, PDFJob.STATUS_FAILED)
+        self.assertEqual(pdf_job.error, PDF_JOB_ERROR)
+        self.assertIn("timelines.pdf.missing", logs.output[0])
+
+    def test_failed_job_restarted(self):
+        pdf_job = self.__enqueue()
+        PDFJob.objects.filter(id=pdf_job.id).update(
+            status=PDFJob.STATUS_FAILED, error="Error"
+        )
+        pdf_job = self.__enqueue()
+
+        self.assertEqual(pdf_job.status, PDFJob.STATUS_QUEUED)
+        self.assertEqual(pdf_job.error, "")
+
+    def test_lost_job_restarted(self):
+        pdf_job = self.__enqueue()
+        PDFJob.objects.filter(id=pdf_job.id).update(
+            status=PDFJob.STATUS_RUNNING,
+            updated=timezone.now() - PDF_JOB_TIMEOUT - timedelta(minutes=1),
+        )
+        pdf_job = self.__enqueue()
+
+        self.assertEqual(pdf_job.status, PDFJob.STATUS_QUEUED)
+
+    def test_running_job_not_restarted(self):
+        pdf_job = self.__enqueue()
+        PDFJob.objects.filter(id=pdf_job.id).update(
+            status=PDFJob.STATUS_RUNNING
+        )
+        pdf_job = self.__enqueue()
+
+        self.assertEqual(pdf_job.status, PDFJob.STATUS_RUNNING)
+
+    def test_run_next(self):
+        pdf_job = self.__enqueue()
+        self.assertTrue(run_next_pdf_job())
+        pdf_job.refresh_from_db()
+
+        self.assertEqual(pdf_job.status, PDFJob.STATUS_DONE)
+        self.assertFalse(run_next_pdf_job())
+
+    def test_lost_job_requeued(self):
+        pdf_job = self.__enqueue()
+        PDFJob.objects.filter(id=pdf_job.id).update(
+            status=PDFJob.STATUS_RUNNING,
+            updated=timezone.now() - PDF_JOB_TIMEOUT - timedelta(minutes=1),
+        )
+        self.assertEqual(requeue_lost_pdf_jobs(), 1)
+        pdf_job.refresh_from_db()
+
+        self.assertEqual(pdf_job.status, PDFJob.STATUS_QUEUED)
+
+    def test_running_job_not_requeued(self):
+        pdf_job = self.__enqueue()
+        PDFJob.objects.filter(id=pdf_job.id).update(
+            status=PDFJob.STATUS_RUNNING
+        )
+        self.assertEqual(requeue_lost_pdf_jobs(), 0)
+
+    def test_run_pdf_jobs_command(self):
+        pdf_job = self.__enqueue()
+        call_command("run_pdf_jobs", once=True)
+        pdf_job.refresh_from_db()
+
+        self.assertEqual(pdf_job.status, PDFJob.STATUS_DONE)
+
+    def test_changed_timeline(self):
+        first = self.__enqueue()
+        run_pdf_job(first.id)
+        self.event.title = "New Title"
+        self.event.save()
+        second = self.__enqueue()
+
+        self.assertNotEqual(first.id, second.id)
+        self.assertFalse(PDFJob.objects.filter(id=first.id).exists())
+
+    def test_views(self):
+        self.client.login(username="TestUser", password="TestUser01#")
+        response = self.client.get(
+            reverse(
+                "date_time_timelines:date-time-timeline-pdf",
+                args=[self.timeline.id],
+            ),
+            {"background": 1},
+        )
+        self.assertEqual(response.status_code, 202)
+        data = response.json()
+        self.assertEqual(data["status"], "Queued")
+        self.assertIsNone(data["download_url"])
+
+        download_url = reverse(
+            "timelines:pdf-job-download", args=[data["id"]]
+        )
+        self.assertEqual(self.client.get(download_url).status_code, 409)
+
+        run_pdf_job(data["id"])
+        data = self.client.get(data["status_url"]).json()
+        self.assertEqual(data["status"], "Done")
+        self.assertEqual(data["download_url"], download_url)
+
+        response = self.client.get(download_url)
+        pdf_data = b"".join(response.streaming_content)
+        self.assertTrue(pdf_data.startswith(b"%PDF"))
+
+    def test_views_forbidden(self):
+        pdf_job = self.__enqueue()
+        self.client.login(username="OtherUser", password="OtherUser01#")
+        for name in ["pdf-job-status", "pdf-job-download"]:
+            response = self.client.get(
+                reverse(f"timelines:{name}", args=[pdf_job.id])
+            )
+            self.assertEqual(response.status_code, 403)
+
+    def test_views_anonymous(self):
+        pdf_job = self.__enqueue()
+        for name in ["pdf-job-status", "pdf-job-download"]:
+            url = reverse(f"timelines:{name}", args=[pdf_job.id])
+            response = self.client.get(url)
+            self.assertRedirects(response, f"/accounts/login/?next={url}")
@@ -0,0 +1,98 @@
+import io
+import random
+from unittest.mock import patch
+
+from django.test import TestCase
+from reportlab.pdfgen.canvas import Canvas
+
+from timelines.pdf.area import Area
+from timelines.pdf.pdf_lines import LineCoordinates, PDFLines
+
+
+class PDFLinesTest(TestCase):
+    def setUp(self):
+        self.canvas = Canvas(io.BytesIO())
+        self.lines = PDFLines()
+        self.scale_line = LineCoordinates(0, 20, 300, 20)
+        self.unit_lines = [
+            LineCoordinates(x, 0, x, 20) for x in range(0, 301, 50)
+        ]
+        self.lines.add(*self.scale_line)
+        self.lines.extend(self.unit_lines)
+
+    def __get_drawn_lines(self, visible_area=None):
+        drawn = []
+        with patch.object(
+            self.canvas,
+            "lines",
+            side_effect=lambda lines: drawn.append(
+                [LineCoordinates(*line) for line in lines]
+            ),
+        ), patch.object(
+            self.canvas, "translate", wraps=self.canvas.translate
+        ) as translate:
+            self.lines.draw(self.canvas, 100, 10, visible_area)
+
+        if not drawn:
+            return []
+
+        self.assertEqual(len(drawn), 1)
+        translate.assert_called_once_with(100, 10)
+        return drawn[0]
+
+    def test_len(self):
+        self.assertEqual(len(self.lines), 8)
+
+    def test_get_lines(self):
+        self.assertEqual(
+            self.lines.get_lines(), [self.scale_line] + self.unit_lines
+        )
+
+    def test_all_drawn(self):
+        self.assertEqual(
+            self.__get_drawn_lines(), [self.scale_line] + self.unit_lines
+        )
+
+    def test_all_visible(self):
+        self.assertEqual(
+            self.__get_drawn_lines(Area(0, 0, 500, 100)),
+            [self.scale_line] + self.unit_lines,
+        )
+
+    def test_some_visible(self):
+        self.assertEqual(
+            self.__get_drawn_lines(Area(190, 0, 120, 100)),
+            [self.scale_line] + self.unit_lines[2:5],
+        )
+
+    def test_none_visible(self):
+        self.assertEqual(self.__get_drawn_lines(Area(500, 0, 100, 100)), [])
+
+    def test_empty(self):
+        self.lines = PDFLines()
+        self.assertEqual(self.__get_drawn_lines(), [])
+
+    def test_one_path(self):
+        self.lines.draw(self.canvas, 100, 10)
+        code = self.canvas._code
+        self.assertEqual(code.count("n"), 1)
+        self.assertEqual(code.count("S"), 1)
+
+    def test_indexed_lines_match_unindexed(self):
+        rng = random.Random(7)
+        for axis in ("x", "y"):
+            lines = PDFLines()
+            indexed_lines = PDFLines(axis)
+            for _ in range(200):
+                line = [rng.uniform(0, 2000) for _ in range(4)]
+                lines.add(*line)
+                indexed_lines.add(*line)
+
+            for visible_area in [
+                Area(rng.uniform(0, 2000), rng.uniform(0, 2000), 300, 200)
+                for _ in range(20)
+            ] + [Area(0, 0, 0, 0), Area(900, 900, 50, 50)]:
+                self.assertEqual(
+                    indexed_lines.get_lines(100, 10, visible_area),
+                    lines.get_lines(100, 10, visible_area),
+                )
@@ -8,8 +8,12 @@ from reportlab.pdfgen.canvas import Canvas
 from age_timelines.models import AgeEvent, AgeTimeline
 from age_timelines.pdf.age_timeline_scale_description import \
     AgeTimelineScaleDescription
+from timelines.models import Timeline
+from timelines.pdf.area import Area
 from timelines.pdf.pdf_scale_line import PDFScaleLine
 
+from .test_scale_description import SECONDS_IN_MONTH, UnitsScaleDescription
+
 UNIT_LINE_LENGTH = 5 * mm
 
 
@@ -123,3 +127,28 @@ class TestPDFScaleLine(TestCase):
         )
         self.assertEqual(scale_line.width, expected_width)
         self.assertEqual(scale_line.height, expected_height)
+
+    def test_visible_unit_lines(self):
+        for orientation, visible_area in [
+            ("L", Area(1005 * mm, 0, 200 * mm, 100 * mm)),
+            ("P", Area(0, 1005 * mm, 100 * mm, 200 * mm)),
+        ]:
+            scale_line = PDFScaleLine(
+                UnitsScaleDescription(
+                    Timeline(scale_length=1, page_orientation=orientation),
+                    SECONDS_IN_MONTH,
+                ),
+                self.__create_canvas(),
+                UNIT_LINE_LENGTH,
+            )
+            scale_line.x = 20 * mm
+            scale_line.y = 30 * mm
+
+            # the scale line and the unit lines, 10 mm apart, from the unit
+            # before the area to the unit after it
+            lines = scale_line.get_lines(visible_area)
+            self.assertEqual(len(lines), 23)
+            visible_lines = lines.get_lines(
+                scale_line.x, scale_line.y, visible_area
+            )
+            self.assertEqual(len(visible_lines), 21)
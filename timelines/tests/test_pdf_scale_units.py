@@ -11,8 +11,15 @@ from age_timelines.models import AgeEvent, AgeTimeline
 from age_timelines.pdf.age_timeline_scale_description import (
     AgeTimelineScaleDescription,
 )
+from timelines.models import Timeline
+from timelines.pdf.area import Area
 from timelines.pdf.pdf_scale_units import PDFScaleUnits
 
+from .test_scale_description import UnitsScaleDescription
+
+"""Number of units on the scales with short units."""
+SHORT_SCALE_UNITS = 2001
+
 
 class TestPDFScaleUnits(TestCase):
     @classmethod
@@ -146,3 +153,72 @@ class TestPDFScaleUnits(TestCase):
         self.assertEqual(len(scale_units.unit_labels), expected_labels)
         self.assertEqual(scale_units.height, expected_height)
         self.assertEqual(scale_units.start_offset, expected_offset)
+
+    def __create_short_scale_units(self, orientation):
+        scale_description = UnitsScaleDescription(
+            Timeline(scale_length=1, page_orientation=orientation),
+            SHORT_SCALE_UNITS,
+        )
+        return PDFScaleUnits(
+            scale_description,
+            self.__create_paragraph_style(),
+            self.__create_canvas(),
+        )
+
+    def test_many_units_labelled(self):
+        for orientation in ["L", "P"]:
+            scale_units = self.__create_short_scale_units(orientation)
+            self.assertEqual(
+                len(scale_units.unit_labels), SHORT_SCALE_UNITS + 1
+            )
+            self.assertEqual(
+                scale_units.unit_labels[-1].paragraph.text,
+                str(SHORT_SCALE_UNITS),
+            )
+
+            scale_line_length = (
+                scale_units.scale_description.get_scale_length() * mm
+            )
+            if orientation == "L":
+                last_offset = scale_units.unit_labels[-1].width / 2
+                self.assertEqual(
+                    scale_units.width,
+                    scale_units.start_offset + scale_line_length + last_offset,
+                )
+            else:
+                last_offset = scale_units.unit_labels[-1].height / 2
+                self.assertEqual(
+                    scale_units.height,
+                    scale_units.start_offset + scale_line_length + last_offset,
+                )
+
+    def test_visible_labels(self):
+        for orientation in ["L", "P"]:
+            scale_units = self.__create_short_scale_units(orientation)
+            scale_units.x = 20 * mm
+            scale_units.y = 30 * mm
+            all_labels = list(scale_units.get_unit_labels())
+            for visible_area in [
+                Area(1000 * mm, 0, 200 * mm, 20000 * mm),
+                Area(0, 1000 * mm, 20000 * mm, 200 * mm),
+                Area(-50 * mm, -50 * mm, 100 * mm, 100 * mm),
+            ]:
+                expected = [
+                    (unit_label.x, unit_label.y)
+                    for unit_label in all_labels
+                    if Area(
+                        scale_units.x + unit_label.x,
+                        scale_units.y + unit_label.y,
+                        unit_label.width,
+                        unit_label.height,
+                    ).overlaps(visible_area)
+                ]
+                self.assertEqual(
+                    [
+                        (unit_label.x, unit_label.y)
+                        for unit_label in scale_units.get_unit_labels(
+                            visible_area
+                        )
+                    ],
+                    expected,
+                )
@@ -134,3 +134,65 @@ class PDFStartEndEventTest(TestCase):
         )
         self.assertGreater(test_event.width, max_width)
         self.assertEqual(test_event.height, fixed_height)
+
+    def test_portrait_never_fits(self):
+        canvas = self.__create_canvas()
+        paragraph_style = self.__create_paragraph_style()
+        fixed_height = 5 * mm
+        max_width = 50 * mm
+
+        test_event = PDFStartEndEvent(
+            "12 Years 5 Months",
+            "event title",
+            "event description",
+            "Tags(Tag Name 0, Tag Name 1, Tag Name 2)",
+            "P",
+            canvas,
+            paragraph_style,
+            paragraph_style,
+            paragraph_style,
+            paragraph_style,
+            DEFAULT_EVENT_BORDER,
+            fixed_height,
+            max_width=max_width
+        )
+        self.assertEqual(test_event.height, fixed_height)
+        self.assertLessEqual(test_event.wrap_count, 12)
+
+    def test_portrait_estimated_width(self):
+        canvas = self.__create_canvas()
+        paragraph_style = self.__create_paragraph_style()
+        fixed_height = 30 * mm
+        max_width = 100 * mm
+
+        test_event = PDFStartEndEvent(
+            "12 Years 5 Months",
+            "event title",
+            (
+                "long event description long event description"
+                "long event description long event description"
+                "long event description long event description"
+            ),
+            "Tags(Tag Name 0, Tag Name 1, Tag Name 2)",
+            "P",
+            canvas,
+            paragraph_style,
+            paragraph_style,
+            paragraph_style,
+            paragraph_style,
+            DEFAULT_EVENT_BORDER,
+            fixed_height,
+            max_width=max_width
+        )
+        wrap_count = test_event.wrap_count
+        text_width = test_event.width - (2 * DEFAULT_EVENT_BORDER)
+        _, height = test_event._get_dimensions(text_width)
+        _, narrower_height = test_event._get_dimensions(
+            text_width - test_event.width_tolerance
+        )
+
+        self.assertLessEqual(height, fixed_height)
+        self.assertGreater(narrower_height, fixed_height)
+        # narrowest and widest width, the estimate and the width either side
+        # of it, then wrapped to be drawn
+        self.assertLessEqual(wrap_count, 20)
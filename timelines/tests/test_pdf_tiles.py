@@ -0,0 +1,37 @@
+import io
+from unittest.mock import patch
+
+from django.test import TestCase
+from reportlab.pdfgen.canvas import Canvas
+
+from timelines.pdf.area import Area
+from timelines.pdf.pdf_tiles import PDFTileMarkers
+
+
+class PDFTileMarkersTest(TestCase):
+    def setUp(self):
+        self.canvas = Canvas(io.BytesIO())
+        self.tile = Area(0, 0, 400, 200)
+
+    def __count_marks(self, orientation, index, count):
+        tile_markers = PDFTileMarkers(self.canvas, orientation, 20, 30)
+        with patch.object(
+            self.canvas, "line", wraps=self.canvas.line
+        ) as line, patch.object(
+            self.canvas, "drawRightString"
+        ) as draw_right_string:
+            tile_markers.draw(index, count, self.tile)
+
+        return line.call_count, draw_right_string.call_count
+
+    def test_single_page(self):
+        self.assertEqual(self.__count_marks("L", 0, 1), (0, 0))
+
+    def test_first_page(self):
+        self.assertEqual(self.__count_marks("L", 0, 3), (2, 1))
+
+    def test_middle_page(self):
+        self.assertEqual(self.__count_marks("P", 1, 3), (4, 1))
+
+    def test_last_page(self):
+        self.assertEqual(self.__count_marks("P", 2, 3), (2, 1))
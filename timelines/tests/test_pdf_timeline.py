@@ -0,0 +1,164 @@
+import re
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from date_time_timelines.models import DateTimeEvent, DateTimeTimeline
+from date_time_timelines.pdf.pdf_date_time_timeline import (
+    PDFDateTimeTimeline,
+)
+from timelines.models import EventArea, Tag
+from timelines.pdf.layout import A4_LONG, A4_SHORT
+from timelines.pdf.pdf_event import PDFEvent
+
+# events on the tiled timeline, one a day
+EVENT_COUNT = 20
+
+
+class PDFTimelineQueryTest(TestCase):
+    @classmethod
+    def setUpTestData(self):
+        user = User.objects.create_user(
+            username="TestUser", password="TestUser01#"
+        )
+        self.timeline = DateTimeTimeline.objects.create(
+            user=user, title="Test Timeline", scale_unit=86400
+        )
+        self.event_areas = [
+            EventArea.objects.create(
+                timeline=self.timeline, name=f"Area {i}", page_position=i
+            )
+            for i in range(2)
+        ]
+        self.tags = [
+            Tag.objects.create(
+                timeline=self.timeline, name=f"Tag {i}", display=(i != 1)
+            )
+            for i in range(3)
+        ]
+
+    def __add_events(self, count):
+        start = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        for i in range(count):
+            event = DateTimeEvent.objects.create(
+                date_time_timeline=self.timeline,
+                timeline_id=self.timeline.timeline_ptr.pk,
+                title=f"Event {i}",
+                event_area=self.event_areas[i % 2],
+                start_date_time=start + timedelta(hours=i),
+                has_end=(i % 3 == 0),
+                end_date_time=start + timedelta(hours=i + 30),
+            )
+            event.tags.set(self.tags[:i % 4])
+
+    def __count_queries(self):
+        timeline = DateTimeTimeline.objects.get(id=self.timeline.id)
+        with CaptureQueriesContext(connection) as context:
+            PDFDateTimeTimeline(timeline)
+
+        return len(context.captured_queries)
+
+    def test_query_count_constant(self):
+        self.__add_events(3)
+        few_events_queries = self.__count_queries()
+        self.__add_events(30)
+        self.assertEqual(self.__count_queries(), few_events_queries)
+
+    def test_displayed_tags(self):
+        self.__add_events(4)
+        pdf_timeline = PDFDateTimeTimeline(self.timeline)
+        tag_strings = sorted(
+            pdf_event.tags_paragraph.text
+            for pdf_event_area in pdf_timeline.layout.event_areas
+            for pdf_event in pdf_event_area.events
+        )
+        self.assertEqual(
+            tag_strings, ["", "(Tag 0)", "(Tag 0)", "(Tag 0, Tag 2)"]
+        )
+
+    def test_events_without_event_area(self):
+        self.__add_events(2)
+        event = DateTimeEvent.objects.create(
+            date_time_timeline=self.timeline,
+            timeline_id=self.timeline.timeline_ptr.pk,
+            title="No Area",
+            start_date_time=datetime(2000, 1, 1, tzinfo=timezone.utc),
+        )
+        pdf_timeline = PDFDateTimeTimeline(self.timeline)
+        self.assertEqual(pdf_timeline.events_without_event_area, [event])
+        self.assertEqual(
+            sum(
+                len(pdf_event_area.events)
+                for pdf_event_area in pdf_timeline.layout.event_areas
+            ),
+            2,
+        )
+
+
+class PDFTimelineTilingTest(TestCase):
+    @classmethod
+    def setUpTestData(self):
+        user = User.objects.create_user(
+            username="TestUser", password="TestUser01#"
+        )
+        self.timeline = DateTimeTimeline.objects.create(
+            user=user,
+            title="Test Timeline",
+            scale_unit=86400,
+            page_size="4",
+            page_tiling="T",
+        )
+        event_area = EventArea.objects.create(
+            timeline=self.timeline, name="Area", page_position=0
+        )
+        start = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        for i in range(EVENT_COUNT):
+            DateTimeEvent.objects.create(
+                date_time_timeline=self.timeline,
+                timeline_id=self.timeline.timeline_ptr.pk,
+                title=f"Event {i}",
+                event_area=event_area,
+                start_date_time=start + timedelta(days=i),
+                end_date_time=start + timedelta(days=i),
+            )
+
+    def __get_media_boxes(self, pdf_timeline):
+        return re.findall(
+            rb"/MediaBox \[ 0 0 ([\d.]+) ([\d.]+) \]",
+            pdf_timeline.buffer.getvalue(),
+        )
+
+    def test_pages(self):
+        pdf_timeline = PDFDateTimeTimeline(self.timeline)
+        tiles = pdf_timeline.layout.page_tiles()
+        self.assertGreater(len(tiles), 2)
+
+        media_boxes = self.__get_media_boxes(pdf_timeline)
+        self.assertEqual(len(media_boxes), len(tiles))
+        for width, height in media_boxes:
+            self.assertAlmostEqual(float(width), A4_LONG, places=3)
+            self.assertAlmostEqual(float(height), A4_SHORT, places=3)
+
+    def test_single_page(self):
+        self.timeline.page_tiling = "S"
+        pdf_timeline = PDFDateTimeTimeline(self.timeline)
+        media_boxes = self.__get_media_boxes(pdf_timeline)
+        self.assertEqual(len(media_boxes), 1)
+        self.assertAlmostEqual(
+            float(media_boxes[0][0]),
+            pdf_timeline.layout.page_area.width,
+            places=3,
+        )
+
+    def test_events_drawn_on_their_pages(self):
+        with patch.object(PDFEvent, "draw", autospec=True) as draw:
+            pdf_timeline = PDFDateTimeTimeline(self.timeline)
+
+        # events are only drawn again on the page they overlap onto
+        self.assertGreaterEqual(draw.call_count, EVENT_COUNT)
+        self.assertLess(draw.call_count, 2 * EVENT_COUNT)
+        self.assertGreater(len(pdf_timeline.layout.page_tiles()), 2)
@@ -9,6 +9,8 @@ from timelines.models import EventArea
 from timelines.pdf.layout import (
     DEFAULT_PAGE_BORDER,
     DEFAULT_COMPONENT_BORDER,
+    DEFAULT_TILE_OVERLAP,
+    A3_LONG,
     A3_SHORT
 )
 from timelines.pdf.portrait_layout import PortraitLayout
@@ -278,3 +280,16 @@ class PDFTimelineLayoutPortraitTest(TestCase):
             self.layout.event_areas[1].y,
             expected_event_and_scale_area_y
         )
+
+    def test_page_tiles(self):
+        tiles = self.layout.page_tiles()
+        self.assertEqual(len(tiles), 3)
+        for index, tile in enumerate(tiles):
+            self.assertEqual(tile.x, 0)
+            self.assertAlmostEqual(
+                tile.top(),
+                PAGE_HEIGHT - (index * (A3_LONG - DEFAULT_TILE_OVERLAP)),
+            )
+            self.assertEqual(tile.width, A3_SHORT)
+            self.assertEqual(tile.height, A3_LONG)
+        self.assertLessEqual(tiles[-1].y, 0)
@@ -0,0 +1,50 @@
+from django.test import TestCase
+
+from timelines.models import Timeline
+from timelines.pdf.scale_description import (
+    MM_PER_CM,
+    ScaleDescription,
+    positions_between,
+)
+
+"""Seconds in a 31 day month, the units of a 1 second scale over a month."""
+SECONDS_IN_MONTH = 31 * 24 * 60 * 60
+
+
+class UnitsScaleDescription(ScaleDescription):
+    """A ScaleDescription with a given number of units labelled with their
+    index."""
+
+    def __init__(self, timeline, scale_units):
+        super().__init__(timeline)
+        self.scale_units = scale_units
+
+    def get_scale_units(self):
+        return self.scale_units
+
+    def get_scale_length(self):
+        return self.scale_units * self.timeline.scale_length * MM_PER_CM
+
+    def get_scale_label(self, scale_index):
+        return str(scale_index)
+
+    def plot(self, time_unit):
+        return 0
+
+
+class PositionsBetweenTest(TestCase):
+    def test_positions_between(self):
+        indexes = range(13)
+        self.assertEqual(positions_between(indexes, -3, 4), range(0, 5))
+        self.assertEqual(positions_between(indexes, 1, 12), range(1, 13))
+        self.assertEqual(positions_between(indexes, 6, 6), range(6, 7))
+        self.assertEqual(positions_between(indexes, 20, 99), range(13, 13))
+
+
+class ScaleDescriptionLabelIndexesTest(TestCase):
+    def test_every_unit_labelled(self):
+        scale_description = UnitsScaleDescription(
+            Timeline(scale_length=4), SECONDS_IN_MONTH
+        )
+        label_indexes = scale_description.get_label_indexes()
+        self.assertEqual(label_indexes, range(SECONDS_IN_MONTH + 1))
@@ -0,0 +1,47 @@
+from django.test import TestCase
+
+from timelines.pdf.skyline import Skyline
+
+
+class SkylineTest(TestCase):
+    def test_base_level(self):
+        skyline = Skyline(5)
+        self.assertEqual(skyline.get_level(0, 100), 5)
+
+    def test_raise_level(self):
+        skyline = Skyline()
+        skyline.raise_level(10, 20, 15)
+        self.assertEqual(skyline.get_level(0, 10), 0)
+        self.assertEqual(skyline.get_level(0, 11), 15)
+        self.assertEqual(skyline.get_level(15, 30), 15)
+        self.assertEqual(skyline.get_level(20, 30), 0)
+
+    def test_raise_level_over_existing(self):
+        skyline = Skyline()
+        skyline.raise_level(10, 20, 15)
+        skyline.raise_level(30, 40, 5)
+        skyline.raise_level(15, 35, 25)
+        self.assertEqual(skyline.get_level(10, 15), 15)
+        self.assertEqual(skyline.get_level(20, 30), 25)
+        self.assertEqual(skyline.get_level(35, 40), 5)
+        self.assertEqual(skyline.get_level(40, 50), 0)
+        self.assertEqual(skyline.starts[1:], [10, 15, 35, 40])
+
+    def test_raise_level_same_edges(self):
+        skyline = Skyline()
+        skyline.raise_level(10, 20, 15)
+        skyline.raise_level(10, 20, 30)
+        self.assertEqual(skyline.starts[1:], [10, 20])
+        self.assertEqual(skyline.levels[1:], [30, 0])
+
+    def test_raise_level_empty(self):
+        skyline = Skyline()
+        skyline.raise_level(10, 10, 15)
+        self.assertEqual(skyline.get_level(0, 100), 0)
+
+    def test_get_next_start(self):
+        skyline = Skyline()
+        skyline.raise_level(10, 20, 15)
+        self.assertEqual(skyline.get_next_start(0), 10)
+        self.assertEqual(skyline.get_next_start(10), 20)
+        self.assertEqual(skyline.get_next_start(20), float("inf"))
@@ -0,0 +1,72 @@
+from datetime import datetime, timezone
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from date_time_timelines.models import DateTimeEvent, DateTimeTimeline
+from timelines.models import Collaborator, EventArea, ROLE_TIMELINE_EDITOR
+
+TIMELINE_TABLE = f'FROM "{DateTimeTimeline._meta.db_table}"'
+
+
+class TimelineViewQueriesTest(TestCase):
+    @classmethod
+    def setUpTestData(self):
+        owner = User.objects.create_user(
+            username="Owner", password="TestUser01#"
+        )
+        editor = User.objects.create_user(
+            username="Editor", password="TestUser01#"
+        )
+        self.timeline = DateTimeTimeline.objects.create(
+            user=owner, title="Test Timeline", scale_unit=86400
+        )
+        Collaborator.objects.create(
+            timeline=self.timeline, user=editor, role=ROLE_TIMELINE_EDITOR
+        )
+        event_area = EventArea.objects.create(
+            timeline=self.timeline, name="Area", page_position=1
+        )
+        DateTimeEvent.objects.create(
+            date_time_timeline=self.timeline,
+            timeline_id=self.timeline.timeline_ptr.pk,
+            title="Event",
+            event_area=event_area,
+            start_date_time=datetime(2000, 1, 1, tzinfo=timezone.utc),
+        )
+
+    def __get(self, username, url_name):
+        self.client.login(username=username, password="TestUser01#")
+        url = reverse(
+            f"date_time_timelines:{url_name}", args=[self.timeline.id]
+        )
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        return context.captured_queries
+
+    def __count_timeline_loads(self, queries):
+        return sum(TIMELINE_TABLE in query["sql"] for query in queries)
+
+    def test_query_counts(self):
+        # each includes the session, user and timeline, then the
+        # collaborator's role when the user is not the owner
+        expected_query_counts = {
+            "date-time-timeline-detail": ("Editor", 8),
+            "date-time-timeline-update": ("Editor", 4),
+            "date-time-timeline-delete": ("Owner", 3),
+            "collaborators": ("Owner", 5),
+            "landscape_timeline": ("Editor", 10),
+            "portrait_timeline": ("Editor", 10),
+        }
+        for url_name, (username, query_count) in (
+            expected_query_counts.items()
+        ):
+            with self.subTest(url_name=url_name):
+                queries = self.__get(username, url_name)
+                self.assertEqual(len(queries), query_count)
+                self.assertEqual(self.__count_timeline_loads(queries), 1)
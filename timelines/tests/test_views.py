@@ -1,7 +1,19 @@
+import io
+
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.test import RequestFactory, TestCase
 from django.urls import reverse
 from age_timelines.models import AgeTimeline
+from date_time_timelines.models import DateTimeTimeline
+from historical_timelines.models import HistoricalTimeline
+from scientific_timelines.models import ScientificTimeline
+from timelines.models import Collaborator
+from timelines.timeline_listing import get_timeline_listing
+from timelines.views import (
+    PDF_STREAM_CHUNK_SIZE,
+    TIMELINES_PER_PAGE,
+    pdf_file_response,
+)
 
 
 class UserTimelinesViewTest(TestCase):
@@ -62,3 +74,193 @@ class UserTimelinesViewTest(TestCase):
             self.assertEqual(
                 age_timeline.get_owner(), response.context["user"]
             )
+
+
+class UserTimelinesListingTest(TestCase):
+    @classmethod
+    def setUpTestData(self):
+        self.user = User.objects.create_user(
+            username="TestUser1", password="TestUser1#"
+        )
+        self.owner = User.objects.create_user(
+            username="TestUser2", password="TestUser2#"
+        )
+
+    def __add_timelines(self, user, title):
+        """Add a timeline of every type owned by user."""
+        return [
+            AgeTimeline.objects.create(user=user, title=title),
+            DateTimeTimeline.objects.create(
+                user=user, title=title, scale_unit=86400
+            ),
+            HistoricalTimeline.objects.create(
+                user=user, title=title, scale_unit=10
+            ),
+            ScientificTimeline.objects.create(
+                user=user, title=title, scale_unit=10
+            ),
+        ]
+
+    def __add_collaborations(self, title):
+        """Add a timeline of every type the user collaborates on."""
+        timelines = self.__add_timelines(self.owner, title)
+        for timeline in timelines:
+            Collaborator.objects.create(
+                timeline=timeline.timeline_ptr, user=self.user
+            )
+        return timelines
+
+    def setUp(self):
+        self.client.login(username="TestUser1", password="TestUser1#")
+
+    def __get(self, **params):
+        return self.client.get(reverse("timelines:user-timelines"), params)
+
+    def test_lists_collaborations_of_every_type(self):
+        owned = self.__add_timelines(self.user, "Owned")
+        collaborations = self.__add_collaborations("Collaboration")
+        self.__add_timelines(self.owner, "Not Shared")
+
+        response = self.__get()
+
+        for index, timeline_type in enumerate(
+            ["age", "date_time", "historical", "scientific"]
+        ):
+            self.assertEqual(
+                list(response.context[f"{timeline_type}_timeline_list"]),
+                [owned[index]],
+            )
+            self.assertEqual(
+                list(
+                    response.context[
+                        f"{timeline_type}_timeline_collaboration_list"
+                    ]
+                ),
+                [collaborations[index]],
+            )
+        self.assertContains(response, "Collaboration owned by TestUser2", 4)
+
+    def test_query_count_constant(self):
+        self.__add_timelines(self.user, "Owned")
+        self.__add_collaborations("Collaboration")
+        # the session and user, then the listing
+        with self.assertNumQueries(3):
+            self.__get()
+
+        for _ in range(3):
+            self.__add_timelines(self.user, "Owned")
+            self.__add_collaborations("Collaboration")
+        with self.assertNumQueries(3):
+            self.__get()
+
+    def test_paginated(self):
+        for i in range(TIMELINES_PER_PAGE + 1):
+            AgeTimeline.objects.create(user=self.user, title=f"Timeline {i}")
+
+        response = self.__get()
+        self.assertEqual(
+            len(response.context["age_timeline_list"]), TIMELINES_PER_PAGE
+        )
+        self.assertTrue(response.context["page_obj"].has_next())
+
+        response = self.__get(page=2)
+        self.assertEqual(len(response.context["age_timeline_list"]), 1)
+        self.assertFalse(response.context["page_obj"].has_next())
+
+
+class TimelineListingTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="TestUser1", password="TestUser1#"
+        )
+        self.owner = User.objects.create_user(
+            username="TestUser2", password="TestUser2#"
+        )
+        self.timeline = AgeTimeline.objects.create(
+            user=self.owner, title="Shared"
+        )
+        Collaborator.objects.create(
+            timeline=self.timeline.timeline_ptr, user=self.user
+        )
+
+    def test_one_query(self):
+        with self.assertNumQueries(1):
+            (listed,) = get_timeline_listing(self.user)
+            self.assertEqual(listed[1].user, self.owner)
+
+    def test_timeline_change_listed(self):
+        get_timeline_listing(self.user)
+        self.timeline.title = "Renamed"
+        self.timeline.save()
+
+        (listed,) = get_timeline_listing(self.user)
+        self.assertEqual(listed[1].title, "Renamed")
+
+    def test_collaboration_delete_listed(self):
+        get_timeline_listing(self.user)
+        Collaborator.objects.filter(user=self.user).delete()
+
+        self.assertEqual(get_timeline_listing(self.user), [])
+
+
+class PDFFileResponseTest(TestCase):
+    PDF_DATA = bytes(range(256)) * 1000
+
+    def __get(self, range_header=None):
+        headers = {} if range_header is None else {"Range": range_header}
+        request = RequestFactory().get("/", headers=headers)
+        self.pdf_file = io.BytesIO(self.PDF_DATA)
+        return pdf_file_response(request, self.pdf_file, "Timeline.pdf")
+
+    def test_whole_file_in_chunks(self):
+        response = self.__get()
+        chunks = list(response.streaming_content)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(chunks), self.PDF_DATA)
+        self.assertTrue(
+            all(len(chunk) <= PDF_STREAM_CHUNK_SIZE for chunk in chunks)
+        )
+        self.assertEqual(response["Content-Length"], str(len(self.PDF_DATA)))
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertEqual(
+            response["Content-Disposition"],
+            'attachment; filename="Timeline.pdf"',
+        )
+        response.close()
+        self.assertTrue(self.pdf_file.closed)
+
+    def test_ranges(self):
+        size = len(self.PDF_DATA)
+        for range_header, start, end in [
+            ("bytes=0-99", 0, 99),
+            ("bytes=1000-", 1000, size - 1),
+            ("bytes=-500", size - 500, size - 1),
+            ("bytes=-999999999", 0, size - 1),
+            ("bytes=200000-999999999", 200000, size - 1),
+        ]:
+            response = self.__get(range_header)
+            self.assertEqual(response.status_code, 206)
+            self.assertEqual(
+                b"".join(response.streaming_content),
+                self.PDF_DATA[start:end + 1],
+            )
+            self.assertEqual(
+                response["Content-Range"], f"bytes {start}-{end}/{size}"
+            )
+            self.assertEqual(response["Content-Length"], str(end + 1 - start))
+
+    def test_unsatisfiable_range(self):
+        size = len(self.PDF_DATA)
+        for range_header in [f"bytes={size}-", "bytes=-0"]:
+            response = self.__get(range_header)
+            self.assertEqual(response.status_code, 416)
+            self.assertEqual(response["Content-Range"], f"bytes */{size}")
+            self.assertTrue(self.pdf_file.closed)
+
+    def test_ignored_ranges(self):
+        for range_header in ["bytes=0-1,5-9", "bytes=9-0", "lines=1-2"]:
+            response = self.__get(range_header)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(
+                b"".join(response.streaming_content), self.PDF_DATA
+            )
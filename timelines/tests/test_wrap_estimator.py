@@ -0,0 +1,74 @@
+import random
+
+from django.test import TestCase
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import mm
+from reportlab.platypus import Paragraph
+
+from timelines.pdf.wrap_estimator import WrapEstimator
+
+WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do "
+    "eiusmod tempor Tags=(Tag Name 0, 12 Years 5 Months 1995-03-20 "
+    "extraordinarily-long-hyphenated-word"
+).split()
+
+
+class WrapEstimatorTest(TestCase):
+    def __create_paragraph_style(self):
+        return ParagraphStyle(
+            "Basic Text ParagraphStyle",
+            fontName="Times-Roman",
+            fontSize=10,
+            leading=14,
+        )
+
+    def test_empty_text(self):
+        estimator = WrapEstimator("", self.__create_paragraph_style())
+        self.assertEqual(estimator.get_height(50 * mm), 0)
+
+    def test_single_line(self):
+        estimator = WrapEstimator(
+            "12 Years 5 Months", self.__create_paragraph_style()
+        )
+        self.assertEqual(estimator.get_line_count(50 * mm), 1)
+        self.assertEqual(estimator.get_height(50 * mm), 14)
+
+    def test_long_word_split(self):
+        style = self.__create_paragraph_style()
+        estimator = WrapEstimator("do consectetur", style)
+        self.assertEqual(
+            estimator.get_height(20),
+            Paragraph("do consectetur", style).wrap(20, 0)[1],
+        )
+
+    def test_drift_from_wrap(self):
+        generator = random.Random(1)
+        style = self.__create_paragraph_style()
+        estimates = 0
+        drift = 0
+        for _ in range(500):
+            text = " ".join(
+                generator.choice(WORDS)
+                for _ in range(generator.randint(0, 100))
+            )
+            estimator = WrapEstimator(text, style)
+            for width in [15, 30 * mm, 52.5 * mm, 100 * mm, 300 * mm]:
+                _, height = Paragraph(text, style).wrap(width, 0)
+                estimates += 1
+                drift += abs(estimator.get_height(width) - height)
+
+        self.assertEqual(estimates, 2500)
+        self.assertEqual(drift, 0)
+
+    def test_drift_with_markup(self):
+        style = self.__create_paragraph_style()
+        text = "Rock &amp; Roll &amp; Blues " * 10
+        estimator = WrapEstimator(text, style)
+        for width in [30 * mm, 60 * mm]:
+            _, height = Paragraph(text, style).wrap(width, 0)
+            # entities are measured as written so the estimate errs high
+            self.assertGreaterEqual(estimator.get_height(width), height)
+            self.assertLessEqual(
+                estimator.get_height(width) - height, height / 2
+            )
@@ -0,0 +1,59 @@
+"""Contains functions to list the timelines a user owns or collaborates on.
+
+Timelines of every type are loaded with a single query, joining each
+Timeline to the table of every subclass.  The listing is loaded again for
+every request, rather than cached, so a timeline renamed, deleted or no
+longer shared by any process is listed correctly straight away.
+
+Functions:
+    get_timeline_listing
+
+Usage:
+    for timeline_type, timeline in get_timeline_listing(request.user):
+        print(timeline_type, timeline.title, timeline.user)
+"""
+
+from typing import List, Tuple
+
+from django.contrib.auth.models import User
+from django.db.models import Q
+
+from .models import Collaborator, Timeline
+
+"""Names of the one-to-one links from Timeline to each of its subclasses,
+keyed on the type of timeline listed."""
+TIMELINE_TYPE_LINKS = {
+    "age": "agetimeline",
+    "date_time": "datetimetimeline",
+    "historical": "historicaltimeline",
+    "scientific": "scientifictimeline",
+}
+
+
+def get_timeline_listing(user: User) -> List[Tuple[str, Timeline]]:
+    """Get the timelines a user owns or collaborates on in one query.
+
+    Args:
+        user: A User.
+
+    Returns:
+        A list of tuples of the type of timeline, a key of
+        TIMELINE_TYPE_LINKS, and the instance of the subclass of Timeline,
+        in order of title.
+    """
+    collaborations = Collaborator.objects.filter(user=user)
+    timelines = Timeline.objects.filter(
+        Q(user=user) | Q(pk__in=collaborations.values("timeline_id"))
+    ).select_related("user", *TIMELINE_TYPE_LINKS.values())
+
+    listing = []
+    for timeline in timelines.order_by("title", "pk"):
+        for timeline_type, link in TIMELINE_TYPE_LINKS.items():
+            typed_timeline = getattr(timeline, link, None)
+            if typed_timeline is not None:
+                # share the owner loaded with the Timeline
+                typed_timeline.user = timeline.user
+                listing.append((timeline_type, typed_timeline))
+                break
+
+    return listing
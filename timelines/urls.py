@@ -7,4 +7,16 @@ app_name = "timelines"
 urlpatterns = [
     # ex: /timelines/
     path("", views.user_timelines, name="user-timelines"),
+    # ex: /timelines/pdf_jobs/1/
+    path(
+        "pdf_jobs/<int:pdf_job_id>/",
+        views.pdf_job_status,
+        name="pdf-job-status",
+    ),
+    # ex: /timelines/pdf_jobs/1/pdf/
+    path(
+        "pdf_jobs/<int:pdf_job_id>/pdf/",
+        views.pdf_job_download,
+        name="pdf-job-download",
+    ),
 ]
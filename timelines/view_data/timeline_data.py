@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from timelines.models import Timeline
+from collections.abc import Sequence
+from timelines.event_loader import NO_EVENT_AREA, load_events_by_area
+from timelines.models import Event, Timeline
 from timelines.pdf.scale_description import ScaleDescription
 
 
@@ -51,6 +53,32 @@ class ScaleUnitData:
         self.unit_string = unit_string
 
 
+class ScaleUnitsData(Sequence):
+    """The ScaleUnitData of each labelled unit on a scale, created as they
+    are needed rather than stored, so the memory needed for a scale does
+    not grow with its number of units.
+    """
+
+    def __init__(self, scale_description):
+        self.scale_description = scale_description
+        self.unit_indexes = scale_description.get_label_indexes()
+
+    def __len__(self):
+        return len(self.unit_indexes)
+
+    def __getitem__(self, position):
+        unit_index = self.unit_indexes[position]
+        pos = (
+            unit_index
+            * self.scale_description.timeline.scale_length
+            * MM_PER_CM
+        )
+        return ScaleUnitData(
+            pos,
+            self.scale_description.get_scale_label(unit_index)
+        )
+
+
 class TagData:
     def __init__(self, name, description):
         self.name = name
@@ -70,6 +98,9 @@ class TimelineData(ABC):
         self.description = timeline.description
         self.has_description = self.description != ""
 
+        self.events_by_area = load_events_by_area(
+            self._get_timeline_events(timeline)
+        )
         self.event_areas_before_scale = (
             self.get_event_areas(
                 self.get_event_areas_before_scale(timeline),
@@ -82,6 +113,13 @@ class TimelineData(ABC):
                 scale_description
             )
         )
+        self.events_without_event_area = [
+            self.get_event_data(event, scale_description)
+            for event in self.events_by_area.get(NO_EVENT_AREA, [])
+        ]
+        self.has_events_without_event_area = (
+            len(self.events_without_event_area) != 0
+        )
         self.initial_event_area_width = (
             scale_description.scale_length + START_ONLY_EVENT_MAX_SIZE
         )
@@ -114,8 +152,8 @@ class TimelineData(ABC):
         )
 
     @abstractmethod
-    def _get_events(self, event_area):
-        """Get all events in event area.  Returned list will contain objects
+    def _get_timeline_events(self, timeline):
+        """Get all events in timeline.  Returned QuerySet will contain objects
         belonging to a subclass of Event specific to the type of timeline, eg
         AgeEvents for AgeTimeline."""
         raise NotImplementedError("Subclasses should implement this")
@@ -132,6 +170,33 @@ class TimelineData(ABC):
         of TineUnit specific to the type of timeline, eg Age for AgeEvent."""
         raise NotImplementedError("Subclasses should implement this")
 
+    def get_event_data(self, event, scale_description):
+        start_position = scale_description.plot(
+            self._get_start_time_unit(event)
+        )
+
+        size = 0
+        if event.has_end:
+            end_position = scale_description.plot(
+                self._get_end_time_unit(event)
+            )
+            size = end_position - start_position
+
+        image_url = ""
+        if event.image != "":
+            image_url = event.image.url
+
+        return EventData(
+            position=start_position,
+            time=event.time_unit_description(),
+            title=event.title,
+            description=event.description,
+            image=image_url,
+            tag_string=Event.join_tag_names(event.display_tags),
+            has_end=event.has_end,
+            size=size,
+        )
+
     def get_event_area(self, event_area, scale_description):
         event_area_data = EventAreaData(
             event_area.display_event_time,
@@ -140,35 +205,11 @@ class TimelineData(ABC):
             event_area.display_event_tags,
             event_area.display_event_to_scale_line,
         )
-        events = self._get_events(event_area)
-        for event in events:
-            start_position = scale_description.plot(
-                self._get_start_time_unit(event)
+        for event in self.events_by_area.get(event_area.id, []):
+            event_area_data.events.append(
+                self.get_event_data(event, scale_description)
             )
 
-            size = 0
-            if event.has_end:
-                end_position = scale_description.plot(
-                    self._get_end_time_unit(event)
-                )
-                size = end_position - start_position
-
-            image_url = ""
-            if event.image != "":
-                image_url = event.image.url
-
-            event_data = EventData(
-                position=start_position,
-                time=event.time_unit_description(),
-                title=event.title,
-                description=event.description,
-                image=image_url,
-                tag_string=event.tag_string(True),
-                has_end=event.has_end,
-                size=size,
-            )
-            event_area_data.events.append(event_data)
-
         return event_area_data
 
     def get_event_areas(self, event_areas, scale_description):
@@ -181,19 +222,7 @@ class TimelineData(ABC):
         return event_area_list
 
     def get_scale_units(self, scale_description):
-        scale_units = []
-        for unit_index in range(scale_description.get_scale_units() + 1):
-            pos = (
-                unit_index
-                * scale_description.timeline.scale_length
-                * MM_PER_CM
-            )
-            scale_unit = ScaleUnitData(
-                pos,
-                scale_description.get_scale_label(unit_index)
-            )
-            scale_units.append(scale_unit)
-        return scale_units
+        return ScaleUnitsData(scale_description)
 
     def get_tags(self, tags):
         tag_list = []
@@ -1,63 +1,221 @@
+import io
+import re
+from typing import BinaryIO, Iterator, Optional, Tuple
+
 from django.contrib.auth.decorators import login_required
-from django.shortcuts import render
-from age_timelines.models import AgeTimeline
-from date_time_timelines.models import DateTimeTimeline
-from historical_timelines.models import HistoricalTimeline
-from scientific_timelines.models import ScientificTimeline
-from .models import Collaborator
+from django.core.paginator import Paginator
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseForbidden,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.shortcuts import get_object_or_404, render
+from django.urls import reverse
+from django.utils.http import content_disposition_header
+from .models import PDFJob, ROLE_VIEWER
+from .pdf.get_filename import get_filename
+from .pdf.pdf_cache import open_timeline_pdf
+from .pdf.pdf_jobs import enqueue_pdf_job
+from .timeline_listing import TIMELINE_TYPE_LINKS, get_timeline_listing
+
+
+"""Number of timelines listed on each page of a user's timelines."""
+TIMELINES_PER_PAGE = 50
+
+"""Size in bytes of each chunk a PDF is streamed to the client in."""
+PDF_STREAM_CHUNK_SIZE = 64 * 1024
+
+"""Matches a Range header asking for a single range of bytes."""
+BYTE_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
 
 
 @login_required(login_url="/accounts/login/")
 def user_timelines(request):
-    age_timeline_list = AgeTimeline.objects.all().filter(
-        user=request.user
+    paginator = Paginator(
+        get_timeline_listing(request.user), TIMELINES_PER_PAGE
     )
-    date_time_timeline_list = DateTimeTimeline.objects.all().filter(
-        user=request.user
+    page_obj = paginator.get_page(request.GET.get("page"))
+
+    context = {"page_obj": page_obj}
+    for timeline_type in TIMELINE_TYPE_LINKS:
+        context[f"{timeline_type}_timeline_list"] = []
+        context[f"{timeline_type}_timeline_collaboration_list"] = []
+    for timeline_type, timeline in page_obj:
+        if timeline.user_id == request.user.pk:
+            context[f"{timeline_type}_timeline_list"].append(timeline)
+        else:
+            context[f"{timeline_type}_timeline_collaboration_list"].append(
+                timeline
+            )
+
+    return render(request, "timelines/user_timelines.html", context)
+
+
+def timeline_pdf_response(request, timeline, pdf_class, events):
+    """Respond to a request for a timeline's PDF.
+
+    Draws the PDF while the client waits, or when the request has a
+    background parameter starts a PDFJob and returns its status with a 202
+    response for the client to poll.
+    """
+    if request.GET.get("background"):
+        pdf_job = enqueue_pdf_job(timeline, pdf_class, events)
+        return JsonResponse(_pdf_job_data(pdf_job), status=202)
+
+    return pdf_file_response(
+        request,
+        open_timeline_pdf(timeline, pdf_class, events),
+        get_filename(timeline.title),
     )
-    historical_timeline_list = HistoricalTimeline.objects.all().filter(
-        user=request.user
+
+
+def pdf_file_response(request, pdf_file: BinaryIO, filename: str):
+    """Stream a PDF to the client in chunks, as an attachment.
+
+    Only a chunk of the PDF is read into memory at a time.  Supports
+    requests for a single range of bytes, so downloads can be resumed, with
+    a 206 response, or a 416 response if the range is outside the PDF.
+    Requests for several ranges get the whole PDF.
+
+    Args:
+        request: An HttpRequest.
+        pdf_file: A binary file holding the PDF, which is closed once it has
+        been sent.
+        filename: A str holding the name to save the PDF as.
+    """
+    size = pdf_file.seek(0, io.SEEK_END)
+    try:
+        byte_range = _parse_byte_range(
+            request.headers.get("Range", ""), size
+        )
+    except ValueError:
+        pdf_file.close()
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    if byte_range is None:
+        start, end = 0, size - 1
+        status = 200
+    else:
+        start, end = byte_range
+        status = 206
+
+    response = StreamingHttpResponse(
+        _read_chunks(pdf_file, start, end + 1 - start),
+        status=status,
+        content_type="application/pdf",
     )
-    scientific_timeline_list = ScientificTimeline.objects.all().filter(
-        user=request.user
+    response["Content-Length"] = str(end + 1 - start)
+    response["Accept-Ranges"] = "bytes"
+    response["Content-Disposition"] = content_disposition_header(
+        True, filename
     )
+    if status == 206:
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    return response
+
+
+def _parse_byte_range(
+    range_header: str, size: int
+) -> Optional[Tuple[int, int]]:
+    """Get the first and last byte asked for by a Range header.
+
+    Returns None when the whole file should be sent, as the header is
+    missing, asks for several ranges or can't be parsed, and raises
+    ValueError when the range is outside a file of size bytes."""
+    match = BYTE_RANGE.match(range_header.strip())
+    if match is None:
+        return None
 
-    collaboration_list = Collaborator.objects.all().filter(
-        user=request.user
+    first, last = match.groups()
+    if first == "":
+        if last == "":
+            return None
+        # a suffix range of the last bytes of the file
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError("range is outside file")
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    if last != "" and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError("range is outside file")
+
+    end = size - 1 if last == "" else min(int(last), size - 1)
+    return start, end
+
+
+def _read_chunks(
+    pdf_file: BinaryIO, start: int, length: int
+) -> Iterator[bytes]:
+    """Read length bytes from start of a file in chunks, then close it."""
+    try:
+        pdf_file.seek(start)
+        while length > 0:
+            chunk = pdf_file.read(min(PDF_STREAM_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        pdf_file.close()
+
+
+def _pdf_job_data(pdf_job):
+    """Get the status of a PDFJob to return to the client."""
+    data = {
+        "id": pdf_job.id,
+        "status": pdf_job.get_status_display(),
+        "error": pdf_job.error,
+        "status_url": reverse(
+            "timelines:pdf-job-status", args=[pdf_job.id]
+        ),
+        "download_url": None,
+    }
+    if pdf_job.status == PDFJob.STATUS_DONE:
+        data["download_url"] = reverse(
+            "timelines:pdf-job-download", args=[pdf_job.id]
+        )
+
+    return data
+
+
+def _get_pdf_job(pdf_job_id):
+    """Get a PDFJob and its timeline."""
+    return get_object_or_404(
+        PDFJob.objects.select_related("timeline"), id=pdf_job_id
     )
-    age_collab_list = []
-    date_time_collab_list = []
-    historical_collab_list = []
-    scientific_collab_list = []
-    for collaboration in collaboration_list:
-        if hasattr(collaboration.timeline, "agetimeline"):
-            age_collab_list.append(
-                collaboration.timeline.agetimeline
-            )
-        elif hasattr(collaboration.timeline, "datetimetimeline"):
-            date_time_collab_list.append(
-                collaboration.timeline.datetimetimeline
-            )
-        elif hasattr(collaboration.timeline, "hostoricaltimeline"):
-            historical_collab_list.append(
-                collaboration.timeline.hostoricaltimeline
-            )
-        elif hasattr(collaboration.timeline, "scientifictimeline"):
-            scientific_collab_list.append(
-                collaboration.timeline.scientifictimeline
-            )
 
-    return render(
-        request,
-        "timelines/user_timelines.html",
-        {
-            "age_timeline_list": age_timeline_list,
-            "age_timeline_collaboration_list": age_collab_list,
-            "date_time_timeline_list": date_time_timeline_list,
-            "date_time_timeline_collaboration_list": date_time_collab_list,
-            "historical_timeline_list": historical_timeline_list,
-            "historical_timeline_collaboration_list": historical_collab_list,
-            "scientific_timeline_list": scientific_timeline_list,
-            "scientific_timeline_collaboration_list": scientific_collab_list,
-        },
+
+@login_required(login_url="/accounts/login/")
+def pdf_job_status(request, pdf_job_id):
+    pdf_job = _get_pdf_job(pdf_job_id)
+    if pdf_job.timeline.get_role(request.user) < ROLE_VIEWER:
+        return HttpResponseForbidden()
+
+    return JsonResponse(_pdf_job_data(pdf_job))
+
+
+@login_required(login_url="/accounts/login/")
+def pdf_job_download(request, pdf_job_id):
+    pdf_job = _get_pdf_job(pdf_job_id)
+    if pdf_job.timeline.get_role(request.user) < ROLE_VIEWER:
+        return HttpResponseForbidden()
+
+    if pdf_job.status != PDFJob.STATUS_DONE:
+        return JsonResponse(_pdf_job_data(pdf_job), status=409)
+
+    try:
+        pdf_file = pdf_job.pdf_file.open("rb")
+    except (FileNotFoundError, ValueError):
+        raise Http404("PDF no longer exists.")
+
+    return pdf_file_response(
+        request, pdf_file, get_filename(pdf_job.timeline.title)
     )
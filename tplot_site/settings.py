@@ -186,6 +186,42 @@ STATIC_URL = "static/"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# Caches
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# largest timeline PDF cached, and most memory the timeline PDFs cached by
+# each process may take up, which limits the number of PDFs cached
+PDF_CACHE_MAX_SIZE = 4 * 1024 * 1024
+PDF_CACHE_MAX_TOTAL_SIZE = 64 * 1024 * 1024
+
+# timeline PDFs are cached separately so they can be given their own limit,
+# they are keyed on their content so each process can cache its own
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "pdf": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "timeline-pdfs",
+        "TIMEOUT": None,
+        "OPTIONS": {
+            "MAX_ENTRIES": PDF_CACHE_MAX_TOTAL_SIZE // PDF_CACHE_MAX_SIZE
+        },
+    },
+}
+
+# size and position the events on timeline PDFs in a pool of worker processes
+PDF_PARALLEL_LAYOUT = (
+    os.environ.get("PDF_PARALLEL_LAYOUT", "False").lower() in ["true", "t", "1"]
+)
+
+# position the events on timeline PDFs reusing where they were positioned
+# the last time each timeline was drawn, which stores their positions each
+# time a changed timeline is drawn, even when only viewing it
+PDF_INCREMENTAL_LAYOUT = (
+    os.environ.get("PDF_INCREMENTAL_LAYOUT", "False").lower()
+    in ["true", "t", "1"]
+)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 